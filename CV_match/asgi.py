@@ -14,3 +14,8 @@ from django.core.asgi import get_asgi_application
 os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'CV_match.settings')
 
 application = get_asgi_application()
+
+# Only serving processes load the models; management commands skip them
+from smartrecruitai.services import preload_models  # noqa: E402
+
+preload_models()
@@ -0,0 +1,23 @@
+"""
+Celery application for CV_match project.
+
+Workers are started with: celery -A CV_match worker -l info
+"""
+
+import os
+
+from celery import Celery
+from celery.signals import worker_process_init
+
+os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'CV_match.settings')
+
+app = Celery('CV_match')
+app.config_from_object('django.conf:settings', namespace='CELERY')
+app.autodiscover_tasks()
+
+
+@worker_process_init.connect
+def preload_worker_models(**kwargs):
+    """Load the models in each worker process before it takes its first task"""
+    from smartrecruitai.services import preload_models
+    preload_models()
@@ -146,12 +146,57 @@ S3_SECRET_KEY = 'minioadmin'
 RAG_MODEL_NAME = 'mistralai/Mistral-7B-Instruct-v0.2'
 RAG_TEMPERATURE = 0.7
 RAG_MAX_TOKENS = 1000
+RAG_CACHE_MAXSIZE = 1024
+RAG_CACHE_TTL = 3600  # seconds
+
+# Celery Configuration (summary, email and answer generation run as background tasks)
+CELERY_BROKER_URL = 'redis://localhost:6379/0'
+CELERY_RESULT_BACKEND = 'redis://localhost:6379/1'
+CELERY_ACCEPT_CONTENT = ['json']
+CELERY_TASK_SERIALIZER = 'json'
+CELERY_RESULT_SERIALIZER = 'json'
+# Run tasks inline while developing so no broker or worker is needed
+CELERY_TASK_ALWAYS_EAGER = DEBUG
 
 # Sentence-BERT Configuration
 SENTENCE_BERT_MODEL = 'sentence-transformers/all-mpnet-base-v2'
 EMBEDDING_DIMENSION = 768
+
+# Embedding cache: content-addressed (model name + CV text), kept on disk so
+# re-uploads and restarts skip the transformer for text it has already seen
+EMBEDDING_CACHE_DIR = BASE_DIR / '.embedcache'
+EMBEDDING_CACHE_TTL = 30 * 24 * 3600  # seconds
+CACHES = {
+    'default': {
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+    },
+    'embeddings': {
+        'BACKEND': 'django.core.cache.backends.filebased.FileBasedCache',
+        'LOCATION': EMBEDDING_CACHE_DIR,
+        'TIMEOUT': EMBEDDING_CACHE_TTL,
+        'OPTIONS': {'MAX_ENTRIES': 100000},
+    },
+    # Generated RAG content. Celery workers fill it from their own processes, so
+    # production needs a shared backend here (e.g. django_redis.cache.RedisCache)
+    'rag': {
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+        'TIMEOUT': RAG_CACHE_TTL,
+        'OPTIONS': {'MAX_ENTRIES': RAG_CACHE_MAXSIZE},
+    },
+}
 FINE_TUNED_MATCHER_PATH = 'models/custom_matcher'
 
+# Parts of chunked CV uploads, kept until the client completes the upload;
+# parts of uploads untouched for CV_UPLOAD_PARTS_MAX_AGE are swept away
+CV_UPLOAD_PARTS_DIR = BASE_DIR / '.uploadparts'
+CV_UPLOAD_PARTS_MAX_AGE = 24 * 3600  # seconds
+# Largest CV accepted by raw (after decompression) and chunked uploads
+CV_UPLOAD_MAX_SIZE = 100 * 1024 * 1024
+
+# ONNX export of the embedding model, used instead of PyTorch when USE_ONNX_EMB is set
+# (create it with: python manage.py export_onnx_embedder)
+ONNX_EMBEDDING_MODEL_DIR = 'models/onnx_embedder'
+
 # Matching Weights
 MATCHING_WEIGHTS = {
       'similarity': 0.35,
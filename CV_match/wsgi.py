@@ -14,3 +14,8 @@ from django.core.wsgi import get_wsgi_application
 os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'CV_match.settings')
 
 application = get_wsgi_application()
+
+# Only serving processes load the models; management commands skip them
+from smartrecruitai.services import preload_models  # noqa: E402
+
+preload_models()
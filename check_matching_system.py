@@ -116,7 +116,7 @@ def check_vector_matcher():
         print("ERROR: numpy/scipy are NOT installed - similarity calculation will be mock")
         print("   Install with: pip install numpy scipy")
     
-    vector_matcher = VectorMatcher()
+    vector_matcher = VectorMatcher.get()
     
     # Test embedding generation
     test_text = "Python developer with 5 years experience in machine learning"
@@ -199,7 +199,7 @@ def test_manual_matching():
     if not candidate.embedding:
         print("\nWARNING: Candidate has no embedding, generating one...")
         if candidate.cv_text:
-            vector_matcher = VectorMatcher()
+            vector_matcher = VectorMatcher.get()
             candidate.embedding = vector_matcher.generate_embedding(candidate.cv_text)
             candidate.save()
             print("OK: Generated candidate embedding")
@@ -209,14 +209,14 @@ def test_manual_matching():
     
     if not job_offer.embedding:
         print("\nWARNING: Job offer has no embedding, generating one...")
-        vector_matcher = VectorMatcher()
+        vector_matcher = VectorMatcher.get()
         job_text = f"{job_offer.description} {job_offer.requirements}"
         job_offer.embedding = vector_matcher.generate_embedding(job_text)
         job_offer.save()
         print("OK: Generated job offer embedding")
     
     # Calculate similarity
-    vector_matcher = VectorMatcher()
+    vector_matcher = VectorMatcher.get()
     similarity = vector_matcher.calculate_similarity(
         candidate.embedding,
         job_offer.embedding
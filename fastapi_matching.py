@@ -19,7 +19,8 @@ import django
 os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'CV_match.settings')
 django.setup()
 
-from smartrecruitai.services import NLPExtractor, VectorMatcher, RAGEngine, CVParser
+from smartrecruitai.services import NLPExtractor, VectorMatcher, CVParser
+from smartrecruitai.services.rag_engine import get_rag_engine
 from smartrecruitai.models import Candidate, JobOffer, Match
 
 app = FastAPI(
@@ -90,7 +91,7 @@ async def match_candidate_to_job(request: MatchingRequest) -> MatchResult:
     Returns:
         MatchResult with score and explanations
     """
-    vector_matcher = VectorMatcher()
+    vector_matcher = VectorMatcher.get()
     
     # Get candidate
     if request.candidate_id:
@@ -125,7 +126,7 @@ async def match_candidate_to_job(request: MatchingRequest) -> MatchResult:
     detailed_scores = vector_matcher.calculate_detailed_scores(candidate_data, job_data)
     
     # Generate explanation
-    rag_engine = RAGEngine()
+    rag_engine = get_rag_engine()
     explanation = rag_engine.explain_match(candidate_data, job_data, detailed_scores)
     
     # Get strengths and gaps
@@ -162,11 +163,11 @@ async def extract_cv(file: UploadFile = File(...)) -> Dict[str, Any]:
         parsed_data = cv_parser.parse_file(temp_path)
         
         # Extract structured data
-        nlp_extractor = NLPExtractor()
+        nlp_extractor = NLPExtractor.get()
         extracted_data = nlp_extractor.extract_cv_data(parsed_data['text'])
         
         # Generate embedding
-        vector_matcher = VectorMatcher()
+        vector_matcher = VectorMatcher.get()
         embedding = vector_matcher.generate_embedding(parsed_data['text'])
         
         # Clean up
@@ -193,7 +194,7 @@ async def extract_job(job_input: JobOfferInput) -> Dict[str, Any]:
     Returns:
         Extracted job requirements
     """
-    nlp_extractor = NLPExtractor()
+    nlp_extractor = NLPExtractor.get()
     extracted_data = nlp_extractor.extract_job_requirements(
         f"{job_input.description} {job_input.requirements}"
     )
@@ -214,7 +215,7 @@ async def generate_embedding(text: str) -> Dict[str, Any]:
     Returns:
         Embedding vector
     """
-    vector_matcher = VectorMatcher()
+    vector_matcher = VectorMatcher.get()
     embedding = vector_matcher.generate_embedding(text)
     
     return {
@@ -246,7 +247,7 @@ async def answer_question(question: str, candidate_id: int) -> Dict[str, Any]:
             'availability': candidate.availability,
         }
         
-        rag_engine = RAGEngine()
+        rag_engine = get_rag_engine()
         answer = rag_engine.answer_question(question, candidate_data)
         
         return {
@@ -23,7 +23,7 @@ def regenerate_candidate_embeddings():
     candidates = Candidate.objects.all()
     print(f"\nTotal candidates: {candidates.count()}")
     
-    vector_matcher = VectorMatcher()
+    vector_matcher = VectorMatcher.get()
     
     updated = 0
     skipped = 0
@@ -69,7 +69,7 @@ def regenerate_job_embeddings():
     job_offers = JobOffer.objects.all()
     print(f"\nTotal job offers: {job_offers.count()}")
     
-    vector_matcher = VectorMatcher()
+    vector_matcher = VectorMatcher.get()
     
     updated = 0
     skipped = 0
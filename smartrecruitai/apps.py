@@ -5,3 +5,10 @@ class SmartrecruitaiConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'smartrecruitai'
     verbose_name = 'SmartRecruitAI'
+
+    def ready(self):
+        # Register signal handlers
+        from . import signals  # noqa: F401
+
+        # Models and kernels are not loaded here, so management commands stay fast; the
+        # WSGI/ASGI modules and Celery workers call services.preload_models()
@@ -0,0 +1,119 @@
+"""
+Cache for RAG engine outputs, stored in one of Django's configured caches
+"""
+
+import hashlib
+import json
+import uuid
+from typing import Any, Optional
+
+from django.conf import settings
+from django.core.cache import caches
+
+
+class SmartRAGCache:
+    """
+    Cache for generated RAG content, invalidated per candidate or job offer
+    
+    Entries live in a Django cache, so with a shared backend (e.g. Redis)
+    content cached by a Celery worker is served by the web processes too.
+    Each entry records the generation of the candidate and job offer it was
+    built from; invalidating an object starts a new generation, which retires
+    its entries without having to find them.
+    """
+    
+    def __init__(self, alias: str = 'default', ttl: float = 3600):
+        """
+        Initialize the cache
+        
+        Args:
+            alias: Name of the Django cache (settings.CACHES) holding the entries
+            ttl: Number of seconds an entry stays valid
+        """
+        self.alias = alias
+        self.ttl = ttl
+    
+    @property
+    def _cache(self):
+        return caches[self.alias]
+    
+    @staticmethod
+    def make_key(doc_type: str, candidate_id: Optional[int], job_offer_id: Optional[int] = None, *parts: Any) -> str:
+        """
+        Build a cache key from the document type, the objects involved and any extra inputs
+        
+        Args:
+            doc_type: Kind of generated content (e.g. 'candidate_summary')
+            candidate_id: Candidate the content is about
+            job_offer_id: Job offer the content is about, if any
+            parts: Additional JSON-serializable inputs that change the output
+        
+        Returns:
+            Hex digest identifying the request
+        """
+        payload = json.dumps([doc_type, candidate_id, job_offer_id, *parts], sort_keys=True, default=str)
+        return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+    
+    @staticmethod
+    def _generation_keys(candidate_id: Optional[int], job_offer_id: Optional[int]):
+        """Cache keys holding the current generation of the given candidate and job offer"""
+        keys = []
+        if candidate_id is not None:
+            keys.append(f'rag:generation:candidate:{candidate_id}')
+        if job_offer_id is not None:
+            keys.append(f'rag:generation:job_offer:{job_offer_id}')
+        return keys
+    
+    def _generations(self, candidate_id: Optional[int], job_offer_id: Optional[int], create: bool = False) -> tuple:
+        """
+        Current generations of a candidate and job offer
+        
+        Args:
+            candidate_id: Candidate, if any
+            job_offer_id: Job offer, if any
+            create: Start a generation for objects that have none yet
+        
+        Returns:
+            Tuple of generation tokens; None for objects without one
+        """
+        keys = self._generation_keys(candidate_id, job_offer_id)
+        found = self._cache.get_many(keys)
+        if create:
+            for key in keys:
+                if key not in found:
+                    # add() keeps a generation another process set in the meantime
+                    self._cache.add(key, uuid.uuid4().hex, None)
+                    found[key] = self._cache.get(key)
+        return tuple(found.get(key) for key in keys)
+    
+    def get(self, key: str) -> Optional[Any]:
+        """Return the cached value for key, or None if missing, expired or invalidated"""
+        entry = self._cache.get(f'rag:{key}')
+        if entry is None:
+            return None
+        value, candidate_id, job_offer_id, generations = entry
+        # An entry is stale once either object moved on to a new generation (or lost it)
+        if self._generations(candidate_id, job_offer_id) != generations:
+            return None
+        return value
+    
+    def put(self, key: str, value: Any, candidate_id: Optional[int] = None, job_offer_id: Optional[int] = None) -> None:
+        """Store value under key, tagged with the objects it was generated from"""
+        generations = self._generations(candidate_id, job_offer_id, create=True)
+        self._cache.set(f'rag:{key}', (value, candidate_id, job_offer_id, generations), self.ttl)
+    
+    def invalidate(self, candidate_id: Optional[int] = None, job_offer_id: Optional[int] = None) -> None:
+        """Retire every entry generated from the given candidate and/or job offer"""
+        keys = self._generation_keys(candidate_id, job_offer_id)
+        if keys:
+            self._cache.set_many({key: uuid.uuid4().hex for key in keys}, None)
+    
+    def clear(self) -> None:
+        """Remove all entries (and everything else in the backing cache)"""
+        self._cache.clear()
+
+
+rag_cache = SmartRAGCache(
+    alias='rag',
+    ttl=getattr(settings, 'RAG_CACHE_TTL', 3600),
+)
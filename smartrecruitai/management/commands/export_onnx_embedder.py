@@ -0,0 +1,74 @@
+"""Management command to export the embedding model to ONNX for CPU inference."""
+
+import argparse
+from pathlib import Path
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+
+class Command(BaseCommand):
+    help = "Export the sentence-transformer embedding model to ONNX and quantize it to int8"
+
+    def add_arguments(self, parser: argparse.ArgumentParser) -> None:
+        parser.add_argument(
+            "--model",
+            type=str,
+            default=getattr(settings, "SENTENCE_BERT_MODEL", "sentence-transformers/all-mpnet-base-v2"),
+            help="Sentence-transformer model name or path to export",
+        )
+        parser.add_argument(
+            "--output",
+            type=str,
+            default=getattr(settings, "ONNX_EMBEDDING_MODEL_DIR", "models/onnx_embedder"),
+            help="Directory where the ONNX model and tokenizer will be saved",
+        )
+        parser.add_argument(
+            "--opset",
+            type=int,
+            default=14,
+            help="ONNX opset version",
+        )
+
+    def handle(self, *args, **options):
+        try:
+            import torch
+            from onnxruntime.quantization import QuantType, quantize_dynamic
+            from sentence_transformers import SentenceTransformer
+        except ImportError as exc:
+            raise CommandError(f"Exporting requires torch, onnxruntime and sentence-transformers: {exc}")
+
+        output_dir = Path(options["output"])
+        output_dir.mkdir(parents=True, exist_ok=True)
+        model_path = output_dir / "model.onnx"
+        quantized_path = output_dir / "model_quantized.onnx"
+
+        self.stdout.write(self.style.NOTICE(f"Loading {options['model']} ..."))
+        model = SentenceTransformer(options["model"], device="cpu")
+        transformer = model[0].auto_model.eval()
+        tokenizer = model.tokenizer
+        # Truncate exactly like the PyTorch model does at inference time
+        tokenizer.model_max_length = model.max_seq_length
+        tokenizer.save_pretrained(output_dir)
+
+        sample = tokenizer(["A sample sentence to trace the model"], return_tensors="pt")
+        input_names = [name for name in ("input_ids", "attention_mask", "token_type_ids") if name in sample]
+        dynamic_axes = {name: {0: "batch", 1: "sequence"} for name in input_names}
+        dynamic_axes["last_hidden_state"] = {0: "batch", 1: "sequence"}
+
+        self.stdout.write(self.style.NOTICE("Exporting to ONNX ..."))
+        with torch.no_grad():
+            torch.onnx.export(
+                transformer,
+                tuple(sample[name] for name in input_names),
+                str(model_path),
+                input_names=input_names,
+                output_names=["last_hidden_state"],
+                dynamic_axes=dynamic_axes,
+                opset_version=options["opset"],
+            )
+
+        self.stdout.write(self.style.NOTICE("Quantizing weights to int8 ..."))
+        quantize_dynamic(str(model_path), str(quantized_path), weight_type=QuantType.QInt8)
+
+        self.stdout.write(self.style.SUCCESS(f"ONNX embedder saved to {output_dir}. Enable it with USE_ONNX_EMB=1"))
@@ -5,7 +5,8 @@ Usage: python manage.py match_all_jobs --job-id JOB_ID
 
 from django.core.management.base import BaseCommand
 from smartrecruitai.models import JobOffer, Candidate, Match
-from smartrecruitai.services import VectorMatcher, RAGEngine
+from smartrecruitai.services import VectorMatcher
+from smartrecruitai.services.rag_engine import get_rag_engine
 
 
 class Command(BaseCommand):
@@ -36,8 +37,8 @@ class Command(BaseCommand):
         self.stdout.write(f'Found {total_candidates} active candidates')
         
         # Initialize services
-        vector_matcher = VectorMatcher()
-        rag_engine = RAGEngine()
+        vector_matcher = VectorMatcher.get()
+        rag_engine = get_rag_engine()
         
         matches_created = 0
         matches_updated = 0
@@ -32,8 +32,8 @@ class Command(BaseCommand):
         
         # Initialize services
         cv_parser = CVParser()
-        nlp_extractor = NLPExtractor()
-        vector_matcher = VectorMatcher()
+        nlp_extractor = NLPExtractor.get()
+        vector_matcher = VectorMatcher.get()
         
         processed = 0
         failed = 0
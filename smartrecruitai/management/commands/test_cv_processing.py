@@ -87,7 +87,7 @@ class Command(BaseCommand):
             )
             
             # Extract data using NLP
-            nlp_extractor = NLPExtractor()
+            nlp_extractor = NLPExtractor.get()
             extracted_data = nlp_extractor.extract_cv_data(sample_cv_text)
             
             # Update candidate with extracted data
@@ -99,7 +99,7 @@ class Command(BaseCommand):
             candidate.save()
             
             # Generate embedding
-            vector_matcher = VectorMatcher()
+            vector_matcher = VectorMatcher.get()
             candidate.embedding = vector_matcher.generate_embedding(sample_cv_text)
             candidate.save()
             
@@ -6,7 +6,8 @@ Usage: python manage.py test_job_matching
 from django.core.management.base import BaseCommand
 from django.contrib.auth.models import User
 from smartrecruitai.models import Recruiter, JobOffer, Match
-from smartrecruitai.services import VectorMatcher, RAGEngine
+from smartrecruitai.services import VectorMatcher
+from smartrecruitai.services.rag_engine import get_rag_engine
 
 
 class Command(BaseCommand):
@@ -66,7 +67,7 @@ class Command(BaseCommand):
             
             # Process job requirements
             from smartrecruitai.services import NLPExtractor
-            nlp_extractor = NLPExtractor()
+            nlp_extractor = NLPExtractor.get()
             job_text = f"{job_offer.description} {job_offer.requirements}"
             extracted_requirements = nlp_extractor.extract_job_requirements(job_text)
             
@@ -76,7 +77,7 @@ class Command(BaseCommand):
             job_offer.save()
             
             # Generate embedding
-            vector_matcher = VectorMatcher()
+            vector_matcher = VectorMatcher.get()
             job_offer.embedding = vector_matcher.generate_embedding(job_text)
             job_offer.save()
             
@@ -131,7 +132,7 @@ class Command(BaseCommand):
                         match.soft_skill_score = detailed_scores.get('soft_skills', 0) * 100
                         
                         # Generate explanation
-                        rag_engine = RAGEngine()
+                        rag_engine = get_rag_engine()
                         explanation = rag_engine.explain_match(candidate_data, job_data, detailed_scores)
                         match.match_explanation = explanation
                         
@@ -0,0 +1,37 @@
+# Generated by Django 5.2.7 on 2025-11-27 10:12
+
+import struct
+
+from django.db import migrations, models
+
+
+def pack_embeddings(apps, schema_editor):
+    """Copy existing JSON embeddings into the float32 blob columns"""
+    for model_name in ('Candidate', 'JobOffer'):
+        model = apps.get_model('smartrecruitai', model_name)
+        for obj in model.objects.only('id', 'embedding').iterator():
+            if not obj.embedding:
+                continue
+            blob = struct.pack(f'<{len(obj.embedding)}f', *obj.embedding)
+            model.objects.filter(pk=obj.pk).update(embedding_blob=blob)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('smartrecruitai', '0006_joboffer_required_soft_skills'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='candidate',
+            name='embedding_blob',
+            field=models.BinaryField(blank=True, editable=False, help_text='Embedding as raw float32 bytes', null=True),
+        ),
+        migrations.AddField(
+            model_name='joboffer',
+            name='embedding_blob',
+            field=models.BinaryField(blank=True, editable=False, help_text='Embedding as raw float32 bytes', null=True),
+        ),
+        migrations.RunPython(pack_embeddings, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,49 @@
+# Generated by Django 5.2.7 on 2025-11-28 09:41
+
+import struct
+
+from django.db import migrations, models
+
+
+def quantize_embeddings(apps, schema_editor):
+    """Fill the int8 embedding columns from the existing JSON embeddings"""
+    for model_name in ('Candidate', 'JobOffer'):
+        model = apps.get_model('smartrecruitai', model_name)
+        for obj in model.objects.only('id', 'embedding').iterator():
+            if not obj.embedding:
+                continue
+            peak = max(abs(value) for value in obj.embedding)
+            scale = 127.0 / peak if peak else 1.0
+            data = struct.pack(f'<{len(obj.embedding)}b', *(int(round(value * scale)) for value in obj.embedding))
+            model.objects.filter(pk=obj.pk).update(embedding_i8=data, embedding_scale=scale)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('smartrecruitai', '0007_candidate_embedding_blob_joboffer_embedding_blob'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='candidate',
+            name='embedding_i8',
+            field=models.BinaryField(blank=True, editable=False, help_text='Embedding quantized to int8 bytes', null=True),
+        ),
+        migrations.AddField(
+            model_name='candidate',
+            name='embedding_scale',
+            field=models.FloatField(blank=True, editable=False, help_text='Scale applied before int8 quantization', null=True),
+        ),
+        migrations.AddField(
+            model_name='joboffer',
+            name='embedding_i8',
+            field=models.BinaryField(blank=True, editable=False, help_text='Embedding quantized to int8 bytes', null=True),
+        ),
+        migrations.AddField(
+            model_name='joboffer',
+            name='embedding_scale',
+            field=models.FloatField(blank=True, editable=False, help_text='Scale applied before int8 quantization', null=True),
+        ),
+        migrations.RunPython(quantize_embeddings, migrations.RunPython.noop),
+    ]
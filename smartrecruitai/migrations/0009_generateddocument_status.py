@@ -0,0 +1,18 @@
+# Generated by Django 5.2.7 on 2025-11-28 14:20
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('smartrecruitai', '0008_embedding_i8_embedding_scale'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='generateddocument',
+            name='status',
+            field=models.CharField(choices=[('pending', 'Pending'), ('ready', 'Ready'), ('failed', 'Failed')], default='ready', max_length=20),
+        ),
+    ]
@@ -0,0 +1,40 @@
+# Generated by Django 5.2.7 on 2025-11-28 16:05
+
+import math
+import struct
+
+from django.db import migrations
+
+
+def normalize_embeddings(apps, schema_editor):
+    """Rescale stored embeddings to unit length, matching newly encoded ones"""
+    for model_name in ('Candidate', 'JobOffer'):
+        model = apps.get_model('smartrecruitai', model_name)
+        for obj in model.objects.only('id', 'embedding').iterator():
+            if not obj.embedding:
+                continue
+            norm = math.sqrt(sum(value * value for value in obj.embedding))
+            if not norm or abs(norm - 1.0) < 1e-4:
+                continue
+            values = [float(value) / norm for value in obj.embedding]
+            blob = struct.pack(f'<{len(values)}f', *values)
+            peak = max(abs(value) for value in values)
+            scale = 127.0 / peak if peak else 1.0
+            data = struct.pack(f'<{len(values)}b', *(int(round(value * scale)) for value in values))
+            model.objects.filter(pk=obj.pk).update(
+                embedding=values,
+                embedding_blob=blob,
+                embedding_i8=data,
+                embedding_scale=scale,
+            )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('smartrecruitai', '0009_generateddocument_status'),
+    ]
+
+    operations = [
+        migrations.RunPython(normalize_embeddings, migrations.RunPython.noop),
+    ]
@@ -7,6 +7,61 @@ from django.db import models
 from django.contrib.auth.models import User
 from django.utils import timezone
 import json
+import struct
+
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+    np = None
+
+
+class EmbeddingMixin:
+    """Read and write embeddings persisted as raw float32 and int8 bytes"""
+    
+    # Fields written by set_embedding, for save(update_fields=...)
+    embedding_fields = ('embedding', 'embedding_blob', 'embedding_i8', 'embedding_scale')
+    
+    @staticmethod
+    def quantize_embedding(values):
+        """Quantize an embedding to int8 bytes and the scale that maps it onto [-127, 127]"""
+        peak = max((abs(value) for value in values), default=0.0)
+        scale = 127.0 / peak if peak else 1.0
+        if NUMPY_AVAILABLE:
+            data = np.rint(np.asarray(values, dtype=np.float64) * scale).astype(np.int8).tobytes()
+        else:
+            data = struct.pack(f'<{len(values)}b', *(int(round(value * scale)) for value in values))
+        return data, scale
+    
+    def set_embedding(self, vector):
+        """Store an embedding as a JSON list, a float32 blob and an int8 blob"""
+        values = [float(value) for value in vector]
+        if NUMPY_AVAILABLE:
+            self.embedding_blob = np.asarray(values, dtype='<f4').tobytes()
+        else:
+            self.embedding_blob = struct.pack(f'<{len(values)}f', *values)
+        self.embedding_i8, self.embedding_scale = self.quantize_embedding(values)
+        self.embedding = values
+    
+    def get_embedding(self):
+        """Return the embedding, decoded from the float32 blob when available"""
+        blob = self.embedding_blob
+        if blob:
+            if NUMPY_AVAILABLE:
+                # Zero-copy view over the stored bytes
+                return np.frombuffer(blob, dtype='<f4')
+            return list(struct.unpack(f'<{len(blob) // 4}f', blob))
+        if NUMPY_AVAILABLE:
+            return np.asarray(self.embedding or [], dtype=np.float32)
+        return list(self.embedding or [])
+    
+    def get_embedding_i8(self):
+        """Return the int8-quantized embedding (empty if it was never stored)"""
+        data = self.embedding_i8 or b''
+        if NUMPY_AVAILABLE:
+            return np.frombuffer(data, dtype=np.int8)
+        return list(struct.unpack(f'<{len(data)}b', data))
 
 
 class TimestampedModel(models.Model):
@@ -28,7 +83,7 @@ class Recruiter(TimestampedModel):
         return f"{self.user.get_full_name()} - {self.company_name}"
 
 
-class Candidate(TimestampedModel):
+class Candidate(EmbeddingMixin, TimestampedModel):
     """Candidate information extracted from CV"""
     full_name = models.CharField(max_length=200, blank=True, help_text="Will be extracted from CV")
     email = models.EmailField(blank=True, help_text="Will be extracted from CV")
@@ -69,6 +124,9 @@ class Candidate(TimestampedModel):
     # AI Extracted Data
     cv_text = models.TextField(blank=True, help_text="Full text extracted from CV")
     embedding = models.JSONField(default=list, help_text="768-dimensional embedding vector")
+    embedding_blob = models.BinaryField(null=True, blank=True, editable=False, help_text="Embedding as raw float32 bytes")
+    embedding_i8 = models.BinaryField(null=True, blank=True, editable=False, help_text="Embedding quantized to int8 bytes")
+    embedding_scale = models.FloatField(null=True, blank=True, editable=False, help_text="Scale applied before int8 quantization")
     cv_metadata = models.JSONField(default=dict, help_text="Additional CV metadata")
     
     def __str__(self):
@@ -101,7 +159,7 @@ class CV(TimestampedModel):
         return f"CV - {self.candidate.full_name} - {self.file_name}"
 
 
-class JobOffer(TimestampedModel):
+class JobOffer(EmbeddingMixin, TimestampedModel):
     """Job posting/offer information"""
     recruiter = models.ForeignKey(Recruiter, on_delete=models.CASCADE, related_name='job_offers')
     
@@ -133,6 +191,9 @@ class JobOffer(TimestampedModel):
     
     # AI Extracted Data
     embedding = models.JSONField(default=list, help_text="768-dimensional embedding vector")
+    embedding_blob = models.BinaryField(null=True, blank=True, editable=False, help_text="Embedding as raw float32 bytes")
+    embedding_i8 = models.BinaryField(null=True, blank=True, editable=False, help_text="Embedding quantized to int8 bytes")
+    embedding_scale = models.FloatField(null=True, blank=True, editable=False, help_text="Scale applied before int8 quantization")
     extracted_requirements = models.JSONField(default=dict)
     
     # Status
@@ -238,6 +299,13 @@ class GeneratedDocument(TimestampedModel):
     content = models.TextField()
     metadata = models.JSONField(default=dict)
     
+    # Generation status, for documents produced by background tasks
+    status = models.CharField(max_length=20, default='ready', choices=[
+        ('pending', 'Pending'),
+        ('ready', 'Ready'),
+        ('failed', 'Failed'),
+    ])
+    
     generated_by = models.ForeignKey(User, on_delete=models.SET_NULL, null=True)
     
     def __str__(self):
@@ -27,7 +27,7 @@ class RecruiterSerializer(serializers.ModelSerializer):
 class CandidateSerializer(serializers.ModelSerializer):
     class Meta:
         model = Candidate
-        fields = '__all__'
+        exclude = ['embedding_blob', 'embedding_i8', 'embedding_scale']
         read_only_fields = ['created_at', 'updated_at']
 
 
@@ -36,7 +36,7 @@ class CandidateDetailSerializer(serializers.ModelSerializer):
     
     class Meta:
         model = Candidate
-        fields = '__all__'
+        exclude = ['embedding_blob', 'embedding_i8', 'embedding_scale']
         read_only_fields = ['created_at', 'updated_at']
 
 
@@ -132,7 +132,7 @@ class GeneratedDocumentSerializer(serializers.ModelSerializer):
         model = GeneratedDocument
         fields = [
             'id', 'document_type', 'candidate', 'job_offer', 'match',
-            'content', 'metadata', 'generated_by', 'created_at', 'updated_at'
+            'content', 'metadata', 'status', 'generated_by', 'created_at', 'updated_at'
         ]
 
 
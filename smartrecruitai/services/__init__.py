@@ -2,6 +2,15 @@ from .nlp_extractor import NLPExtractor
 from .vector_matcher import VectorMatcher
 from .rag_engine import RAGEngine
 from .cv_parser import CVParser
+from .scoring_kernels import warmup
 
-__all__ = ['NLPExtractor', 'VectorMatcher', 'RAGEngine', 'CVParser']
+
+def preload_models():
+    """Load the NLP and embedding models and compile the scoring kernels up front, so the first request or task does not pay for it"""
+    NLPExtractor.get()
+    VectorMatcher.get()
+    warmup()
+
+
+__all__ = ['NLPExtractor', 'VectorMatcher', 'RAGEngine', 'CVParser', 'preload_models']
 
@@ -24,7 +24,7 @@ except ImportError:
     DOCX_AVAILABLE = False
     Document = None
 
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Iterator
 import os
 
 
@@ -53,29 +53,56 @@ class CVParser:
         else:
             raise ValueError(f"Unsupported file format: {file_extension}")
     
+    @staticmethod
+    def parse_file_stream(file_path: str) -> Iterator[str]:
+        """
+        Parse a CV file and yield its text piece by piece
+        
+        PDFs are read one page at a time, so callers that process the text
+        as it arrives never hold the whole document in memory.
+        
+        Args:
+            file_path: Path to the CV file
+            
+        Yields:
+            The text of each PDF page, or the full text for other formats
+        """
+        if os.path.splitext(file_path)[1].lower() != '.pdf':
+            yield CVParser.parse_file(file_path)['text']
+        elif PYMUPDF_AVAILABLE:
+            yield from CVParser._iter_pymupdf_pages(file_path)
+        elif PYPDF2_AVAILABLE:
+            yield from CVParser._iter_pypdf2_pages(file_path)
+        else:
+            raise ValueError("Could not parse PDF with any available library")
+    
+    @staticmethod
+    def _iter_pymupdf_pages(file_path: str) -> Iterator[str]:
+        """Yield PDF page texts with PyMuPDF; the document stays open until iteration ends"""
+        with fitz.open(file_path) as doc:
+            for page in doc:
+                yield page.get_text("text")
+    
+    @staticmethod
+    def _iter_pypdf2_pages(file_path: str) -> Iterator[str]:
+        """Yield PDF page texts with PyPDF2"""
+        with open(file_path, 'rb') as file:
+            for page in PyPDF2.PdfReader(file).pages:
+                yield page.extract_text()
+    
     @staticmethod
     def _parse_pdf(file_path: str) -> Dict[str, Any]:
         """Parse PDF file"""
         # Try PyMuPDF first
         if PYMUPDF_AVAILABLE:
             try:
-                doc = fitz.open(file_path)
-                
-                text_content = []
-                page_count = len(doc)
-                
-                for page_num, page in enumerate(doc):
-                    text = page.get_text("text")
-                    text_content.append(text)
-                
+                text_content = list(CVParser._iter_pymupdf_pages(file_path))
                 full_text = "\n\n".join(text_content)
                 
-                doc.close()
-                
                 if len(full_text.strip()) > 10:  # If we got meaningful text
                     return {
                         'text': full_text,
-                        'page_count': page_count,
+                        'page_count': len(text_content),
                         'file_type': 'pdf',
                         'metadata': {},
                     }
@@ -85,24 +112,15 @@ class CVParser:
         # Fallback to PyPDF2
         if PYPDF2_AVAILABLE:
             try:
-                with open(file_path, 'rb') as file:
-                    pdf_reader = PyPDF2.PdfReader(file)
-                    
-                    text_content = []
-                    page_count = len(pdf_reader.pages)
-                    
-                    for page_num, page in enumerate(pdf_reader.pages):
-                        text = page.extract_text()
-                        text_content.append(text)
-                    
-                    full_text = "\n\n".join(text_content)
-                    
-                    return {
-                        'text': full_text,
-                        'page_count': page_count,
-                        'file_type': 'pdf',
-                        'metadata': {},
-                    }
+                text_content = list(CVParser._iter_pypdf2_pages(file_path))
+                full_text = "\n\n".join(text_content)
+                
+                return {
+                    'text': full_text,
+                    'page_count': len(text_content),
+                    'file_type': 'pdf',
+                    'metadata': {},
+                }
             except Exception as e:
                 print(f"PyPDF2 failed: {str(e)}")
         
@@ -3,7 +3,9 @@ NLP Extraction Service
 Level 1: Extraction & Understanding with BERT/JobBERT
 """
 
+import os
 import re
+import threading
 from typing import Dict, Any, List
 
 try:
@@ -13,18 +15,399 @@ except ImportError:
     SPACY_AVAILABLE = False
     spacy = None
 
+try:
+    import hyperscan
+    HYPERSCAN_AVAILABLE = True
+except ImportError:
+    HYPERSCAN_AVAILABLE = False
+    hyperscan = None
+
+try:
+    import re2
+    RE2_AVAILABLE = True
+except ImportError:
+    RE2_AVAILABLE = False
+    re2 = None
+
 from typing import Dict, List, Any
 import json
 
 
+# Documents per spaCy batch in extract_cv_data_batch
+SPACY_BATCH_SIZE = int(os.getenv("CV_SPACY_BATCH_SIZE", 32))
+
+
+# spaCy components skipped in fast mode. Extraction is rule-based and only
+# reads doc.ents, so without entities the tokenizer alone is enough
+FAST_MODE_EXCLUDED_PIPES = [
+    "tok2vec", "tagger", "morphologizer", "parser", "senter",
+    "attribute_ruler", "lemmatizer", "ner", "textcat",
+]
+
+# Known soft skills, matched as lowercase substrings of the text
+SOFT_SKILLS = [
+    # Leadership & Management
+    'leadership', 'management', 'team leadership', 'project management', 'people management',
+    'delegation', 'mentoring', 'coaching', 'supervision', 'strategic planning',
+
+    # Communication
+    'communication', 'public speaking', 'presentation skills', 'negotiation', 'persuasion',
+    'active listening', 'written communication', 'verbal communication', 'interpersonal skills',
+
+    # Teamwork & Collaboration
+    'teamwork', 'collaboration', 'team player', 'cross-functional collaboration', 'partnership',
+    'relationship building', 'networking', 'conflict resolution', 'consensus building',
+
+    # Problem-Solving & Critical Thinking
+    'problem-solving', 'critical thinking', 'analytical thinking', 'logical reasoning',
+    'troubleshooting', 'decision making', 'risk assessment', 'root cause analysis',
+
+    # Creativity & Innovation
+    'creativity', 'innovation', 'creative thinking', 'out of the box thinking', 'ideation',
+    'design thinking', 'adaptability', 'flexibility', 'resourcefulness',
+
+    # Time Management & Organization
+    'time management', 'organization', 'planning', 'prioritization', 'multitasking',
+    'deadline management', 'project coordination', 'workflow optimization', 'scheduling',
+
+    # Personal Attributes
+    'motivation', 'self-motivated', 'initiative', 'proactive', 'entrepreneurial mindset',
+    'resilience', 'stress management', 'emotional intelligence', 'self-awareness',
+
+    # Work Ethic & Professionalism
+    'attention to detail', 'detail-oriented', 'quality focused', 'results oriented',
+    'accountability', 'responsibility', 'professionalism', 'work ethic', 'reliability',
+
+    # Customer & Client Focus
+    'customer service', 'client relationship', 'customer focused', 'stakeholder management',
+    'customer satisfaction', 'user experience', 'empathy', 'patience', 'understanding needs',
+
+    # Learning & Development
+    'continuous learning', 'fast learner', 'quick study', 'knowledge sharing', 'training',
+    'development', 'coaching', 'mentorship', 'skill development', 'growth mindset',
+
+    # Cultural & Social Skills
+    'cultural awareness', 'diversity and inclusion', 'social skills', 'etiquette',
+    'diplomacy', 'tact', 'discretion', 'confidentiality', 'professional conduct'
+]
+
+
+# Common soft skill variations and synonyms -> the SOFT_SKILLS entry they stand for
+SOFT_SKILL_VARIATIONS = {
+    'problem solving': 'problem-solving',
+    'critical thinking': 'critical thinking',
+    'time management': 'time management',
+    'attention to detail': 'attention to detail',
+    'detail oriented': 'attention to detail',
+    'customer focused': 'customer service',
+    'self motivated': 'self-motivated',
+    'quick learner': 'fast learner',
+    'team player': 'teamwork',
+    'hard working': 'work ethic',
+    'professional attitude': 'professionalism'
+}
+
+# Known technical keywords, matched as lowercase substrings of the text
+TECH_KEYWORDS = [
+    # Languages / runtimes
+    'python', 'java', 'javascript', 'typescript', 'go', 'golang', 'rust', 'c#', 'c++', 'dotnet', '.net',
+    # Frontend
+    'react', 'vue', 'angular', 'next.js', 'nuxt', 'svelte', 'redux',
+    # Backend / frameworks
+    'node', 'express', 'nestjs', 'django', 'flask', 'fastapi', 'spring', 'spring boot', 'laravel',
+    # ML / Data
+    'tensorflow', 'pytorch', 'keras', 'scikit-learn', 'sklearn', 'pandas', 'numpy', 'xgboost',
+    # Databases
+    'postgresql', 'postgres', 'mysql', 'mssql', 'sqlite', 'mongodb', 'redis', 'elasticsearch', 'neo4j',
+    # DevOps / Cloud
+    'docker', 'docker-compose', 'kubernetes', 'helm', 'aws', 'azure', 'gcp', 'terraform', 'ansible',
+    # Messaging / streaming
+    'kafka', 'rabbitmq', 'sqs', 'sns',
+    # APIs / protocols
+    'rest', 'graphql', 'grpc', 'websocket',
+    # Testing / quality
+    'pytest', 'unittest', 'junit', 'tdd', 'bdd',
+    # Observability
+    'prometheus', 'grafana', 'elk', 'logstash', 'kibana',
+    # CI/CD & tooling
+    'git', 'github actions', 'gitlab ci', 'jenkins', 'ci/cd',
+    # Methods
+    'agile', 'scrum',
+    # AI topics
+    'machine learning', 'deep learning', 'nlp', 'cv', 'computer vision', 'data science',
+    # Big data
+    'big data', 'spark', 'hadoop',
+]
+
+
+# Experience patterns, matched against lowercased text with "years"/"ans"
+# normalized to "year"/"annee": "3+ years", "at least 2 years", "2-4 years"
+_EXPERIENCE_KEYWORD_RE = re.compile(r'experienc|expérienc|experience')
+_EXPERIENCE_YEARS_RE = re.compile(r'(\d{1,2})\s*(?:\+|plus)?\s*(?:year|annee)')
+_EXPERIENCE_PATTERNS = [
+    _EXPERIENCE_YEARS_RE,
+    re.compile(r'(?:at\s+least|min(?:imum)?)\s*(\d{1,2})\s*(?:year|annee)'),
+    re.compile(r'(\d{1,2})\s*[-to]{1,3}\s*(\d{1,2})\s*(?:year|annee)'),
+]
+
+# Degree followed by its field, e.g. "Master Data Science"
+_DEGREE_RES = [re.compile(pattern, re.IGNORECASE) for pattern in [
+    r"(?P<degree>master|msc|ma|mba|ing[ée]nieur|engineer|engineering)\s+(?P<field>[\w\s&-]{2,60})",
+    r"(?P<degree>bachelor|licence|bsc|ba|undergraduate)\s+(?P<field>[\w\s&-]{2,60})",
+    r"(?P<degree>doctorate|phd|doctor)\s+(?P<field>[\w\s&-]{2,60})",
+    r"(?P<degree>associate|dut|bts)\s+(?P<field>[\w\s&-]{2,60})",
+]]
+
+# Language name patterns, matched against lowercased text
+LANGUAGE_PATTERNS = {
+    # English variations
+    'english': [
+        r'\benglish\b', r'\benglis[h]\b', r'\beng\b', r'\ben\b',
+        r'\benglish\s+(?:language|lang)\b', r'\bnative\s+english\b',
+        r'\bfluent\s+english\b', r'\benglish\s+(?:native|fluent|proficient|advanced|intermediate|basic)\b'
+    ],
+    # French variations
+    'french': [
+        r'\bfrench\b', r'\bfran[çc]ais\b', r'\bfrançais\b', r'\bfr\b', r'\bfr\b',
+        r'\bfrench\s+(?:language|lang)\b', r'\bnative\s+french\b',
+        r'\bfluent\s+french\b', r'\bfrench\s+(?:native|fluent|proficient|advanced|intermediate|basic)\b'
+    ],
+    # Spanish variations
+    'spanish': [
+        r'\bspanish\b', r'\bespañol\b', r'\bespanol\b', r'\bes\b', r'\bsp\b',
+        r'\bspanish\s+(?:language|lang)\b', r'\bnative\s+spanish\b',
+        r'\bfluent\s+spanish\b', r'\bspanish\s+(?:native|fluent|proficient|advanced|intermediate|basic)\b'
+    ],
+    # German variations
+    'german': [
+        r'\bgerman\b', r'\bdeutsch\b', r'\bde\b', r'\bge\b',
+        r'\bgerman\s+(?:language|lang)\b', r'\bnative\s+german\b',
+        r'\bfluent\s+german\b', r'\bgerman\s+(?:native|fluent|proficient|advanced|intermediate|basic)\b'
+    ],
+    # Italian variations
+    'italian': [
+        r'\bitalian\b', r'\bitaliano\b', r'\bit\b', r'\bitalia\b',
+        r'\bitalian\s+(?:language|lang)\b', r'\bnative\s+italian\b',
+        r'\bfluent\s+italian\b', r'\bitalian\s+(?:native|fluent|proficient|advanced|intermediate|basic)\b'
+    ],
+    # Portuguese variations
+    'portuguese': [
+        r'\bportuguese\b', r'\bportugu[êe]s\b', r'\bpt\b', r'\bpor\b',
+        r'\bportuguese\s+(?:language|lang)\b', r'\bnative\s+portuguese\b',
+        r'\bfluent\s+portuguese\b', r'\bportuguese\s+(?:native|fluent|proficient|advanced|intermediate|basic)\b'
+    ],
+    # Dutch variations
+    'dutch': [
+        r'\bdutch\b', r'\bnederlands\b', r'\bnl\b', r'\bned\b',
+        r'\bdutch\s+(?:language|lang)\b', r'\bnative\s+dutch\b',
+        r'\bfluent\s+dutch\b', r'\bdutch\s+(?:native|fluent|proficient|advanced|intermediate|basic)\b'
+    ],
+    # Arabic variations
+    'arabic': [
+        r'\barabic\b', r'\bالعربية\b', r'\barabe\b', r'\bar\b',
+        r'\barabic\s+(?:language|lang)\b', r'\bnative\s+arabic\b',
+        r'\bfluent\s+arabic\b', r'\barabic\s+(?:native|fluent|proficient|advanced|intermediate|basic)\b'
+    ],
+    # Chinese variations
+    'chinese': [
+        r'\bchinese\b', r'\bmandarin\b', r'\bcantonese\b', r'\bzh\b', r'\b中文\b',
+        r'\bchinese\s+(?:language|lang)\b', r'\bnative\s+chinese\b',
+        r'\bfluent\s+chinese\b', r'\bchinese\s+(?:native|fluent|proficient|advanced|intermediate|basic)\b'
+    ],
+    # Japanese variations
+    'japanese': [
+        r'\bjapanese\b', r'\bnihongo\b', r'\bja\b', r'\b日本語\b',
+        r'\bjapanese\s+(?:language|lang)\b', r'\bnative\s+japanese\b',
+        r'\bfluent\s+japanese\b', r'\bjapanese\s+(?:native|fluent|proficient|advanced|intermediate|basic)\b'
+    ],
+    # Russian variations
+    'russian': [
+        r'\brussian\b', r'\brusskiy\b', r'\bru\b', r'\bрусский\b',
+        r'\brussian\s+(?:language|lang)\b', r'\bnative\s+russian\b',
+        r'\bfluent\s+russian\b', r'\brussian\s+(?:native|fluent|proficient|advanced|intermediate|basic)\b'
+    ],
+    # Hindi variations
+    'hindi': [
+        r'\bhindi\b', r'\bhi\b', r'\bहिन्दी\b',
+        r'\bhindi\s+(?:language|lang)\b', r'\bnative\s+hindi\b',
+        r'\bfluent\s+hindi\b', r'\bhindi\s+(?:native|fluent|proficient|advanced|intermediate|basic)\b'
+    ]
+}
+
+# Proficiency level patterns, in increasing order of precedence
+PROFICIENCY_PATTERNS = {
+    'native': [r'\bnative\b', r'\bnative\s+speaker\b', r'\bnative\s+level\b', r'\bmother\s+tongue\b'],
+    'fluent': [r'\bfluent\b', r'\bfluent\s+speaker\b', r'\bfluent\s+level\b', r'\bfully\s+proficient\b'],
+    'proficient': [r'\bproficient\b', r'\bprofessional\b', r'\bworking\s+proficiency\b'],
+    'advanced': [r'\badvanced\b', r'\badvanced\s+level\b', r'\bexpert\b'],
+    'intermediate': [r'\bintermediate\b', r'\bintermediate\s+level\b', r'\bconversational\b'],
+    'basic': [r'\bbasic\b', r'\bbasic\s+level\b', r'\bbeginner\b', r'\belementary\b']
+}
+
+# Compiled once: one alternation per language / proficiency level finds any of
+# its patterns in a single scan
+_LANGUAGE_RES = {language: re.compile('|'.join(patterns)) for language, patterns in LANGUAGE_PATTERNS.items()}
+_LANGUAGE_CONTEXT_RES = {language: re.compile(rf'[^.]*{language}[^.]*', re.IGNORECASE) for language in LANGUAGE_PATTERNS}
+_PROFICIENCY_RES = {level: re.compile('|'.join(patterns)) for level, patterns in PROFICIENCY_PATTERNS.items()}
+
+# Professional link patterns, compiled once
+# GitHub patterns
+_GITHUB_RES = [re.compile(pattern) for pattern in [
+    r'https?://(?:www\.)?github\.com/[\w\-\.]+/?(?:[\w\-\/]*)?',
+    r'github\.com/[\w\-\.]+/?(?:[\w\-\/]*)?',
+    r'@[\w\-\.]+(?:\s+|\n)*(?:github|gh)',
+    r'github:\s*[\w\-\.]+',
+    r'github\s*[:\/]\s*[\w\-\.\.]+',
+    r'github\s+user(?:name)?[:\s]+[\w\-\.]+'
+]]
+
+# LinkedIn patterns
+_LINKEDIN_RES = [re.compile(pattern) for pattern in [
+    r'https?://(?:www\.)?linkedin\.com/in/[\w\-\.]+',
+    r'https?://(?:www\.)?linkedin\.com/profile/view\?id=\d+',
+    r'linkedin\.com/in/[\w\-\.]+',
+    r'linkedin:\s*[\w\-\.]+',
+    r'linkedin\s*[:\/]\s*[\w\-\.\.]+',
+    r'linkedin\s+profile[:\s]+[\w\-\.]+'
+]]
+
+# GitLab patterns
+_GITLAB_RES = [re.compile(pattern) for pattern in [
+    r'https?://(?:www\.)?gitlab\.com/[\w\-\.]+/?(?:[\w\-\/]*)?',
+    r'gitlab\.com/[\w\-\.]+/?(?:[\w\-\/]*)?',
+    r'@[\w\-\.]+(?:\s+|\n)*gitlab',
+    r'gitlab:\s*[\w\-\.]+',
+    r'gitlab\s*[:\/]\s*[\w\-\.\.]+',
+    r'gitlab\s+user(?:name)?[:\s]+[\w\-\.]+'
+]]
+
+# Portfolio patterns (broader catch for personal/professional sites)
+_PORTFOLIO_RES = [re.compile(pattern) for pattern in [
+    r'https?://[\w\-\.]+\.(?:com|io|dev|me|co|net|org|site|app|tech|blog|portfolio)/?(?:[\w\-\/]*)?',
+    r'portfolio:\s*https?://[\w\-\.]+\.[\w\.]+',
+    r'website:\s*https?://[\w\-\.]+\.[\w\.]+',
+    r'personal\s+site:\s*https?://[\w\-\.]+\.[\w\.]+',
+    r'blog:\s*https?://[\w\-\.]+\.[\w\.]+',
+    r'demo:\s*https?://[\w\-\.]+\.[\w\.]+',
+    r'project:\s*https?://[\w\-\.]+\.[\w\.]+'
+]]
+
+# Any URL on a common personal/professional top-level domain
+_GENERAL_URL_RE = re.compile(r'https?://[\w\-\.]+\.(?:com|io|dev|me|co|net|org|site|app|tech|blog|portfolio)/?(?:[\w\-\/]*)?')
+_AT_USERNAME_RE = re.compile(r'@([\w\-\.]+)')
+_GITHUB_USERNAME_RE = re.compile(r'github[:\s\/]*([\w\-\.]+)')
+_LINKEDIN_USERNAME_RE = re.compile(r'linkedin[:\s\/]*([\w\-\.]+)')
+_GITLAB_USERNAME_RE = re.compile(r'gitlab[:\s\/]*([\w\-\.]+)')
+_EMBEDDED_URL_RE = re.compile(r'https?://[\w\-\.]+\.[\w\.]+(?:/[\w\-\/]*)?')
+
+# Markers present in every match of a link family's patterns, so families
+# whose markers do not occur in a text can skip their regexes entirely.
+# "url" covers the portfolio patterns and the general URL pattern
+LINK_FAMILY_MARKERS = [
+    ('github', rb'github'),
+    ('github', rb'@[^@]*gh'),
+    ('gitlab', rb'gitlab'),
+    ('linkedin', rb'linkedin'),
+    ('url', rb'https?://'),
+]
+
+# Every keyword vocabulary as (bucket, term, expression) entries, so one scan
+# of the text finds the technical skills, soft skills and link families together
+VOCABULARY_ENTRIES = (
+    [('technical', term, re.escape(term).encode()) for term in TECH_KEYWORDS]
+    + [('soft', term, re.escape(term).encode()) for term in SOFT_SKILLS]
+    + [('soft_variation', term, re.escape(term).encode()) for term in SOFT_SKILL_VARIATIONS]
+    + [('link', family, marker) for family, marker in LINK_FAMILY_MARKERS]
+)
+
+if HYPERSCAN_AVAILABLE:
+    _vocabulary_db = hyperscan.Database()
+    _vocabulary_db.compile(
+        expressions=[expression for _, _, expression in VOCABULARY_ENTRIES],
+        ids=list(range(len(VOCABULARY_ENTRIES))),
+        elements=len(VOCABULARY_ENTRIES),
+        flags=[hyperscan.HS_FLAG_SINGLEMATCH] * len(VOCABULARY_ENTRIES),
+    )
+    # Scratch space is per thread; scans from concurrent requests cannot share one
+    _vocabulary_local = threading.local()
+else:
+    # Some markers are patterns rather than plain words, so the fallback matches them with re
+    _LINK_MARKER_RES = [(family, re.compile(marker.decode())) for family, marker in LINK_FAMILY_MARKERS]
+
+
+def _scan_vocabulary(text_lower: str) -> Dict[str, set]:
+    """
+    Find every vocabulary term that occurs in a text
+    
+    Args:
+        text_lower: Lowercased CV text
+        
+    Returns:
+        Dictionary mapping each bucket ('technical', 'soft', 'soft_variation')
+        to the set of its terms found as substrings, and 'link' to the set of
+        link families that can possibly match ('github', 'gitlab', 'linkedin', 'url')
+    """
+    hits = {'technical': set(), 'soft': set(), 'soft_variation': set(), 'link': set()}
+    
+    if not HYPERSCAN_AVAILABLE:
+        for bucket, term, _ in VOCABULARY_ENTRIES:
+            if bucket != 'link' and term in text_lower:
+                hits[bucket].add(term)
+        hits['link'] = {family for family, marker_re in _LINK_MARKER_RES if marker_re.search(text_lower)}
+        return hits
+    
+    scratch = getattr(_vocabulary_local, 'scratch', None)
+    if scratch is None:
+        scratch = _vocabulary_local.scratch = hyperscan.Scratch(_vocabulary_db)
+    
+    def on_match(entry_id, start, end, flags, context):
+        bucket, term, _ = VOCABULARY_ENTRIES[entry_id]
+        hits[bucket].add(term)
+    
+    # One pass over the text finds every vocabulary at once
+    _vocabulary_db.scan(text_lower.encode('utf-8'), match_event_handler=on_match, scratch=scratch)
+    return hits
+
+
+# URL shape accepted by _is_valid_url, and domains that are never professional links
+_VALID_URL_RE = re.compile(r'^https?://[\w\-\.]+\.[\w\.]+(?:/[\w\-\/]*)?$')
+EXCLUDED_LINK_DOMAINS = (
+    'mail.google.com', 'gmail.com', 'outlook.com', 'yahoo.com',
+    'facebook.com', 'twitter.com', 'instagram.com', 'youtube.com',
+    'stackoverflow.com', 'medium.com', 'reddit.com',
+    'google.com', 'microsoft.com', 'apple.com'
+)
+_EXCLUDED_DOMAIN_RE = re.compile('|'.join(re.escape(domain) for domain in EXCLUDED_LINK_DOMAINS))
+
+if RE2_AVAILABLE:
+    # RE2 validates in linear time, where re backtracks quadratically over the
+    # host part of long near-miss URLs. Its \w is ASCII-only, so it is used for
+    # ASCII URLs only; "\n?" keeps re's "$" matching before a trailing newline
+    _VALID_URL_RE2 = re2.compile(_VALID_URL_RE.pattern[:-1] + r'\n?$')
+    _EXCLUDED_DOMAIN_RE2 = re2.compile(_EXCLUDED_DOMAIN_RE.pattern)
+
+
 class NLPExtractor:
     """Extract and understand semantic information from CVs and job descriptions"""
     
-    def __init__(self):
+    _shared = {}
+    _shared_lock = threading.Lock()
+    
+    def __init__(self, fast_mode: bool = False):
+        """
+        Initialize the NLP extractor
+        
+        Args:
+            fast_mode: Load spaCy without its trained components. Extraction is
+                much faster, but named entities are not reported.
+        """
         # Load spaCy model for basic NLP
         if SPACY_AVAILABLE:
             try:
-                self.nlp = spacy.load("fr_core_news_sm")
+                if fast_mode:
+                    self.nlp = spacy.load("fr_core_news_sm", exclude=FAST_MODE_EXCLUDED_PIPES)
+                else:
+                    self.nlp = spacy.load("fr_core_news_sm")
             except OSError:
                 print("French spaCy model not found. Install with: python -m spacy download fr_core_news_sm")
                 self.nlp = None
@@ -54,6 +437,23 @@ class NLPExtractor:
             "NOSQL": "NoSQL",
         }
     
+    @classmethod
+    def get(cls, fast_mode: bool = False) -> 'NLPExtractor':
+        """
+        Return the process-wide extractor, loading the spaCy model on first call
+        
+        The app config preloads the full extractor at startup, so requests
+        normally find the model already in memory.
+        
+        Args:
+            fast_mode: Return the shared fast-mode extractor instead
+        """
+        if fast_mode not in cls._shared:
+            with cls._shared_lock:
+                if fast_mode not in cls._shared:
+                    cls._shared[fast_mode] = cls(fast_mode=fast_mode)
+        return cls._shared[fast_mode]
+    
     def extract_cv_data(self, cv_text: str) -> Dict[str, Any]:
         """
         Extract structured data from CV text using NLP
@@ -67,16 +467,40 @@ class NLPExtractor:
         if not self.nlp:
             return self._extract_simple(cv_text)
         
-        doc = self.nlp(cv_text)
+        return self._extract_from_doc(cv_text, self.nlp(cv_text))
+    
+    def extract_cv_data_batch(self, cv_texts: List[str]) -> List[Dict[str, Any]]:
+        """
+        Extract structured data from several CV texts in one pass
+        
+        The texts go through spaCy's nlp.pipe in batches of SPACY_BATCH_SIZE
+        (CV_SPACY_BATCH_SIZE environment variable) instead of one call each.
         
+        Args:
+            cv_texts: Raw texts extracted from CVs
+            
+        Returns:
+            Extracted information, one dictionary per text, in input order
+        """
+        if not self.nlp:
+            return [self._extract_simple(cv_text) for cv_text in cv_texts]
+        
+        docs = self.nlp.pipe(cv_texts, batch_size=SPACY_BATCH_SIZE)
+        return [self._extract_from_doc(cv_text, doc) for cv_text, doc in zip(cv_texts, docs)]
+    
+    def _extract_from_doc(self, cv_text: str, doc) -> Dict[str, Any]:
+        """Extract structured CV data from text and its processed spaCy doc"""
         # Extract named entities
         entities = [ent.text for ent in doc.ents]
         
+        # Find every keyword in one pass over the text
+        hits = _scan_vocabulary(cv_text.lower())
+        
         # Extract technical skills (using rules + patterns)
-        technical_skills = self._extract_technical_skills(cv_text, doc)
+        technical_skills = self._extract_technical_skills(cv_text, doc, hits)
         
         # Extract soft skills
-        soft_skills = self._extract_soft_skills(cv_text, doc)
+        soft_skills = self._extract_soft_skills(cv_text, doc, hits)
         
         # Extract experience
         experience_years = self._extract_experience_years(cv_text, doc)
@@ -91,7 +515,7 @@ class NLPExtractor:
         languages = self._extract_languages(cv_text, doc)
         
         # Extract professional links
-        professional_links = self._extract_professional_links(cv_text, doc)
+        professional_links = self._extract_professional_links(cv_text, doc, hits)
         
         return {
             'technical_skills': technical_skills,
@@ -117,138 +541,47 @@ class NLPExtractor:
         if not self.nlp:
             return self._extract_simple(job_description)
         
-        doc = self.nlp(job_description)
-        
-        required_skills = self._extract_technical_skills(job_description, doc)
-        required_experience = self._extract_experience_years(job_description, doc)
-        required_education = self._extract_education(job_description, doc)
+        # The rule-based extractors below work on the raw text, so the spaCy
+        # pipeline is not run for job descriptions
+        hits = _scan_vocabulary(job_description.lower())
+        required_skills = self._extract_technical_skills(job_description, hits=hits)
+        required_experience = self._extract_experience_years(job_description)
+        required_education = self._extract_education(job_description)
         
         return {
             'required_skills': required_skills,
             'required_experience_years': required_experience,
             'required_education': required_education,
-            'soft_skills': self._extract_soft_skills(job_description, doc),
-            'certifications': self._extract_certifications(job_description, doc),
+            'soft_skills': self._extract_soft_skills(job_description, hits=hits),
+            'certifications': self._extract_certifications(job_description),
         }
     
-    def _extract_technical_skills(self, text: str, doc=None) -> List[str]:
+    def _extract_technical_skills(self, text: str, doc=None, hits=None) -> List[str]:
         """Extract technical skills and technologies"""
-        # Common technical keywords
-        tech_keywords = [
-            # Languages / runtimes
-            'python', 'java', 'javascript', 'typescript', 'go', 'golang', 'rust', 'c#', 'c++', 'dotnet', '.net',
-            # Frontend
-            'react', 'vue', 'angular', 'next.js', 'nuxt', 'svelte', 'redux',
-            # Backend / frameworks
-            'node', 'express', 'nestjs', 'django', 'flask', 'fastapi', 'spring', 'spring boot', 'laravel',
-            # ML / Data
-            'tensorflow', 'pytorch', 'keras', 'scikit-learn', 'sklearn', 'pandas', 'numpy', 'xgboost',
-            # Databases
-            'postgresql', 'postgres', 'mysql', 'mssql', 'sqlite', 'mongodb', 'redis', 'elasticsearch', 'neo4j',
-            # DevOps / Cloud
-            'docker', 'docker-compose', 'kubernetes', 'helm', 'aws', 'azure', 'gcp', 'terraform', 'ansible',
-            # Messaging / streaming
-            'kafka', 'rabbitmq', 'sqs', 'sns',
-            # APIs / protocols
-            'rest', 'graphql', 'grpc', 'websocket',
-            # Testing / quality
-            'pytest', 'unittest', 'junit', 'tdd', 'bdd',
-            # Observability
-            'prometheus', 'grafana', 'elk', 'logstash', 'kibana',
-            # CI/CD & tooling
-            'git', 'github actions', 'gitlab ci', 'jenkins', 'ci/cd',
-            # Methods
-            'agile', 'scrum',
-            # AI topics
-            'machine learning', 'deep learning', 'nlp', 'cv', 'computer vision', 'data science',
-            # Big data
-            'big data', 'spark', 'hadoop',
-        ]
-        
-        text_lower = text.lower()
+        found_keywords = (hits or _scan_vocabulary(text.lower()))['technical']
         found_skills = []
         
-        for keyword in tech_keywords:
-            if keyword in text_lower:
+        for keyword in TECH_KEYWORDS:
+            if keyword in found_keywords:
                 normalized = self.normalize_skill(keyword)
                 found_skills.append(normalized)
         
         # Remove duplicates while preserving order
         return list(dict.fromkeys(found_skills))
     
-    def _extract_soft_skills(self, text: str, doc=None) -> List[str]:
+    def _extract_soft_skills(self, text: str, doc=None, hits=None) -> List[str]:
         """Extract soft skills"""
-        soft_skills = [
-            # Leadership & Management
-            'leadership', 'management', 'team leadership', 'project management', 'people management',
-            'delegation', 'mentoring', 'coaching', 'supervision', 'strategic planning',
-            
-            # Communication
-            'communication', 'public speaking', 'presentation skills', 'negotiation', 'persuasion',
-            'active listening', 'written communication', 'verbal communication', 'interpersonal skills',
-            
-            # Teamwork & Collaboration
-            'teamwork', 'collaboration', 'team player', 'cross-functional collaboration', 'partnership',
-            'relationship building', 'networking', 'conflict resolution', 'consensus building',
-            
-            # Problem-Solving & Critical Thinking
-            'problem-solving', 'critical thinking', 'analytical thinking', 'logical reasoning',
-            'troubleshooting', 'decision making', 'risk assessment', 'root cause analysis',
-            
-            # Creativity & Innovation
-            'creativity', 'innovation', 'creative thinking', 'out of the box thinking', 'ideation',
-            'design thinking', 'adaptability', 'flexibility', 'resourcefulness',
-            
-            # Time Management & Organization
-            'time management', 'organization', 'planning', 'prioritization', 'multitasking',
-            'deadline management', 'project coordination', 'workflow optimization', 'scheduling',
-            
-            # Personal Attributes
-            'motivation', 'self-motivated', 'initiative', 'proactive', 'entrepreneurial mindset',
-            'resilience', 'stress management', 'emotional intelligence', 'self-awareness',
-            
-            # Work Ethic & Professionalism
-            'attention to detail', 'detail-oriented', 'quality focused', 'results oriented',
-            'accountability', 'responsibility', 'professionalism', 'work ethic', 'reliability',
-            
-            # Customer & Client Focus
-            'customer service', 'client relationship', 'customer focused', 'stakeholder management',
-            'customer satisfaction', 'user experience', 'empathy', 'patience', 'understanding needs',
-            
-            # Learning & Development
-            'continuous learning', 'fast learner', 'quick study', 'knowledge sharing', 'training',
-            'development', 'coaching', 'mentorship', 'skill development', 'growth mindset',
-            
-            # Cultural & Social Skills
-            'cultural awareness', 'diversity and inclusion', 'social skills', 'etiquette',
-            'diplomacy', 'tact', 'discretion', 'confidentiality', 'professional conduct'
-        ]
-        
-        text_lower = text.lower()
+        hits = hits or _scan_vocabulary(text.lower())
         found_skills = []
         
         # Check for each soft skill
-        for skill in soft_skills:
-            if skill in text_lower:
+        for skill in SOFT_SKILLS:
+            if skill in hits['soft']:
                 found_skills.append(skill.title())
         
         # Also check for common variations and synonyms
-        skill_variations = {
-            'problem solving': 'problem-solving',
-            'critical thinking': 'critical thinking',
-            'time management': 'time management',
-            'attention to detail': 'attention to detail',
-            'detail oriented': 'attention to detail',
-            'customer focused': 'customer service',
-            'self motivated': 'self-motivated',
-            'quick learner': 'fast learner',
-            'team player': 'teamwork',
-            'hard working': 'work ethic',
-            'professional attitude': 'professionalism'
-        }
-        
-        for variation, standard in skill_variations.items():
-            if variation in text_lower and standard.title() not in found_skills:
+        for variation, standard in SOFT_SKILL_VARIATIONS.items():
+            if variation in hits['soft_variation'] and standard.title() not in found_skills:
                 found_skills.append(standard.title())
         
         # Remove duplicates while preserving order
@@ -256,19 +589,17 @@ class NLPExtractor:
     
     def _extract_experience_years(self, text: str, doc=None) -> float:
         """Extract years of experience"""
-        import re
-        
         t = text.lower()
         # Normalize separators
         t = t.replace('années', 'annee').replace('année', 'annee').replace('ans', 'annee').replace('years', 'year')
         
         # Prefer numbers near "experience" keywords (context window)
         context_matches = []
-        for m in re.finditer(r'experienc|expérienc|experience', t):
+        for m in _EXPERIENCE_KEYWORD_RE.finditer(t):
             start = max(0, m.start() - 40)
             end = min(len(t), m.end() + 40)
             window = t[start:end]
-            ctx_nums = re.findall(r'(\d{1,2})\s*(?:\+|plus)?\s*(?:year|annee)', window)
+            ctx_nums = _EXPERIENCE_YEARS_RE.findall(window)
             context_matches += ctx_nums
         if context_matches:
             try:
@@ -277,14 +608,9 @@ class NLPExtractor:
                 pass
         
         # Global patterns: "3+ years", "at least 2 years", "2-4 years", "minimum 5 years"
-        patterns = [
-            r'(\d{1,2})\s*(?:\+|plus)?\s*(?:year|annee)',
-            r'(?:at\s+least|min(?:imum)?)\s*(\d{1,2})\s*(?:year|annee)',
-            r'(\d{1,2})\s*[-to]{1,3}\s*(\d{1,2})\s*(?:year|annee)',
-        ]
         values: List[float] = []
-        for pattern in patterns:
-            for m in re.findall(pattern, t):
+        for pattern_re in _EXPERIENCE_PATTERNS:
+            for m in pattern_re.findall(t):
                 if isinstance(m, tuple):
                     try:
                         a, b = int(m[0]), int(m[1])
@@ -303,18 +629,11 @@ class NLPExtractor:
     
     def _extract_education(self, text: str, doc=None) -> List[str]:
         """Extract concise education entries like “Master in Data Science”"""
-        import re
         entries = []
-        degree_patterns = [
-            r"(?P<degree>master|msc|ma|mba|ing[ée]nieur|engineer|engineering)\s+(?P<field>[\w\s&-]{2,60})",
-            r"(?P<degree>bachelor|licence|bsc|ba|undergraduate)\s+(?P<field>[\w\s&-]{2,60})",
-            r"(?P<degree>doctorate|phd|doctor)\s+(?P<field>[\w\s&-]{2,60})",
-            r"(?P<degree>associate|dut|bts)\s+(?P<field>[\w\s&-]{2,60})",
-        ]
 
         # Search across text
-        for pattern in degree_patterns:
-            for match in re.finditer(pattern, text, flags=re.IGNORECASE):
+        for pattern_re in _DEGREE_RES:
+            for match in pattern_re.finditer(text):
                 degree = match.group('degree').strip().title()
                 field = match.group('field').strip(' ,.-')
                 entry = f"{degree} in {field.title()}"
@@ -354,138 +673,43 @@ class NLPExtractor:
     
     def _extract_languages(self, text: str, doc=None) -> List[str]:
         """Extract languages and proficiency levels with enhanced patterns"""
-        # Comprehensive language patterns
-        language_patterns = {
-            # English variations
-            'english': [
-                r'\benglish\b', r'\benglis[h]\b', r'\beng\b', r'\ben\b',
-                r'\benglish\s+(?:language|lang)\b', r'\bnative\s+english\b',
-                r'\bfluent\s+english\b', r'\benglish\s+(?:native|fluent|proficient|advanced|intermediate|basic)\b'
-            ],
-            # French variations
-            'french': [
-                r'\bfrench\b', r'\bfran[çc]ais\b', r'\bfrançais\b', r'\bfr\b', r'\bfr\b',
-                r'\bfrench\s+(?:language|lang)\b', r'\bnative\s+french\b',
-                r'\bfluent\s+french\b', r'\bfrench\s+(?:native|fluent|proficient|advanced|intermediate|basic)\b'
-            ],
-            # Spanish variations
-            'spanish': [
-                r'\bspanish\b', r'\bespañol\b', r'\bespanol\b', r'\bes\b', r'\bsp\b',
-                r'\bspanish\s+(?:language|lang)\b', r'\bnative\s+spanish\b',
-                r'\bfluent\s+spanish\b', r'\bspanish\s+(?:native|fluent|proficient|advanced|intermediate|basic)\b'
-            ],
-            # German variations
-            'german': [
-                r'\bgerman\b', r'\bdeutsch\b', r'\bde\b', r'\bge\b',
-                r'\bgerman\s+(?:language|lang)\b', r'\bnative\s+german\b',
-                r'\bfluent\s+german\b', r'\bgerman\s+(?:native|fluent|proficient|advanced|intermediate|basic)\b'
-            ],
-            # Italian variations
-            'italian': [
-                r'\bitalian\b', r'\bitaliano\b', r'\bit\b', r'\bitalia\b',
-                r'\bitalian\s+(?:language|lang)\b', r'\bnative\s+italian\b',
-                r'\bfluent\s+italian\b', r'\bitalian\s+(?:native|fluent|proficient|advanced|intermediate|basic)\b'
-            ],
-            # Portuguese variations
-            'portuguese': [
-                r'\bportuguese\b', r'\bportugu[êe]s\b', r'\bpt\b', r'\bpor\b',
-                r'\bportuguese\s+(?:language|lang)\b', r'\bnative\s+portuguese\b',
-                r'\bfluent\s+portuguese\b', r'\bportuguese\s+(?:native|fluent|proficient|advanced|intermediate|basic)\b'
-            ],
-            # Dutch variations
-            'dutch': [
-                r'\bdutch\b', r'\bnederlands\b', r'\bnl\b', r'\bned\b',
-                r'\bdutch\s+(?:language|lang)\b', r'\bnative\s+dutch\b',
-                r'\bfluent\s+dutch\b', r'\bdutch\s+(?:native|fluent|proficient|advanced|intermediate|basic)\b'
-            ],
-            # Arabic variations
-            'arabic': [
-                r'\barabic\b', r'\bالعربية\b', r'\barabe\b', r'\bar\b',
-                r'\barabic\s+(?:language|lang)\b', r'\bnative\s+arabic\b',
-                r'\bfluent\s+arabic\b', r'\barabic\s+(?:native|fluent|proficient|advanced|intermediate|basic)\b'
-            ],
-            # Chinese variations
-            'chinese': [
-                r'\bchinese\b', r'\bmandarin\b', r'\bcantonese\b', r'\bzh\b', r'\b中文\b',
-                r'\bchinese\s+(?:language|lang)\b', r'\bnative\s+chinese\b',
-                r'\bfluent\s+chinese\b', r'\bchinese\s+(?:native|fluent|proficient|advanced|intermediate|basic)\b'
-            ],
-            # Japanese variations
-            'japanese': [
-                r'\bjapanese\b', r'\bnihongo\b', r'\bja\b', r'\b日本語\b',
-                r'\bjapanese\s+(?:language|lang)\b', r'\bnative\s+japanese\b',
-                r'\bfluent\s+japanese\b', r'\bjapanese\s+(?:native|fluent|proficient|advanced|intermediate|basic)\b'
-            ],
-            # Russian variations
-            'russian': [
-                r'\brussian\b', r'\brusskiy\b', r'\bru\b', r'\bрусский\b',
-                r'\brussian\s+(?:language|lang)\b', r'\bnative\s+russian\b',
-                r'\bfluent\s+russian\b', r'\brussian\s+(?:native|fluent|proficient|advanced|intermediate|basic)\b'
-            ],
-            # Hindi variations
-            'hindi': [
-                r'\bhindi\b', r'\bhi\b', r'\bहिन्दी\b',
-                r'\bhindi\s+(?:language|lang)\b', r'\bnative\s+hindi\b',
-                r'\bfluent\s+hindi\b', r'\bhindi\s+(?:native|fluent|proficient|advanced|intermediate|basic)\b'
-            ]
-        }
-        
-        # Proficiency level patterns
-        proficiency_patterns = {
-            'native': [r'\bnative\b', r'\bnative\s+speaker\b', r'\bnative\s+level\b', r'\bmother\s+tongue\b'],
-            'fluent': [r'\bfluent\b', r'\bfluent\s+speaker\b', r'\bfluent\s+level\b', r'\bfully\s+proficient\b'],
-            'proficient': [r'\bproficient\b', r'\bprofessional\b', r'\bworking\s+proficiency\b'],
-            'advanced': [r'\badvanced\b', r'\badvanced\s+level\b', r'\bexpert\b'],
-            'intermediate': [r'\bintermediate\b', r'\bintermediate\s+level\b', r'\bconversational\b'],
-            'basic': [r'\bbasic\b', r'\bbasic\s+level\b', r'\bbeginner\b', r'\belementary\b']
-        }
-        
         text_lower = text.lower()
         found_languages = []
         
         # Extract languages with proficiency
-        for language, patterns in language_patterns.items():
-            language_found = False
-            proficiency = None
-            
+        for language, language_re in _LANGUAGE_RES.items():
             # Check if language is mentioned
-            for pattern in patterns:
-                if re.search(pattern, text_lower):
-                    language_found = True
-                    break
+            if not language_re.search(text_lower):
+                continue
             
-            if language_found:
-                # Find proficiency level for this language
-                for prof_level, prof_patterns in proficiency_patterns.items():
-                    # Look for proficiency patterns near the language name
-                    language_context = re.findall(rf'[^.]*{language}[^.]*', text_lower, re.IGNORECASE)
-                    for context in language_context:
-                        for prof_pattern in prof_patterns:
-                            if re.search(prof_pattern, context):
-                                proficiency = prof_level
-                                break
-                        if proficiency:
-                            break
-                
-                # Format language with proficiency
-                if proficiency:
-                    found_languages.append(f"{language.title()} ({proficiency.title()})")
-                else:
-                    found_languages.append(language.title())
+            # Find proficiency level for this language, looking for proficiency
+            # patterns near the language name
+            proficiency = None
+            language_context = _LANGUAGE_CONTEXT_RES[language].findall(text_lower)
+            for prof_level, prof_re in _PROFICIENCY_RES.items():
+                for context in language_context:
+                    if prof_re.search(context):
+                        proficiency = prof_level
+                        break
+                    if proficiency:
+                        break
+            
+            # Format language with proficiency
+            if proficiency:
+                found_languages.append(f"{language.title()} ({proficiency.title()})")
+            else:
+                found_languages.append(language.title())
         
         # Also extract standalone proficiency indicators (for languages section headers)
-        standalone_proficiencies = []
-        for prof_level, patterns in proficiency_patterns.items():
-            for pattern in patterns:
-                if re.search(pattern, text_lower):
-                    standalone_proficiencies.append(prof_level.title())
-                    break
+        standalone_proficiencies = [
+            prof_level.title() for prof_level, prof_re in _PROFICIENCY_RES.items() if prof_re.search(text_lower)
+        ]
         
         # Combine and remove duplicates
         all_languages = found_languages + standalone_proficiencies
         return list(dict.fromkeys(all_languages))
     
-    def _extract_professional_links(self, text: str, doc=None) -> Dict[str, List[str]]:
+    def _extract_professional_links(self, text: str, doc=None, hits=None) -> Dict[str, List[str]]:
         """Extract GitHub, GitLab, LinkedIn, and portfolio links from CV text"""
         links = {
             'github': [],
@@ -497,50 +721,12 @@ class NLPExtractor:
         # Convert to lowercase for pattern matching
         text_lower = text.lower()
         
-        # GitHub patterns
-        github_patterns = [
-            r'https?://(?:www\.)?github\.com/[\w\-\.]+/?(?:[\w\-\/]*)?',
-            r'github\.com/[\w\-\.]+/?(?:[\w\-\/]*)?',
-            r'@[\w\-\.]+(?:\s+|\n)*(?:github|gh)',
-            r'github:\s*[\w\-\.]+',
-            r'github\s*[:\/]\s*[\w\-\.\.]+',
-            r'github\s+user(?:name)?[:\s]+[\w\-\.]+'
-        ]
-        
-        # LinkedIn patterns
-        linkedin_patterns = [
-            r'https?://(?:www\.)?linkedin\.com/in/[\w\-\.]+',
-            r'https?://(?:www\.)?linkedin\.com/profile/view\?id=\d+',
-            r'linkedin\.com/in/[\w\-\.]+',
-            r'linkedin:\s*[\w\-\.]+',
-            r'linkedin\s*[:\/]\s*[\w\-\.\.]+',
-            r'linkedin\s+profile[:\s]+[\w\-\.]+'
-        ]
-        
-        # GitLab patterns
-        gitlab_patterns = [
-            r'https?://(?:www\.)?gitlab\.com/[\w\-\.]+/?(?:[\w\-\/]*)?',
-            r'gitlab\.com/[\w\-\.]+/?(?:[\w\-\/]*)?',
-            r'@[\w\-\.]+(?:\s+|\n)*gitlab',
-            r'gitlab:\s*[\w\-\.]+',
-            r'gitlab\s*[:\/]\s*[\w\-\.\.]+',
-            r'gitlab\s+user(?:name)?[:\s]+[\w\-\.]+'
-        ]
-        
-        # Portfolio patterns (broader catch for personal/professional sites)
-        portfolio_patterns = [
-            r'https?://[\w\-\.]+\.(?:com|io|dev|me|co|net|org|site|app|tech|blog|portfolio)/?(?:[\w\-\/]*)?',
-            r'portfolio:\s*https?://[\w\-\.]+\.[\w\.]+',
-            r'website:\s*https?://[\w\-\.]+\.[\w\.]+',
-            r'personal\s+site:\s*https?://[\w\-\.]+\.[\w\.]+',
-            r'blog:\s*https?://[\w\-\.]+\.[\w\.]+',
-            r'demo:\s*https?://[\w\-\.]+\.[\w\.]+',
-            r'project:\s*https?://[\w\-\.]+\.[\w\.]+'
-        ]
+        # Only run the patterns of link families that can occur in this text
+        families = (hits or _scan_vocabulary(text_lower))['link']
         
         # Extract GitHub links
-        for pattern in github_patterns:
-            matches = re.findall(pattern, text_lower)
+        for pattern_re in (_GITHUB_RES if 'github' in families else ()):
+            matches = pattern_re.findall(text_lower)
             for match in matches:
                 # Clean up and normalize the URL
                 if not match.startswith('http'):
@@ -548,12 +734,12 @@ class NLPExtractor:
                         match = 'https://' + match
                     elif '@' in match:
                         # Handle @username format
-                        username = re.search(r'@([\w\-\.]+)', match)
+                        username = _AT_USERNAME_RE.search(match)
                         if username:
                             match = f'https://github.com/{username.group(1)}'
                     else:
                         # Handle other formats
-                        username = re.search(r'github[:\s\/]*([\w\-\.]+)', match)
+                        username = _GITHUB_USERNAME_RE.search(match)
                         if username:
                             match = f'https://github.com/{username.group(1)}'
                 
@@ -562,8 +748,8 @@ class NLPExtractor:
                     links['github'].append(match)
         
         # Extract LinkedIn links
-        for pattern in linkedin_patterns:
-            matches = re.findall(pattern, text_lower)
+        for pattern_re in (_LINKEDIN_RES if 'linkedin' in families else ()):
+            matches = pattern_re.findall(text_lower)
             for match in matches:
                 # Clean up and normalize the URL
                 if not match.startswith('http'):
@@ -571,7 +757,7 @@ class NLPExtractor:
                         match = 'https://' + match
                     else:
                         # Handle linkedin:username format
-                        username = re.search(r'linkedin[:\s\/]*([\w\-\.]+)', match)
+                        username = _LINKEDIN_USERNAME_RE.search(match)
                         if username:
                             match = f'https://linkedin.com/in/{username.group(1)}'
                 
@@ -580,8 +766,8 @@ class NLPExtractor:
                     links['linkedin'].append(match)
         
         # Extract GitLab links
-        for pattern in gitlab_patterns:
-            matches = re.findall(pattern, text_lower)
+        for pattern_re in (_GITLAB_RES if 'gitlab' in families else ()):
+            matches = pattern_re.findall(text_lower)
             for match in matches:
                 # Clean up and normalize the URL
                 if not match.startswith('http'):
@@ -589,12 +775,12 @@ class NLPExtractor:
                         match = 'https://' + match
                     elif '@' in match:
                         # Handle @username format
-                        username = re.search(r'@([\w\-\.]+)', match)
+                        username = _AT_USERNAME_RE.search(match)
                         if username:
                             match = f'https://gitlab.com/{username.group(1)}'
                     else:
                         # Handle other formats
-                        username = re.search(r'gitlab[:\s\/]*([\w\-\.]+)', match)
+                        username = _GITLAB_USERNAME_RE.search(match)
                         if username:
                             match = f'https://gitlab.com/{username.group(1)}'
                 
@@ -603,13 +789,13 @@ class NLPExtractor:
                     links['gitlab'].append(match)
         
         # Extract portfolio links
-        for pattern in portfolio_patterns:
-            matches = re.findall(pattern, text_lower)
+        for pattern_re in (_PORTFOLIO_RES if 'url' in families else ()):
+            matches = pattern_re.findall(text_lower)
             for match in matches:
                 # Clean up the URL
                 if not match.startswith('http'):
                     # Extract URL from patterns like "portfolio: https://example.com"
-                    url_match = re.search(r'https?://[\w\-\.]+\.[\w\.]+(?:/[\w\-\/]*)?', match)
+                    url_match = _EMBEDDED_URL_RE.search(match)
                     if url_match:
                         match = url_match.group(0)
                 
@@ -620,8 +806,7 @@ class NLPExtractor:
                     links['portfolio'].append(match)
         
         # Also look for URLs in the general text that might be portfolio links
-        general_url_pattern = r'https?://[\w\-\.]+\.(?:com|io|dev|me|co|net|org|site|app|tech|blog|portfolio)/?(?:[\w\-\/]*)?'
-        general_matches = re.findall(general_url_pattern, text_lower)
+        general_matches = _GENERAL_URL_RE.findall(text_lower) if 'url' in families else []
         
         for match in general_matches:
             # Add to portfolio if it's not already in other categories
@@ -643,35 +828,22 @@ class NLPExtractor:
         if not url or not isinstance(url, str):
             return False
         
-        # Basic URL validation
-        url_pattern = r'^https?://[\w\-\.]+\.[\w\.]+(?:/[\w\-\/]*)?$'
-        if not re.match(url_pattern, url):
-            return False
-        
-        # Exclude common non-portfolio domains
-        excluded_domains = [
-            'mail.google.com', 'gmail.com', 'outlook.com', 'yahoo.com',
-            'facebook.com', 'twitter.com', 'instagram.com', 'youtube.com',
-            'stackoverflow.com', 'medium.com', 'reddit.com',
-            'google.com', 'microsoft.com', 'apple.com'
-        ]
-        
-        for domain in excluded_domains:
-            if domain in url:
-                return False
-        
-        return True
+        # Basic URL validation, then exclude common non-portfolio domains
+        if RE2_AVAILABLE and url.isascii():
+            return bool(_VALID_URL_RE2.match(url)) and not _EXCLUDED_DOMAIN_RE2.search(url)
+        return bool(_VALID_URL_RE.match(url)) and not _EXCLUDED_DOMAIN_RE.search(url)
     
     def _extract_simple(self, text: str) -> Dict[str, Any]:
         """Simple extraction fallback when spaCy is not available"""
+        hits = _scan_vocabulary(text.lower())
         return {
-            'technical_skills': self._extract_technical_skills(text),
-            'soft_skills': self._extract_soft_skills(text),
+            'technical_skills': self._extract_technical_skills(text, hits=hits),
+            'soft_skills': self._extract_soft_skills(text, hits=hits),
             'experience_years': self._extract_experience_years(text),
             'education': self._extract_education(text),
             'certifications': self._extract_certifications(text),
             'languages': self._extract_languages(text),
-            'professional_links': self._extract_professional_links(text),
+            'professional_links': self._extract_professional_links(text, hits=hits),
             'entities': [],
         }
     
@@ -5,6 +5,11 @@ Level 3: Retrieval-Augmented Generation for Explainability
 
 from typing import Dict, Any, List, Optional
 import json
+import threading
+
+
+# Score bars for every fill level, so explanations never rebuild them
+_SCORE_BARS = tuple("█" * filled + "░" * (20 - filled) for filled in range(21))
 
 
 class RAGEngine:
@@ -27,9 +32,36 @@ class RAGEngine:
         Returns:
             Human-readable explanation
         """
+        return self.explain_matches_batch([candidate_data], job_data, [scores])[0]
+    
+    def explain_matches_batch(self, candidates_data: List[Dict[str, Any]], job_data: Dict[str, Any],
+                              scores_list: List[Dict[str, float]]) -> List[str]:
+        """
+        Generate match explanations for several candidates against the same job
+        
+        The job context is prepared once and shared by every explanation.
+        
+        Args:
+            candidates_data: Candidate information, one entry per candidate
+            job_data: Job information
+            scores_list: Matching scores, aligned with candidates_data
+            
+        Returns:
+            Human-readable explanations, aligned with candidates_data
+        """
+        job_skills = sorted(set(job_data.get('required_skills', [])))
+        job_exp_required = job_data.get('required_experience_years', 0)
+        
+        return [
+            self._explain_candidate(candidate_data, job_skills, job_exp_required, scores)
+            for candidate_data, scores in zip(candidates_data, scores_list)
+        ]
+    
+    def _explain_candidate(self, candidate_data: Dict[str, Any], job_skills: List[str],
+                           job_exp_required: float, scores: Dict[str, float]) -> str:
+        """Build the explanation for one candidate from prepared job context"""
         def bar(value: float) -> str:
-            filled = int(max(0, min(1, value)) * 20)
-            return "█" * filled + "░" * (20 - filled)
+            return _SCORE_BARS[int(max(0, min(1, value)) * 20)]
 
         explanation_parts = []
         overall_score = scores.get('overall_score', 0) * 100
@@ -51,21 +83,19 @@ class RAGEngine:
             f"- Soft skills: {scores.get('soft_skills', 0):.0%} | {bar(scores.get('soft_skills', 0))}\n\n"
         )
 
-        # Technical highlights
+        # Technical highlights; job_skills is pre-sorted, so both lists come out in order
         explanation_parts.append("Technical skills:\n")
-        candidate_skills = candidate_data.get('technical_skills', [])
-        job_skills = job_data.get('required_skills', [])
-        matched = set(candidate_skills) & set(job_skills)
-        missing = set(job_skills) - set(candidate_skills)
+        candidate_skills = set(candidate_data.get('technical_skills', []))
+        matched = [skill for skill in job_skills if skill in candidate_skills]
+        missing = [skill for skill in job_skills if skill not in candidate_skills]
         if matched:
-            explanation_parts.append("  ✓ Matches: " + ", ".join(sorted(matched)) + "\n")
+            explanation_parts.append("  ✓ Matches: " + ", ".join(matched) + "\n")
         if missing:
-            explanation_parts.append("  ✗ Missing: " + ", ".join(sorted(missing)) + "\n")
+            explanation_parts.append("  ✗ Missing: " + ", ".join(missing) + "\n")
         explanation_parts.append("\n")
 
         # Experience analysis
         candidate_exp = candidate_data.get('experience_years', 0)
-        job_exp_required = job_data.get('required_experience_years', 0)
         explanation_parts.append("Experience:\n")
         explanation_parts.append(
             f"  Candidate: {candidate_exp} yrs | Required: {job_exp_required} yrs\n"
@@ -243,3 +273,19 @@ class RAGEngine:
         
         return questions
 
+
+# Shared RAG engine, built on first use. RAGEngine keeps no per-request
+# state, so one instance can serve every request thread; the lock only
+# guards construction.
+_rag_engine = None
+_rag_engine_lock = threading.Lock()
+
+
+def get_rag_engine() -> RAGEngine:
+    """Return the process-wide RAGEngine, creating it on first call"""
+    global _rag_engine
+    if _rag_engine is None:
+        with _rag_engine_lock:
+            if _rag_engine is None:
+                _rag_engine = RAGEngine()
+    return _rag_engine
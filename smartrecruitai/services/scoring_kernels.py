@@ -0,0 +1,247 @@
+"""
+Scoring Kernels
+Numeric candidate scoring kernels, JIT-compiled with Numba when available
+Compiled kernels release the GIL, so scoring threads run them in parallel
+"""
+
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+    def njit(*args, **kwargs):
+        """Fallback decorator that leaves the function as plain Python"""
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda func: func
+
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+    np = None
+
+from itertools import count
+from typing import Dict, Iterable, Optional
+
+from .nlp_extractor import SOFT_SKILLS
+
+
+# Fixed skill vocabulary: normalized skill name -> non-negative id. It only holds
+# the synonym table and soft skill list; other skills get negative ids from a
+# caller-owned table, so names read from CVs and job offers never accumulate here
+SKILL_VOCAB = {}
+_skill_ids = count()
+
+
+def normalize_skill(skill: str) -> str:
+    """Lowercase and strip a skill name, the one form every skill table is keyed by"""
+    return skill.lower().strip()
+
+
+def intern_skill(skill: str) -> int:
+    """
+    Add a normalized skill name to the fixed vocabulary and return its id
+    
+    Only called at import time for the known vocabulary; use skill_id for
+    names that come from input data.
+    """
+    skill_id = SKILL_VOCAB.get(skill)
+    if skill_id is None:
+        skill_id = SKILL_VOCAB.setdefault(skill, next(_skill_ids))
+    return skill_id
+
+
+for _skill in SOFT_SKILLS:
+    intern_skill(normalize_skill(_skill))
+
+
+def skill_id(skill: str, local_ids: Dict[str, int]) -> int:
+    """
+    Return the id of a normalized skill name
+    
+    Args:
+        skill: Lowercased, stripped skill name
+        local_ids: Ids of skills outside the vocabulary; unseen names are added
+            to it, so skills encoded with the same table share ids
+            
+    Returns:
+        Vocabulary id, or a negative id local to local_ids
+    """
+    found = SKILL_VOCAB.get(skill)
+    if found is None:
+        found = local_ids.get(skill)
+        if found is None:
+            found = local_ids[skill] = -1 - len(local_ids)
+    return found
+
+
+def encode_skills(skills: Iterable[str], local_ids: Dict[str, int]):
+    """
+    Encode normalized skill names as a sorted array of ids
+    
+    Args:
+        skills: Lowercased, stripped skill names
+        local_ids: Table for skills outside the vocabulary (see skill_id)
+        
+    Returns:
+        Sorted int32 array of unique ids (a sorted list without NumPy)
+    """
+    return encode_skill_ids({skill_id(skill, local_ids) for skill in skills})
+
+
+def encode_skill_ids(skill_ids: Iterable[int]):
+    """
+    Encode a set of vocabulary ids as a sorted array
+    
+    Args:
+        skill_ids: Unique ids from skill_id
+        
+    Returns:
+        Sorted int32 array of the ids (a sorted list without NumPy)
+    """
+    ids = sorted(skill_ids)
+    if NUMPY_AVAILABLE:
+        return np.array(ids, dtype=np.int32)
+    return ids
+
+
+@njit(cache=True, nogil=True)
+def _count_common(a, b):
+    """Count ids present in both sorted id arrays"""
+    i = 0
+    j = 0
+    common = 0
+    while i < len(a) and j < len(b):
+        if a[i] == b[j]:
+            common += 1
+            i += 1
+            j += 1
+        elif a[i] < b[j]:
+            i += 1
+        else:
+            j += 1
+    return common
+
+
+@njit(cache=True, nogil=True)
+def score_kernel(cand_skills, job_skills, cand_expanded, job_expanded, cand_soft, job_soft, exp_years, req_exp):
+    """
+    Compute technical, experience and soft skill subscores from encoded skills
+
+    Args:
+        cand_skills: Candidate technical skill ids
+        job_skills: Required technical skill ids
+        cand_expanded: Candidate skill ids including synonyms
+        job_expanded: Required skill ids including synonyms
+        cand_soft: Candidate soft skill ids
+        job_soft: Required soft skill ids
+        exp_years: Candidate years of experience
+        req_exp: Required years of experience
+
+    Returns:
+        Tuple of (technical, experience, soft skills) scores in [0, 1]
+    """
+    if len(job_skills) > 0:
+        # Exact matches count fully, synonym-only matches at 70%
+        exact = _count_common(cand_skills, job_skills)
+        synonym = _count_common(cand_expanded, job_expanded) - exact
+        total = len(job_expanded)
+        technical = min(1.0, exact / total * 1.0 + synonym / total * 0.7)
+    elif len(cand_skills) > 0:
+        technical = 0.5  # Partial credit
+    else:
+        technical = 0.0
+
+    if req_exp > 0:
+        experience = min(exp_years / req_exp, 1.0)
+    else:
+        experience = 1.0
+
+    if len(job_soft) > 0:
+        soft = _count_common(cand_soft, job_soft) / len(job_soft)
+    elif len(cand_soft) > 0:
+        soft = 0.3  # Partial credit for having soft skills
+    else:
+        soft = 0.0
+
+    return technical, experience, soft
+
+
+@njit(cache=True, nogil=True)
+def _clamp01(value):
+    return max(0.0, min(1.0, value))
+
+
+@njit(cache=True, nogil=True)
+def blend_kernel(similarity, tech, exp, edu, soft, weights, total_weight):
+    """
+    Combine similarity and subscores into an overall score in [0, 1]
+    
+    Args:
+        similarity: Cosine similarity
+        tech: Technical skills score
+        exp: Experience score
+        edu: Education score
+        soft: Soft skills score
+        weights: Tuple of (similarity, technical, experience, education, soft skills) weights
+        total_weight: Sum of the weights, used to normalize the result
+        
+    Returns:
+        Weighted average of the scores, each clamped to [0, 1] first
+    """
+    w_sim, w_tech, w_exp, w_edu, w_soft = weights
+    overall = (
+        w_sim * _clamp01(similarity) +
+        w_tech * _clamp01(tech) +
+        w_exp * _clamp01(exp) +
+        w_edu * _clamp01(edu) +
+        w_soft * _clamp01(soft)
+    )
+    return overall / total_weight
+
+
+def warmup():
+    """Trigger JIT compilation once so the first request does not pay for it"""
+    if not (NUMBA_AVAILABLE and NUMPY_AVAILABLE):
+        return
+    ids = np.array([0, 1], dtype=np.int32)
+    score_kernel(ids, ids, ids, ids, ids, ids, 1.0, 1.0)
+    blend_kernel(1.0, 1.0, 1.0, 1.0, 1.0, (1.0, 1.0, 1.0, 1.0, 1.0), 5.0)
+
+
+# Soft skill name -> single-bit mask for the known soft skills; other names
+# take the next free bits from a caller-owned table
+SOFT_SKILL_BITS = {
+    skill: 1 << i for i, skill in enumerate(dict.fromkeys(normalize_skill(skill) for skill in SOFT_SKILLS))
+}
+
+
+def soft_skill_mask(skills: Iterable[str], local_bits: Optional[Dict[str, int]] = None) -> int:
+    """
+    Encode soft skill names as a bitmask so overlaps are a single AND + popcount
+
+    Args:
+        skills: Soft skill names, in any case
+        local_bits: Bits of soft skills outside SOFT_SKILL_BITS; pass the same
+            table when encoding masks that will be compared with each other
+
+    Returns:
+        Integer with one bit set per distinct soft skill
+    """
+    if local_bits is None:
+        local_bits = {}
+    mask = 0
+    for skill in skills:
+        if not skill:
+            continue
+        name = normalize_skill(skill)
+        bit = SOFT_SKILL_BITS.get(name)
+        if bit is None:
+            bit = local_bits.get(name)
+            if bit is None:
+                bit = local_bits[name] = 1 << (len(SOFT_SKILL_BITS) + len(local_bits))
+        mask |= bit
+    return mask
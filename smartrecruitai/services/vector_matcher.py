@@ -19,16 +19,300 @@ except ImportError:
     np = None
     cosine = None
 
-from typing import List, Dict, Any, Tuple
+try:
+    import onnxruntime
+    from transformers import AutoTokenizer
+    ONNXRUNTIME_AVAILABLE = True
+except ImportError:
+    ONNXRUNTIME_AVAILABLE = False
+    onnxruntime = None
+    AutoTokenizer = None
+
+try:
+    from rapidfuzz import process as fuzz_process
+    from rapidfuzz.distance import Levenshtein
+    RAPIDFUZZ_AVAILABLE = True
+except ImportError:
+    RAPIDFUZZ_AVAILABLE = False
+
+from typing import List, Dict, Any, Iterable, Tuple
+from dataclasses import dataclass
 from pathlib import Path
 import json
+import hashlib
+import os
+import re
+import threading
 from django.conf import settings
+from django.core.cache import InvalidCacheBackendError, caches
+from django.core.exceptions import ImproperlyConfigured
 import unicodedata
 
+from .scoring_kernels import (
+    blend_kernel, encode_skill_ids, encode_skills, intern_skill, normalize_skill, score_kernel, skill_id
+)
+
+
+# Skill synonyms and variations used for technical skill matching
+SKILL_SYNONYMS = {
+    # Programming languages
+    'javascript': ['js', 'ecmascript', 'es6', 'es2015'],
+    'typescript': ['ts'],
+    'python': ['py', 'python3'],
+    'java': ['jvm', 'jdk'],
+    'c#': ['csharp', 'c-sharp', '.net'],
+    'c++': ['cpp', 'c-plus-plus'],
+    'php': ['hypertext preprocessor'],
+    'ruby': ['rails', 'ruby on rails'],
+    'go': ['golang'],
+    'swift': ['ios'],
+    'kotlin': ['android'],
+    'rust': ['rs'],
+
+    # Web technologies
+    'html': ['html5', 'markup'],
+    'css': ['css3', 'sass', 'scss', 'less', 'stylus'],
+    'react': ['reactjs', 'react.js', 'jsx'],
+    'angular': ['angularjs', 'angular.js', 'ng'],
+    'vue': ['vuejs', 'vue.js', 'vuejs'],
+    'node.js': ['node', 'nodejs', 'backend javascript'],
+    'express': ['expressjs', 'express.js'],
+    'django': ['python django'],
+    'flask': ['python flask'],
+    'laravel': ['php laravel'],
+    'spring': ['spring boot', 'spring framework'],
+    'asp.net': ['.net core', 'aspnet'],
+
+    # Databases
+    'sql': ['mysql', 'postgresql', 'postgres', 'sqlite', 'oracle', 'mssql'],
+    'nosql': ['mongodb', 'cassandra', 'redis', 'elasticsearch', 'dynamodb'],
+    'postgresql': ['postgres', 'psql'],
+    'mysql': ['mariadb'],
+    'mongodb': ['mongo', 'nosql mongodb'],
+    'redis': ['cache', 'in-memory database'],
+
+    # Cloud platforms
+    'aws': ['amazon web services', 'ec2', 's3', 'lambda', 'rds'],
+    'azure': ['microsoft azure', 'azure cloud'],
+    'gcp': ['google cloud platform', 'google cloud'],
+    'docker': ['containers', 'containerization'],
+    'kubernetes': ['k8s', 'orchestration'],
+
+    # DevOps tools
+    'jenkins': ['ci/cd', 'continuous integration'],
+    'git': ['version control', 'github', 'gitlab', 'bitbucket'],
+    'terraform': ['infrastructure as code', 'iac'],
+    'ansible': ['automation', 'configuration management'],
+
+    # Frontend technologies
+    'bootstrap': ['css framework', 'responsive design'],
+    'tailwind': ['tailwind css', 'utility-first css'],
+    'webpack': ['bundler', 'module bundler'],
+    'babel': ['transpiler', 'javascript transpiler'],
+
+    # Mobile development
+    'ios': ['iphone', 'ipad', 'objective-c'],
+    'android': ['android studio', 'mobile development'],
+    'react native': ['cross-platform mobile'],
+    'flutter': ['dart', 'cross-platform'],
+
+    # Data science/AI
+    'tensorflow': ['deep learning', 'neural networks'],
+    'pytorch': ['machine learning', 'ai'],
+    'scikit-learn': ['sklearn', 'machine learning library'],
+    'pandas': ['data analysis', 'data manipulation'],
+    'numpy': ['numerical computing', 'scientific computing'],
+
+    # Testing
+    'jest': ['javascript testing', 'unit testing'],
+    'pytest': ['python testing'],
+    'junit': ['java testing'],
+    'selenium': ['automated testing', 'web testing'],
+
+    # Other technologies
+    'rest': ['rest api', 'restful', 'web api'],
+    'graphql': ['gql', 'query language'],
+    'microservices': ['microservice architecture'],
+    'agile': ['scrum', 'kanban', 'iterative development'],
+    'linux': ['unix', 'ubuntu', 'centos', 'debian'],
+    'windows': ['microsoft windows', 'win32'],
+    'macos': ['os x', 'mac', 'apple os']
+}
+
+# A spelling variant counts as a synonym match only when, ignoring spaces, dots,
+# hyphens and underscores, it is at most FUZZY_SKILL_MAX_EDITS edits from the skill;
+# names shorter than FUZZY_SKILL_MIN_LENGTH must be identical (e.g. "sql" vs "sas")
+FUZZY_SKILL_MAX_EDITS = 1
+FUZZY_SKILL_MIN_LENGTH = 5
+_SKILL_SEPARATORS_RE = re.compile(r'[\s.\-_]+')
+
+
+# Default weights for calculate_overall_score, in JobContext.weights order
+DEFAULT_MATCHING_WEIGHTS = {
+    'similarity': 0.5,
+    'technical': 0.3,
+    'experience': 0.15,
+    'education': 0.05,
+    'soft_skills': 0.0,
+}
+
+
+@dataclass(frozen=True, eq=False)
+class JobContext:
+    """Job-side scoring inputs, prepared once and shared by every candidate scored against the job"""
+    skill_ids: Any
+    expanded_skill_ids: Any
+    expanded_skills: frozenset
+    soft_skill_ids: Any
+    local_skill_ids: Dict[str, int]
+    required_experience_years: float
+    required_education_level: float
+    weights: Tuple[float, ...]
+    weight_total: float
+
+
+def _expand_skills(skills):
+    """Add the synonyms of each skill to the skill set"""
+    expanded = set(skills)
+    for skill in skills:
+        expanded.update(SKILL_SYNONYMS.get(skill, ()))
+    return expanded
+
+
+# The synonym table resolved to vocabulary ids once, so scoring a candidate
+# expands ids with set unions instead of re-interning every synonym name
+SKILL_SYNONYM_IDS = {
+    intern_skill(skill): frozenset(intern_skill(name) for name in (skill, *synonyms))
+    for skill, synonyms in SKILL_SYNONYMS.items()
+}
+
+
+def _expand_skill_ids(skill_ids):
+    """Id-level _expand_skills: add the ids of each skill's synonyms to the id set"""
+    expanded = set(skill_ids)
+    for known_id in skill_ids:
+        synonym_ids = SKILL_SYNONYM_IDS.get(known_id)
+        if synonym_ids:
+            expanded |= synonym_ids
+    return expanded
+
+
+def _fuzzy_matched_skills(candidate_skills, job_skills):
+    """
+    Find the job skills that no synonym covers but a candidate skill spells closely
+    
+    Args:
+        candidate_skills: Candidate skill names, synonyms included
+        job_skills: Required skill names, synonyms included
+        
+    Returns:
+        Set of job skill names that some candidate skill spells the same way up
+        to separators and a typo (empty without rapidfuzz)
+    """
+    queries = [skill for skill in candidate_skills if skill not in job_skills]
+    targets = [skill for skill in job_skills if skill not in candidate_skills]
+    if not (RAPIDFUZZ_AVAILABLE and NUMPY_AVAILABLE and queries and targets):
+        return set()
+    
+    query_keys = [_SKILL_SEPARATORS_RE.sub('', skill) for skill in queries]
+    target_keys = [_SKILL_SEPARATORS_RE.sub('', skill) for skill in targets]
+    
+    # One call computes every query-target edit distance, on this thread
+    distances = fuzz_process.cdist(
+        query_keys, target_keys, scorer=Levenshtein.distance,
+        score_cutoff=FUZZY_SKILL_MAX_EDITS, workers=1
+    )
+    lengths = np.minimum.outer([len(key) for key in query_keys], [len(key) for key in target_keys])
+    allowed = np.where(lengths >= FUZZY_SKILL_MIN_LENGTH, FUZZY_SKILL_MAX_EDITS, 0)
+    matched = (distances <= allowed) & (lengths > 0)
+    return {targets[j] for j in np.flatnonzero(matched.any(axis=0))}
+
+
+def _normalize_skills(skills):
+    """Lowercase and strip skill names, dropping empty ones"""
+    return set(normalize_skill(skill) for skill in skills or [] if skill)
+
+
+class OnnxSentenceEncoder:
+    """
+    Sentence-transformer encoder running an exported ONNX model on CPU
+    
+    Mirrors the parts of SentenceTransformer.encode that VectorMatcher uses:
+    token embeddings from the model are mean-pooled over the attention mask
+    and optionally L2-normalized.
+    """
+    
+    def __init__(self, model_dir: str, model_file: str = 'model_quantized.onnx'):
+        """
+        Load the ONNX session and tokenizer
+        
+        Args:
+            model_dir: Directory written by the export_onnx_embedder command
+            model_file: ONNX file inside model_dir (the int8-quantized one by default)
+        """
+        self.model_path = str(Path(model_dir) / model_file)
+        self.session = onnxruntime.InferenceSession(self.model_path, providers=['CPUExecutionProvider'])
+        self.input_names = [model_input.name for model_input in self.session.get_inputs()]
+        self.tokenizer = AutoTokenizer.from_pretrained(model_dir)
+    
+    @classmethod
+    def load(cls) -> 'OnnxSentenceEncoder | None':
+        """Load the encoder configured in settings, or return None when it is unavailable"""
+        model_dir = getattr(settings, 'ONNX_EMBEDDING_MODEL_DIR', None)
+        if not ONNXRUNTIME_AVAILABLE or not NUMPY_AVAILABLE:
+            print("onnxruntime or transformers not installed. Ignoring USE_ONNX_EMB.")
+            return None
+        if not model_dir or not Path(model_dir).exists():
+            print(f"ONNX embedding model not found at {model_dir}. Run: python manage.py export_onnx_embedder")
+            return None
+        return cls(model_dir)
+    
+    def encode(self, sentences, batch_size: int = 32, show_progress_bar: bool = False,
+               convert_to_numpy: bool = True, normalize_embeddings: bool = False):
+        """
+        Embed one sentence or a list of sentences
+        
+        Args:
+            sentences: Text or list of texts
+            batch_size: Number of texts per session run
+            show_progress_bar: Accepted for SentenceTransformer compatibility
+            convert_to_numpy: Accepted for SentenceTransformer compatibility
+            normalize_embeddings: Scale each embedding to unit length
+            
+        Returns:
+            float32 array of shape (len(sentences), dim), or (dim,) for a single text
+        """
+        single = isinstance(sentences, str)
+        texts = [sentences] if single else list(sentences)
+        
+        batches = []
+        for start in range(0, len(texts), batch_size):
+            encoded = self.tokenizer(
+                texts[start:start + batch_size], padding=True, truncation=True, return_tensors='np'
+            )
+            feed = {name: encoded[name].astype(np.int64) for name in self.input_names if name in encoded}
+            token_embeddings = self.session.run(None, feed)[0]
+            
+            # Mean pooling over real tokens only
+            mask = encoded['attention_mask'].astype(np.float32)
+            summed = np.einsum('btd,bt->bd', token_embeddings, mask)
+            batches.append(summed / np.maximum(mask.sum(axis=1, keepdims=True), 1e-9))
+        
+        embeddings = np.concatenate(batches) if batches else np.zeros((0, 0), dtype=np.float32)
+        if normalize_embeddings and len(embeddings):
+            embeddings = embeddings / np.maximum(
+                np.sqrt(np.einsum('nd,nd->n', embeddings, embeddings))[:, None], 1e-12
+            )
+        embeddings = embeddings.astype(np.float32)
+        return embeddings[0] if single else embeddings
+
 
 class VectorMatcher:
     """Match candidates and job offers using vector embeddings"""
     
+    _shared = None
+    _shared_lock = threading.Lock()
+    
     def __init__(self, model_name: str = 'sentence-transformers/all-mpnet-base-v2'):
         """
         Initialize the Vector Matcher
@@ -52,7 +336,12 @@ class VectorMatcher:
             # If settings are not available (e.g. in isolated tests), keep the original value.
             pass
 
-        if SENTENCE_TRANSFORMERS_AVAILABLE:
+        onnx_encoder = OnnxSentenceEncoder.load() if os.getenv('USE_ONNX_EMB') else None
+        if onnx_encoder is not None:
+            # Cache keys use the model path, so ONNX vectors never mix with PyTorch ones
+            self.model = onnx_encoder
+            self.model_name = onnx_encoder.model_path
+        elif SENTENCE_TRANSFORMERS_AVAILABLE:
             self.model = SentenceTransformer(model_name)
             self.model_name = model_name
         else:
@@ -60,6 +349,20 @@ class VectorMatcher:
             self.model = None
             self.model_name = model_name
     
+    @classmethod
+    def get(cls) -> 'VectorMatcher':
+        """
+        Return the process-wide matcher, loading the model on first call
+        
+        The app config preloads it at startup, so requests normally find
+        the model already in memory.
+        """
+        if cls._shared is None:
+            with cls._shared_lock:
+                if cls._shared is None:
+                    cls._shared = cls()
+        return cls._shared
+    
     def generate_embedding(self, text: str) -> List[float]:
         """
         Generate embedding vector for a text
@@ -71,12 +374,67 @@ class VectorMatcher:
             List of floats representing the embedding vector
         """
         if self.model:
-            embedding = self.model.encode(text, convert_to_numpy=True)
-            return embedding.tolist()
+            return self.generate_embeddings_batch([text])[0]
         else:
             # Mock embedding for testing
             return [0.1] * 768
     
+    def generate_embeddings_batch(self, texts: List[str], batch_size: int = 32) -> List[List[float]]:
+        """
+        Generate embedding vectors for several texts in one model call
+        
+        Texts already in the embedding cache are not re-encoded; only the
+        misses go through the model, and their vectors are cached for next time.
+        
+        Args:
+            texts: Input texts
+            batch_size: Number of texts encoded together by the model
+            
+        Returns:
+            List of embedding vectors, aligned with texts
+        """
+        if not texts:
+            return []
+        if not self.model:
+            # Mock embeddings for testing
+            return [[0.1] * 768 for _ in texts]
+        
+        cache = self._embedding_cache()
+        if cache is None:
+            return self._encode(list(texts), batch_size).tolist()
+        
+        keys = [self._embedding_key(text) for text in texts]
+        cached = cache.get_many(keys)
+        missing = list(dict.fromkeys(text for text, key in zip(texts, keys) if key not in cached))
+        if missing:
+            fresh = {
+                self._embedding_key(text): vector.astype(np.float32).tobytes()
+                for text, vector in zip(missing, self._encode(missing, batch_size))
+            }
+            cache.set_many(fresh)
+            cached.update(fresh)
+        return [np.frombuffer(cached[key], dtype=np.float32).tolist() for key in keys]
+    
+    def _encode(self, texts: List[str], batch_size: int):
+        """Run the model on texts; vectors are normalized so similarity is a plain dot product"""
+        return self.model.encode(
+            texts, batch_size=batch_size, show_progress_bar=False,
+            convert_to_numpy=True, normalize_embeddings=True
+        )
+    
+    def _embedding_key(self, text: str) -> str:
+        """Content-addressed cache key: the same text under the same model always hits"""
+        digest = hashlib.blake2b(f"{self.model_name}\0{text}".encode('utf-8'), digest_size=32)
+        return f"emb:{digest.hexdigest()}"
+    
+    @staticmethod
+    def _embedding_cache():
+        """Return the embedding cache, or None when it is not configured"""
+        try:
+            return caches['embeddings']
+        except (InvalidCacheBackendError, ImproperlyConfigured):
+            return None
+    
     def calculate_similarity(self, embedding1: List[float], embedding2: List[float]) -> float:
         """
         Calculate cosine similarity between two embeddings
@@ -100,6 +458,86 @@ class VectorMatcher:
         
         return float(similarity)
     
+    def calculate_similarities(self, query_embedding, embeddings) -> List[float]:
+        """
+        Calculate cosine similarity between one embedding and many others at once
+        
+        Args:
+            query_embedding: Reference embedding vector (e.g. the job offer), as a list or float32 array
+            embeddings: Embedding vectors to compare, all with the query's dimension
+            
+        Returns:
+            List of similarity scores, one per embedding
+        """
+        if not NUMPY_AVAILABLE or query_embedding is None or not len(query_embedding):
+            # Mock similarity for testing
+            return [0.75] * len(embeddings)
+        if not len(embeddings):
+            return []
+        
+        # Copies, so read-only buffers from stored blobs are never modified
+        matrix = np.array(embeddings, dtype=np.float32)
+        query = np.array(query_embedding, dtype=np.float32)
+        
+        # Normalize rows and query so the dot product is the cosine similarity
+        norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+        matrix /= np.where(norms == 0, 1.0, norms)
+        query_norm = np.linalg.norm(query)
+        if query_norm:
+            query /= query_norm
+        
+        return (matrix @ query).tolist()
+    
+    def calculate_quantized_similarities(self, query_embedding, embeddings) -> List[float]:
+        """
+        Calculate cosine similarity between int8-quantized embeddings
+        
+        Cosine similarity ignores each vector's quantization scale, so the
+        scan runs on the int8 values directly with int32 accumulation.
+        
+        Args:
+            query_embedding: Quantized reference embedding (e.g. the job offer)
+            embeddings: Quantized embeddings to compare, all with the query's dimension
+            
+        Returns:
+            List of similarity scores, one per embedding
+        """
+        if not NUMPY_AVAILABLE or query_embedding is None or not len(query_embedding):
+            # Mock similarity for testing
+            return [0.75] * len(embeddings)
+        if not len(embeddings):
+            return []
+        
+        matrix = np.array(embeddings, dtype=np.int8).astype(np.int32)
+        query = np.asarray(query_embedding, dtype=np.int8).astype(np.int32)
+        
+        dots = matrix @ query
+        norms = np.sqrt(np.einsum('nd,nd->n', matrix, matrix) * float(query @ query))
+        return (dots / np.where(norms == 0, 1.0, norms)).tolist()
+    
+    def search_similar(self, query_embedding, embeddings, top_k: int | None = None) -> List[Tuple[int, float]]:
+        """
+        Find the int8-quantized embeddings most similar to a query
+        
+        Ranks the cosine similarities from the int8 scan of
+        calculate_quantized_similarities.
+        
+        Args:
+            query_embedding: Quantized reference embedding (e.g. the job offer)
+            embeddings: Quantized embeddings to search, all with the query's dimension
+            top_k: Number of results to return (all of them when None)
+            
+        Returns:
+            List of (embedding_index, similarity) tuples, most similar first
+        """
+        k = len(embeddings) if top_k is None else min(top_k, len(embeddings))
+        if k <= 0:
+            return []
+        
+        similarities = self.calculate_quantized_similarities(query_embedding, embeddings)
+        order = sorted(range(len(similarities)), key=lambda i: -similarities[i])[:k]
+        return [(i, similarities[i]) for i in order]
+    
     def match_candidate_to_job(self, candidate_text: str, job_text: str) -> float:
         """
         Calculate matching score between a candidate and a job
@@ -137,14 +575,18 @@ class VectorMatcher:
         candidate_embeddings = self.model.encode(candidate_texts)
         
         # Calculate similarities
-        scores = []
-        for i, candidate_emb in enumerate(candidate_embeddings):
-            similarity = 1 - cosine(job_embedding, candidate_emb)
-            scores.append((i, float(similarity)))
-        
-        # Sort by score and return top_k
-        scores.sort(key=lambda x: x[1], reverse=True)
-        return scores[:top_k]
+        scores = np.array([1 - cosine(job_embedding, candidate_emb) for candidate_emb in candidate_embeddings],
+                          dtype=np.float64)
+        
+        # Select the top_k in linear time with a partition instead of sorting every score;
+        # all ties with the k-th score are kept so the lowest indexes win, as with a stable sort
+        if 0 < top_k < len(scores):
+            kth_score = np.partition(scores, len(scores) - top_k)[len(scores) - top_k]
+            selected = np.flatnonzero(scores >= kth_score)
+        else:
+            selected = np.arange(len(scores))
+        order = selected[np.lexsort((selected, -scores[selected]))][:top_k]
+        return [(int(i), float(scores[i])) for i in order]
     
     def calculate_detailed_scores(self, candidate_data: Dict[str, Any], job_data: Dict[str, Any]) -> Dict[str, float]:
         """
@@ -157,164 +599,100 @@ class VectorMatcher:
         Returns:
             Dictionary with various matching scores
         """
-        scores = {}
-        
-        # Technical skills score (enhanced matching with synonyms and variations)
-        candidate_skills = set(skill.lower().strip() for skill in candidate_data.get('technical_skills', []) if skill)
-        job_skills = set(skill.lower().strip() for skill in job_data.get('required_skills', []) if skill)
-        
-        if job_skills:
-            # Enhanced skill matching with synonyms and variations
-            skill_synonyms = {
-                # Programming languages
-                'javascript': ['js', 'ecmascript', 'es6', 'es2015'],
-                'typescript': ['ts'],
-                'python': ['py', 'python3'],
-                'java': ['jvm', 'jdk'],
-                'c#': ['csharp', 'c-sharp', '.net'],
-                'c++': ['cpp', 'c-plus-plus'],
-                'php': ['hypertext preprocessor'],
-                'ruby': ['rails', 'ruby on rails'],
-                'go': ['golang'],
-                'swift': ['ios'],
-                'kotlin': ['android'],
-                'rust': ['rs'],
-                
-                # Web technologies
-                'html': ['html5', 'markup'],
-                'css': ['css3', 'sass', 'scss', 'less', 'stylus'],
-                'react': ['reactjs', 'react.js', 'jsx'],
-                'angular': ['angularjs', 'angular.js', 'ng'],
-                'vue': ['vuejs', 'vue.js', 'vuejs'],
-                'node.js': ['node', 'nodejs', 'backend javascript'],
-                'express': ['expressjs', 'express.js'],
-                'django': ['python django'],
-                'flask': ['python flask'],
-                'laravel': ['php laravel'],
-                'spring': ['spring boot', 'spring framework'],
-                'asp.net': ['.net core', 'aspnet'],
-                
-                # Databases
-                'sql': ['mysql', 'postgresql', 'postgres', 'sqlite', 'oracle', 'mssql'],
-                'nosql': ['mongodb', 'cassandra', 'redis', 'elasticsearch', 'dynamodb'],
-                'postgresql': ['postgres', 'psql'],
-                'mysql': ['mariadb'],
-                'mongodb': ['mongo', 'nosql mongodb'],
-                'redis': ['cache', 'in-memory database'],
-                
-                # Cloud platforms
-                'aws': ['amazon web services', 'ec2', 's3', 'lambda', 'rds'],
-                'azure': ['microsoft azure', 'azure cloud'],
-                'gcp': ['google cloud platform', 'google cloud'],
-                'docker': ['containers', 'containerization'],
-                'kubernetes': ['k8s', 'orchestration'],
-                
-                # DevOps tools
-                'jenkins': ['ci/cd', 'continuous integration'],
-                'git': ['version control', 'github', 'gitlab', 'bitbucket'],
-                'terraform': ['infrastructure as code', 'iac'],
-                'ansible': ['automation', 'configuration management'],
-                
-                # Frontend technologies
-                'bootstrap': ['css framework', 'responsive design'],
-                'tailwind': ['tailwind css', 'utility-first css'],
-                'webpack': ['bundler', 'module bundler'],
-                'babel': ['transpiler', 'javascript transpiler'],
-                
-                # Mobile development
-                'ios': ['iphone', 'ipad', 'objective-c'],
-                'android': ['android studio', 'mobile development'],
-                'react native': ['cross-platform mobile'],
-                'flutter': ['dart', 'cross-platform'],
-                
-                # Data science/AI
-                'tensorflow': ['deep learning', 'neural networks'],
-                'pytorch': ['machine learning', 'ai'],
-                'scikit-learn': ['sklearn', 'machine learning library'],
-                'pandas': ['data analysis', 'data manipulation'],
-                'numpy': ['numerical computing', 'scientific computing'],
-                
-                # Testing
-                'jest': ['javascript testing', 'unit testing'],
-                'pytest': ['python testing'],
-                'junit': ['java testing'],
-                'selenium': ['automated testing', 'web testing'],
-                
-                # Other technologies
-                'rest': ['rest api', 'restful', 'web api'],
-                'graphql': ['gql', 'query language'],
-                'microservices': ['microservice architecture'],
-                'agile': ['scrum', 'kanban', 'iterative development'],
-                'linux': ['unix', 'ubuntu', 'centos', 'debian'],
-                'windows': ['microsoft windows', 'win32'],
-                'macos': ['os x', 'mac', 'apple os']
-            }
-            
-            # Expand job skills with synonyms
-            expanded_job_skills = set(job_skills)
-            for skill in job_skills:
-                if skill in skill_synonyms:
-                    expanded_job_skills.update(skill_synonyms[skill])
-            
-            # Expand candidate skills with synonyms
-            expanded_candidate_skills = set(candidate_skills)
-            for skill in candidate_skills:
-                if skill in skill_synonyms:
-                    expanded_candidate_skills.update(skill_synonyms[skill])
-            
-            # Calculate matches with expanded skill sets
-            matched = expanded_candidate_skills & expanded_job_skills
-            
-            # Weight exact matches higher than synonym matches
-            exact_matches = candidate_skills & job_skills
-            synonym_matches = matched - exact_matches
-            
-            # Calculate score with weighting
-            if expanded_job_skills:
-                exact_score = len(exact_matches) / len(expanded_job_skills) * 1.0  # Full weight for exact matches
-                synonym_score = len(synonym_matches) / len(expanded_job_skills) * 0.7  # 70% weight for synonym matches
-                scores['technical_skills'] = min(1.0, exact_score + synonym_score)
-            else:
-                scores['technical_skills'] = 0.0
-        else:
-            # If job has no required skills, give partial credit based on candidate having skills
-            if candidate_skills:
-                scores['technical_skills'] = 0.5  # Partial credit
-            else:
-                scores['technical_skills'] = 0.0
-        
-        # Experience score
-        candidate_exp = candidate_data.get('experience_years', 0)
-        job_exp_required = job_data.get('required_experience_years', 0)
+        return self.score_against_context(candidate_data, self.build_job_context(job_data))
+    
+    @staticmethod
+    def canonical_id(skill: str, local_ids: Dict[str, int]) -> int:
+        """Return the id of a skill name, compared case-insensitively (see scoring_kernels.skill_id)"""
+        return skill_id(normalize_skill(skill), local_ids)
+    
+    def canonical_ids(self, skills: Iterable[str], local_ids: Dict[str, int] | None = None) -> frozenset:
+        """
+        Canonicalize skill names into a set of ids
         
-        if job_exp_required > 0:
-            exp_ratio = min(candidate_exp / job_exp_required, 1.0)
-            scores['experience'] = exp_ratio
-        else:
-            scores['experience'] = 1.0
+        Args:
+            skills: Skill names, in any case
+            local_ids: Ids of skills outside the known vocabulary; pass the same
+                table for skill lists that will be compared with each other
+            
+        Returns:
+            Frozenset of skill ids; overlaps between skill lists are then
+            integer set operations with no string work
+        """
+        if local_ids is None:
+            local_ids = {}
+        return frozenset(self.canonical_id(skill, local_ids) for skill in skills if skill)
+    
+    def build_job_context(self, job_data: Dict[str, Any], weights: Dict[str, float] | None = None) -> JobContext:
+        """
+        Precompute everything about a job that candidate scoring needs
         
-        scores['education'] = self._calculate_education_score(
-            candidate_data.get('education_level'),
-            job_data.get('required_education')
+        Args:
+            job_data: Dictionary with job information
+            weights: Optional overall score weights (see calculate_overall_score)
+            
+        Returns:
+            JobContext to pass to score_against_context for each candidate
+        """
+        job_skills = _normalize_skills(job_data.get('required_skills'))
+        expanded_skills = frozenset(_expand_skills(job_skills))
+        w = {**DEFAULT_MATCHING_WEIGHTS, **(weights or {})}
+        local_ids = {}
+        return JobContext(
+            skill_ids=encode_skills(job_skills, local_ids),
+            expanded_skill_ids=encode_skills(expanded_skills, local_ids),
+            expanded_skills=expanded_skills,
+            soft_skill_ids=encode_skills(_normalize_skills(job_data.get('required_soft_skills')), local_ids),
+            local_skill_ids=local_ids,
+            required_experience_years=float(job_data.get('required_experience_years', 0) or 0),
+            required_education_level=self._infer_degree_level(job_data.get('required_education')),
+            weights=tuple(float(w[name]) for name in DEFAULT_MATCHING_WEIGHTS),
+            weight_total=float(sum(w.values()) or 1.0),
         )
+    
+    def score_against_context(self, candidate_data: Dict[str, Any], context: JobContext) -> Dict[str, float]:
+        """
+        Calculate detailed matching scores against a prepared job context
         
-        # Soft skills score (enhanced matching)
-        candidate_soft = set(skill.lower().strip() for skill in candidate_data.get('soft_skills', []) if skill)
-        job_soft = set(skill.lower().strip() for skill in job_data.get('required_soft_skills', []) if skill)
+        Args:
+            candidate_data: Dictionary with candidate information
+            context: JobContext from build_job_context
+            
+        Returns:
+            Dictionary with various matching scores
+        """
+        # Technical skills (enhanced matching with synonyms and variations)
+        candidate_skills = _normalize_skills(candidate_data.get('technical_skills'))
+        # Skills the job does not know get ids of their own in a copy of its table
+        local_ids = dict(context.local_skill_ids)
+        candidate_ids = {skill_id(skill, local_ids) for skill in candidate_skills}
+        expanded_ids = _expand_skill_ids(candidate_ids)
+        if RAPIDFUZZ_AVAILABLE:
+            # Close spellings the synonym table misses (e.g. "postgre sql") earn synonym-level credit
+            fuzzy_matches = _fuzzy_matched_skills(_expand_skills(candidate_skills), context.expanded_skills)
+            expanded_ids.update(skill_id(skill, local_ids) for skill in fuzzy_matches)
         
-        if job_soft:
-            # Calculate soft skills match ratio
-            matched_soft = candidate_soft & job_soft
-            soft_score = len(matched_soft) / len(job_soft) if job_soft else 0.0
-            scores['soft_skills'] = soft_score
-        else:
-            # If job has no soft skills requirements, give partial credit for having soft skills
-            if candidate_soft:
-                scores['soft_skills'] = 0.3  # Partial credit for having soft skills
-            else:
-                scores['soft_skills'] = 0.0
+        # Set overlaps and score arithmetic run in the (JIT-compiled) kernel
+        technical, experience, soft = score_kernel(
+            encode_skill_ids(candidate_ids),
+            context.skill_ids,
+            encode_skill_ids(expanded_ids),
+            context.expanded_skill_ids,
+            encode_skills(_normalize_skills(candidate_data.get('soft_skills')), local_ids),
+            context.soft_skill_ids,
+            float(candidate_data.get('experience_years', 0) or 0),
+            context.required_experience_years,
+        )
         
-        return scores
+        return {
+            'technical_skills': float(technical),
+            'experience': float(experience),
+            'education': self._education_score_for_levels(
+                self._infer_degree_level(candidate_data.get('education_level')),
+                context.required_education_level
+            ),
+            'soft_skills': float(soft),
+        }
 
     def _normalize_education_text(self, education_data: Any) -> str:
         if not education_data:
@@ -355,9 +733,12 @@ class VectorMatcher:
         return 0.0
 
     def _calculate_education_score(self, candidate_education: Any, required_education: Any) -> float:
-        candidate_level = self._infer_degree_level(candidate_education)
-        required_level = self._infer_degree_level(required_education)
+        return self._education_score_for_levels(
+            self._infer_degree_level(candidate_education),
+            self._infer_degree_level(required_education)
+        )
 
+    def _education_score_for_levels(self, candidate_level: float, required_level: float) -> float:
         if required_level > 0:
             if candidate_level <= 0:
                 score = 0.2
@@ -387,32 +768,28 @@ class VectorMatcher:
             Overall score on a 0-100 scale.
         """
         # Defaults if settings not provided
-        default_weights = {
-            'similarity': 0.5,
-            'technical': 0.3,
-            'experience': 0.15,
-            'education': 0.05,
-            'soft_skills': 0.0,
-        }
-        w = {**default_weights, **(weights or {})}
-
-        tech = detailed_scores.get('technical_skills', 0.0)
-        exp = detailed_scores.get('experience', 0.0)
-        edu = detailed_scores.get('education', 0.0)
-        soft = detailed_scores.get('soft_skills', 0.0)
-
-        # Weighted sum
-        overall_0_1 = (
-            w['similarity'] * max(0.0, min(1.0, similarity)) +
-            w['technical'] * max(0.0, min(1.0, tech)) +
-            w['experience'] * max(0.0, min(1.0, exp)) +
-            w['education'] * max(0.0, min(1.0, edu)) +
-            w['soft_skills'] * max(0.0, min(1.0, soft))
+        w = {**DEFAULT_MATCHING_WEIGHTS, **(weights or {})}
+        return self._weighted_overall_score(
+            similarity, detailed_scores,
+            tuple(float(w[name]) for name in DEFAULT_MATCHING_WEIGHTS), float(sum(w.values()) or 1.0)
         )
 
-        # Normalize if weights don't sum to 1
-        total_w = sum(w.values()) or 1.0
-        overall_0_1 /= total_w
+    def overall_score_for_context(self, similarity: float, detailed_scores: Dict[str, float], context: JobContext) -> float:
+        """Same as calculate_overall_score, using the weights resolved in a JobContext"""
+        return self._weighted_overall_score(similarity, detailed_scores, context.weights, context.weight_total)
+
+    def _weighted_overall_score(self, similarity: float, detailed_scores: Dict[str, float],
+                                weights: Tuple[float, ...], total_weight: float) -> float:
+        # Coerce the scores here; the weighted sum itself runs in the (JIT-compiled) kernel
+        overall_0_1 = blend_kernel(
+            float(similarity),
+            float(detailed_scores.get('technical_skills', 0.0)),
+            float(detailed_scores.get('experience', 0.0)),
+            float(detailed_scores.get('education', 0.0)),
+            float(detailed_scores.get('soft_skills', 0.0)),
+            weights,
+            total_weight,
+        )
         return float(round(overall_0_1 * 100, 2))
     
     def generate_matching_explanation(self, candidate_data: Dict[str, Any], job_data: Dict[str, Any], scores: Dict[str, float]) -> Dict[str, Any]:
@@ -0,0 +1,21 @@
+"""
+Signal handlers for SmartRecruitAI
+"""
+
+from django.db.models.signals import post_save, post_delete
+from django.dispatch import receiver
+
+from .cache import rag_cache
+from .models import Candidate, JobOffer
+
+
+@receiver([post_save, post_delete], sender=Candidate)
+def invalidate_candidate_rag_cache(sender, instance, **kwargs):
+    """Discard generated content that was based on the old candidate data"""
+    rag_cache.invalidate(candidate_id=instance.pk)
+
+
+@receiver([post_save, post_delete], sender=JobOffer)
+def invalidate_job_offer_rag_cache(sender, instance, **kwargs):
+    """Discard generated content that was based on the old job offer data"""
+    rag_cache.invalidate(job_offer_id=instance.pk)
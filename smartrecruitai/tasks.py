@@ -0,0 +1,133 @@
+"""
+Background tasks for SmartRecruitAI
+Document and answer generation, run by Celery workers when available
+"""
+
+try:
+    from celery import shared_task
+    CELERY_AVAILABLE = True
+except ImportError:
+    CELERY_AVAILABLE = False
+
+    def shared_task(func):
+        """Fallback decorator: without Celery, tasks are plain functions"""
+        return func
+
+from .cache import rag_cache
+from .models import Conversation, GeneratedDocument, Message
+from .services.rag_engine import get_rag_engine
+
+
+def run_task(task, *args):
+    """
+    Queue a task, or run it inline when Celery is not installed
+
+    Args:
+        task: Task function defined in this module
+        *args: JSON-serializable task arguments
+
+    Returns:
+        Tuple of (task_id, result). task_id is None when the task already
+        ran (no Celery, or eager mode) and result holds its return value.
+    """
+    if not CELERY_AVAILABLE:
+        return None, task(*args)
+
+    async_result = task.delay(*args)
+    if async_result.ready():
+        return None, async_result.get()
+    return async_result.id, None
+
+
+def _finish_document(document, generate):
+    """Fill a pending document with generated content, or mark it failed"""
+    try:
+        content = generate()
+    except Exception:
+        document.status = 'failed'
+        document.save(update_fields=['status', 'updated_at'])
+        raise
+
+    document.content = content
+    document.status = 'ready'
+    document.save(update_fields=['content', 'status', 'updated_at'])
+    return content
+
+
+@shared_task
+def generate_summary_task(document_id):
+    """Generate the executive summary for a pending candidate_summary document"""
+    document = GeneratedDocument.objects.select_related('candidate', 'job_offer').get(pk=document_id)
+    candidate, job_offer = document.candidate, document.job_offer
+    candidate_data = {
+        'full_name': candidate.full_name,
+        'technical_skills': candidate.technical_skills,
+        'experience_years': candidate.total_experience_years,
+        'current_position': candidate.current_position,
+        'education_level': candidate.education_level,
+        'soft_skills': candidate.soft_skills,
+    }
+    job_data = {
+        'title': job_offer.title,
+        'required_skills': job_offer.required_skills,
+        'required_experience_years': job_offer.required_experience_years,
+    }
+
+    summary = _finish_document(
+        document, lambda: get_rag_engine().generate_candidate_summary(candidate_data, job_data)
+    )
+    # The RAG cache is a Django cache, so with a shared backend the web process serves this next time
+    rag_cache.put(
+        rag_cache.make_key('candidate_summary', candidate.id, job_offer.id), summary,
+        candidate_id=candidate.id, job_offer_id=job_offer.id
+    )
+    return summary
+
+
+@shared_task
+def generate_email_task(document_id):
+    """Generate the contact email for a pending contact_email document"""
+    document = GeneratedDocument.objects.select_related('candidate', 'job_offer', 'match').get(pk=document_id)
+    candidate, job_offer, match = document.candidate, document.job_offer, document.match
+    candidate_data = {
+        'full_name': candidate.full_name,
+        'technical_skills': candidate.technical_skills,
+    }
+    job_data = {
+        'title': job_offer.title,
+    }
+
+    email_content = _finish_document(
+        document, lambda: get_rag_engine().generate_email_content(candidate_data, job_data, match.overall_score / 100)
+    )
+    rag_cache.put(
+        rag_cache.make_key('contact_email', candidate.id, job_offer.id, round(match.overall_score, 1)), email_content,
+        candidate_id=candidate.id, job_offer_id=job_offer.id
+    )
+    return email_content
+
+
+@shared_task
+def answer_question_task(conversation_id, question):
+    """Answer a question about the conversation's candidate and store the reply"""
+    conversation = Conversation.objects.select_related('candidate').get(pk=conversation_id)
+    candidate = conversation.candidate
+    candidate_data = {
+        'technical_skills': candidate.technical_skills,
+        'experience_years': candidate.total_experience_years,
+        'education_level': candidate.education_level,
+        'soft_skills': candidate.soft_skills,
+        'availability': candidate.availability,
+    }
+
+    answer = get_rag_engine().answer_question(question, candidate_data)
+    Message.objects.create(
+        conversation=conversation,
+        role='assistant',
+        content=answer
+    )
+    rag_cache.put(
+        rag_cache.make_key('answer', candidate.id, None, question.strip().lower()), answer,
+        candidate_id=candidate.id
+    )
+    return answer
@@ -8,7 +8,7 @@ from .views import (
     CandidateViewSet, JobOfferViewSet, MatchViewSet,
     ConversationViewSet, CVViewSet, cv_upload_page,
     create_job_offer_page, list_job_offers_page, match_cv_page,
-    cv_ranking_page, hr_dashboard_page, hr_dashboard_data
+    cv_ranking_page, hr_dashboard_page, hr_dashboard_data, health_check
 )
 
 router = DefaultRouter()
@@ -21,6 +21,7 @@ router.register(r'cvs', CVViewSet, basename='cv')
 urlpatterns = [
     path('api/', include(router.urls)),
     path('api/hr-dashboard-data/', hr_dashboard_data, name='hr_dashboard_data'),
+    path('api/health/', health_check, name='health_check'),
     path('upload-cv/', cv_upload_page, name='cv_upload'),
     path('create-job/', create_job_offer_page, name='create_job'),
     path('list-jobs/', list_job_offers_page, name='list_jobs'),
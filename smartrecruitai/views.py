@@ -10,9 +10,23 @@ from rest_framework.decorators import action
 from rest_framework.response import Response
 from rest_framework.permissions import IsAuthenticated
 from django.contrib.auth.models import User
+from django.core.files.uploadedfile import TemporaryUploadedFile
+from django.core.files.uploadhandler import TemporaryFileUploadHandler
+from django.db import connection, transaction
 from django.db.models import Q, Count
+from django.db.models.expressions import RawSQL
 from django.db.models.functions import TruncMonth
+from django.utils import timezone
+import gzip
 import json
+import os
+import re
+import shutil
+import tempfile
+import time
+import uuid
+from urllib.parse import unquote
+import numpy as np
 
 from .models import (
     Recruiter, Candidate, CV, JobOffer, Match,
@@ -24,10 +38,84 @@ from .serializers.serializers import (
     MessageSerializer, GeneratedDocumentSerializer
 )
 from .services import NLPExtractor, VectorMatcher, RAGEngine, CVParser
+from .services.rag_engine import get_rag_engine
+from .services.scoring_kernels import soft_skill_mask
 from django.conf import settings
 from .mixins import CSRFExemptMixin
+from .cache import rag_cache
+from .tasks import run_task, generate_summary_task, generate_email_task, answer_question_task
 
 
+# Candidate fields read by the ranking endpoint
+RANKING_CANDIDATE_FIELDS = (
+    'id', 'full_name', 'email', 'current_position', 'total_experience_years',
+    'technical_skills', 'soft_skills', 'education_level', 'languages',
+    'certifications', 'cv_text', 'professional_links', 'embedding_i8',
+)
+
+# "Content-Range: bytes start-end/total" header of a chunked CV upload part
+CONTENT_RANGE_RE = re.compile(r'^bytes (\d+)-(\d+)/(\d+)$')
+# Buffer size used when copying upload parts to and from disk
+CHUNK_COPY_SIZE = 1024 * 1024
+
+
+def _skill_overlap(field_name, skills):
+    """
+    Build an annotation counting the distinct entries of a JSON skill list found in skills
+    
+    The intersection runs inside the database, next to the row data.
+    
+    Args:
+        field_name: Name of a Candidate JSONField holding a list of strings
+        skills: Skills to intersect with
+        
+    Returns:
+        Expression for annotate(), or None when the database has no JSON array functions
+    """
+    column = f'{connection.ops.quote_name(Candidate._meta.db_table)}.{connection.ops.quote_name(field_name)}'
+    skills = list(dict.fromkeys(skills))
+    # Rows whose field is null or not a JSON array (e.g. a bare string) count as no overlap
+    if connection.vendor == 'sqlite':
+        if not skills:
+            return RawSQL('0', [])
+        placeholders = ', '.join(['%s'] * len(skills))
+        return RawSQL(
+            f"(CASE WHEN json_type({column}) = 'array' THEN "
+            f"(SELECT COUNT(DISTINCT value) FROM json_each({column}) WHERE value IN ({placeholders})) "
+            f"ELSE 0 END)", skills
+        )
+    if connection.vendor == 'postgresql':
+        return RawSQL(
+            f"(CASE WHEN jsonb_typeof({column}) = 'array' THEN "
+            f"(SELECT COUNT(DISTINCT skill) FROM jsonb_array_elements_text({column}) AS skill "
+            f"WHERE skill = ANY(%s::text[])) "
+            f"ELSE 0 END)", [skills]
+        )
+    return None
+
+
+def _backfill_candidate_embeddings(candidates, vector_matcher):
+    """
+    Embed the CV text of every candidate that has no embedding yet
+    
+    All missing embeddings are generated in one batched model call and
+    written back with a single bulk update.
+    
+    Args:
+        candidates: Candidate instances, updated in place
+        vector_matcher: VectorMatcher used to generate the embeddings
+    """
+    missing = [c for c in candidates if not len(c.get_embedding_i8()) and c.cv_text]
+    if not missing:
+        return
+    
+    embeddings = vector_matcher.generate_embeddings_batch([c.cv_text for c in missing])
+    now = timezone.now()
+    for candidate, embedding in zip(missing, embeddings):
+        candidate.set_embedding(embedding)
+        candidate.updated_at = now
+    Candidate.objects.bulk_update(missing, [*Candidate.embedding_fields, 'updated_at'])
+
 @ensure_csrf_cookie
 def cv_upload_page(request):
     """Serve the CV upload test page"""
@@ -64,6 +152,15 @@ def hr_dashboard_page(request):
     return render(request, 'hr_dashboard_modern.html')
 
 
+def health_check(request):
+    """Report whether the server and its database are reachable (also answers HEAD, e.g. to pre-open a connection)."""
+    try:
+        connection.ensure_connection()
+    except Exception as e:
+        return JsonResponse({'status': 'error', 'database': str(e)}, status=503)
+    return JsonResponse({'status': 'ok'})
+
+
 def hr_dashboard_data(request):
     """Return live HR dashboard metrics as JSON."""
     job_offers = JobOffer.objects.all()
@@ -131,115 +228,327 @@ class CandidateViewSet(CSRFExemptMixin, viewsets.ModelViewSet):
     serializer_class = CandidateSerializer
     permission_classes = []  # Allow anonymous access for testing
     
+    # Actions whose request body carries a CV file
+    cv_upload_actions = ('upload_cv_direct', 'upload_cv')
+    
+    def initialize_request(self, request, *args, **kwargs):
+        drf_request = super().initialize_request(request, *args, **kwargs)
+        if self.action in self.cv_upload_actions:
+            # Stream CV uploads to a temporary file chunk by chunk instead of
+            # buffering them in memory; the body has not been parsed yet here
+            request.upload_handlers = [TemporaryFileUploadHandler(request)]
+        return drf_request
+    
     @action(detail=False, methods=['post'])
     def upload_cv_direct(self, request):
-        """Upload a CV and create candidate automatically"""
-        if 'file' not in request.FILES:
+        """
+        Upload one or more CVs and create a candidate for each
+        
+        Several CVs can be sent in one request under repeated 'file' fields;
+        their embeddings are generated in one batch and the candidates created
+        in one transaction. A single file gets the single-candidate response,
+        several files a 'results' list plus the per-file 'errors'.
+        """
+        uploaded_files = request.FILES.getlist('file')
+        if not uploaded_files:
             return Response({'error': 'No file provided'}, status=status.HTTP_400_BAD_REQUEST)
         
-        uploaded_file = request.FILES['file']
+        return self._create_candidates_from_uploads(request, uploaded_files)
+    
+    @action(detail=False, methods=['post'])
+    def upload_cv_raw(self, request):
+        """
+        Upload a CV sent as the raw request body and create a candidate
+        
+        Without multipart encoding, clients can send the file straight from
+        disk (e.g. with sendfile), or gzip it with "Content-Encoding: gzip".
+        The file name comes from the URL-encoded X-Filename header; the
+        response matches upload_cv_direct.
+        """
+        file_name = os.path.basename(unquote(request.headers.get('X-Filename', '')))
+        if not file_name:
+            return Response({'error': 'X-Filename header is required'}, status=status.HTTP_400_BAD_REQUEST)
+        if request.stream is None:
+            return Response({'error': 'No file provided'}, status=status.HTTP_400_BAD_REQUEST)
         
+        content_encoding = request.headers.get('Content-Encoding', 'identity').strip().lower()
+        if content_encoding not in ('identity', 'gzip'):
+            return Response(
+                {'error': f'Unsupported Content-Encoding: {content_encoding}'},
+                status=status.HTTP_415_UNSUPPORTED_MEDIA_TYPE
+            )
+        
+        # request.stream bypasses Django's upload limits, so the body is bounded here
+        too_large = Response(
+            {'error': f'CV is larger than {settings.CV_UPLOAD_MAX_SIZE} bytes'},
+            status=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE
+        )
+        content_length = request.headers.get('Content-Length', '')
+        if content_length.isdigit() and int(content_length) > settings.CV_UPLOAD_MAX_SIZE:
+            return too_large
+        
+        uploaded_file = TemporaryUploadedFile(file_name, 'application/octet-stream', 0, None)
         try:
-            # Create a temporary candidate first
-            candidate = Candidate.objects.create(
-                full_name="Processing...",
-                email="processing@temp.com"
+            body = gzip.GzipFile(fileobj=request.stream) if content_encoding == 'gzip' else request.stream
+            # Copy (and decode) at most one byte past the limit, enough to tell the CV is too large
+            try:
+                while chunk := body.read(min(CHUNK_COPY_SIZE, settings.CV_UPLOAD_MAX_SIZE + 1 - uploaded_file.tell())):
+                    uploaded_file.write(chunk)
+                    if uploaded_file.tell() > settings.CV_UPLOAD_MAX_SIZE:
+                        return too_large
+            except (OSError, EOFError) as e:
+                return Response({'error': f'Invalid {content_encoding} body: {e}'}, status=status.HTTP_400_BAD_REQUEST)
+            uploaded_file.size = uploaded_file.tell()
+            uploaded_file.seek(0)
+            return self._create_candidates_from_uploads(request, [uploaded_file])
+        finally:
+            uploaded_file.close()
+    
+    @action(detail=False, methods=['put'])
+    def upload_cv_chunk(self, request):
+        """
+        Store one part of a chunked CV upload
+        
+        The raw request body is the part; its position in the file is given by
+        a "Content-Range: bytes start-end/total" header and the upload by the
+        upload_id query parameter (a client-generated UUID). Parts can arrive
+        in any order and be re-sent; complete_cv_upload assembles them.
+        """
+        parts_dir = self._upload_parts_dir(request.query_params.get('upload_id'))
+        content_range = CONTENT_RANGE_RE.match(request.headers.get('Content-Range', ''))
+        if parts_dir is None or content_range is None:
+            return Response(
+                {'error': 'upload_id (UUID) and a "Content-Range: bytes start-end/total" header are required'},
+                status=status.HTTP_400_BAD_REQUEST
             )
-            
-            # Save CV file
-            cv = CV.objects.create(
-                candidate=candidate,
-                file_name=uploaded_file.name,
-                file_type=uploaded_file.name.split('.')[-1].lower(),
-                uploaded_by=request.user if request.user.is_authenticated else None,
-                extraction_status='processing',
+        
+        start, end, total = (int(value) for value in content_range.groups())
+        if not start <= end < total:
+            return Response({'error': 'Invalid Content-Range'}, status=status.HTTP_400_BAD_REQUEST)
+        if total > settings.CV_UPLOAD_MAX_SIZE:
+            return Response(
+                {'error': f'CV is larger than {settings.CV_UPLOAD_MAX_SIZE} bytes'},
+                status=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE
             )
+        
+        # The first part of a new upload clears out uploads that were abandoned
+        if not os.path.isdir(parts_dir):
+            self._sweep_stale_upload_parts()
+        
+        # Parts are named after their byte range, so a re-sent part replaces itself;
+        # a part only gets its name once it has fully arrived
+        os.makedirs(parts_dir, exist_ok=True)
+        part_path = os.path.join(parts_dir, f'{start:015d}-{end:015d}-{total:015d}')
+        partial_path = f'{part_path}.{uuid.uuid4().hex}.partial'
+        expected = end - start + 1
+        try:
+            with open(partial_path, 'wb') as part_file:
+                # Read at most one byte past the part, enough to tell that a body is too long
+                received = 0
+                while request.stream is not None and received <= expected:
+                    chunk = request.stream.read(min(CHUNK_COPY_SIZE, expected + 1 - received))
+                    if not chunk:
+                        break
+                    part_file.write(chunk)
+                    received += len(chunk)
             
-            # Process CV (in production, this would be async via Celery)
+            if received != expected:
+                return Response(
+                    {'error': f'Expected {expected} bytes for this part, received {received}'},
+                    status=status.HTTP_400_BAD_REQUEST
+                )
+            os.replace(partial_path, part_path)
+        finally:
+            if os.path.exists(partial_path):
+                os.unlink(partial_path)
+        
+        return Response({'upload_id': request.query_params['upload_id'], 'received': received})
+    
+    @action(detail=False, methods=['post'])
+    def complete_cv_upload(self, request):
+        """
+        Assemble the parts of a chunked CV upload and create the candidate
+        
+        Expects upload_id and file_name. If parts are missing, nothing is
+        assembled and the missing byte ranges are returned so the client can
+        re-send them; otherwise the response matches upload_cv_direct.
+        """
+        upload_id = request.data.get('upload_id')
+        parts_dir = self._upload_parts_dir(upload_id)
+        file_name = os.path.basename(request.data.get('file_name') or '')
+        if parts_dir is None or not file_name:
+            return Response({'error': 'upload_id (UUID) and file_name are required'}, status=status.HTTP_400_BAD_REQUEST)
+        if not os.path.isdir(parts_dir):
+            return Response({'error': 'Unknown upload_id'}, status=status.HTTP_404_NOT_FOUND)
+        
+        parts = []
+        for name in os.listdir(parts_dir):
+            if name.endswith('.partial'):
+                continue
+            start, end, total = (int(value) for value in name.split('-'))
+            parts.append((start, end, total, os.path.join(parts_dir, name)))
+        parts.sort()
+        if not parts:
+            return Response({'error': 'No parts uploaded yet', 'missing': []}, status=status.HTTP_400_BAD_REQUEST)
+        
+        # Walk the parts in order, collecting the byte ranges nobody sent
+        total = parts[0][2]
+        missing, position = [], 0
+        for start, end, part_total, _ in parts:
+            if part_total != total:
+                return Response({'error': 'Parts disagree on the total size'}, status=status.HTTP_400_BAD_REQUEST)
+            if start > position:
+                missing.append(f'{position}-{start - 1}')
+            position = max(position, end + 1)
+        if position < total:
+            missing.append(f'{position}-{total - 1}')
+        if missing:
+            return Response({'error': 'Upload is incomplete', 'missing': missing}, status=status.HTTP_400_BAD_REQUEST)
+        
+        # Stitch the parts into a temporary upload file, skipping any overlap
+        assembled = TemporaryUploadedFile(file_name, 'application/octet-stream', total, None)
+        try:
+            position = 0
+            for start, end, _, part_path in parts:
+                if end < position:
+                    continue
+                with open(part_path, 'rb') as part_file:
+                    part_file.seek(position - start)
+                    shutil.copyfileobj(part_file, assembled, CHUNK_COPY_SIZE)
+                position = end + 1
+            assembled.seek(0)
+            response = self._create_candidates_from_uploads(request, [assembled])
+        finally:
+            assembled.close()
+        
+        # A rejected CV would be rejected again, so only keep the parts after a
+        # server error, when completing again may succeed
+        if response.status_code < 500:
+            shutil.rmtree(parts_dir, ignore_errors=True)
+        return response
+    
+    def _upload_parts_dir(self, upload_id):
+        """Directory holding the parts of a chunked upload, or None if upload_id is not a UUID"""
+        try:
+            return os.path.join(settings.CV_UPLOAD_PARTS_DIR, uuid.UUID(str(upload_id)).hex)
+        except ValueError:
+            return None
+    
+    def _sweep_stale_upload_parts(self):
+        """Delete the parts of chunked uploads that received nothing for CV_UPLOAD_PARTS_MAX_AGE"""
+        cutoff = time.time() - settings.CV_UPLOAD_PARTS_MAX_AGE
+        try:
+            entries = list(os.scandir(settings.CV_UPLOAD_PARTS_DIR))
+        except FileNotFoundError:
+            return
+        for entry in entries:
             try:
-                # Handle both in-memory and temporary file uploads
-                if hasattr(uploaded_file, 'temporary_file_path'):
-                    # File is saved to temporary location
-                    cv_text = CVParser().extract_text(uploaded_file.temporary_file_path())
-                else:
-                    # File is in memory, save it temporarily
-                    import tempfile
-                    import os
-                    
-                    # Create temporary file
-                    with tempfile.NamedTemporaryFile(delete=False, suffix=f'.{uploaded_file.name.split(".")[-1]}') as temp_file:
-                        # Write uploaded file content to temporary file
-                        for chunk in uploaded_file.chunks():
-                            temp_file.write(chunk)
-                        temp_file_path = temp_file.name
+                if entry.is_dir() and entry.stat().st_mtime < cutoff:
+                    shutil.rmtree(entry.path, ignore_errors=True)
+            except FileNotFoundError:
+                continue
+    
+    def _create_candidates_from_uploads(self, request, uploaded_files):
+        """Parse uploaded CV files and create a candidate for each (see upload_cv_direct)"""
+        try:
+            # Parse and extract before touching the database so a failed
+            # upload never leaves a placeholder candidate behind
+            nlp_extractor = NLPExtractor.get()
+            parsed, errors = [], []
+            for uploaded_file in uploaded_files:
+                try:
+                    cv_text = self._extract_text_from_upload(uploaded_file)
+                    parsed.append((uploaded_file, cv_text, nlp_extractor.extract_cv_data(cv_text)))
+                except Exception as e:
+                    errors.append({'file_name': uploaded_file.name, 'error': str(e)})
+            
+            # Generate embeddings for every parsed CV at once
+            vector_matcher = VectorMatcher.get()
+            embeddings = vector_matcher.generate_embeddings_batch([cv_text for _, cv_text, _ in parsed])
+            
+            # Create candidates and CV records with the full data in one transaction
+            results = []
+            with transaction.atomic():
+                for (uploaded_file, cv_text, extracted_data), embedding in zip(parsed, embeddings):
+                    candidate = Candidate(
+                        full_name=self._extract_name_from_cv(cv_text),
+                        email=self._extract_email_from_cv(cv_text),
+                        **self._candidate_fields_from_extraction(cv_text, extracted_data)
+                    )
+                    candidate.set_embedding(embedding)
+                    candidate.save()
                     
-                    try:
-                        # Extract text from temporary file
-                        cv_text = CVParser().extract_text(temp_file_path)
-                    finally:
-                        # Clean up temporary file
-                        if os.path.exists(temp_file_path):
-                            os.unlink(temp_file_path)
-                
-                # Extract structured data
-                nlp_extractor = NLPExtractor()
-                extracted_data = nlp_extractor.extract_cv_data(cv_text)
-                
-                # Extract professional links
-                professional_links = extracted_data.get('professional_links', {})
-                
-                # Update candidate with extracted data
-                candidate.cv_text = cv_text
-                candidate.technical_skills = extracted_data.get('technical_skills', [])
-                candidate.soft_skills = extracted_data.get('soft_skills', [])
-                candidate.total_experience_years = extracted_data.get('experience_years', 0)
-                candidate.education_level = str(extracted_data.get('education', []))
-                candidate.languages = extracted_data.get('languages', [])
-                candidate.certifications = extracted_data.get('certifications', [])
-                
-                # Save professional links
-                candidate.professional_links = professional_links
-                candidate.linkedin_url = professional_links.get('linkedin', [''])[0] if professional_links.get('linkedin') else ''
-                candidate.github_url = professional_links.get('github', [''])[0] if professional_links.get('github') else ''
-                candidate.gitlab_url = professional_links.get('gitlab', [''])[0] if professional_links.get('gitlab') else ''
-                candidate.portfolio_urls = professional_links.get('portfolio', [])
-                
-                # Try to extract name and email from CV text
-                candidate.full_name = self._extract_name_from_cv(cv_text)
-                candidate.email = self._extract_email_from_cv(cv_text)
-                
-                candidate.save()
-                
-                # Generate embedding
-                vector_matcher = VectorMatcher()
-                candidate.embedding = vector_matcher.generate_embedding(cv_text)
-                candidate.save()
-                
-                # Update CV record
-                cv.extracted_data = extracted_data
-                cv.extraction_status = 'completed'
-                cv.save()
-                
-                return Response({
-                    'message': 'CV processed successfully',
-                    'candidate_id': candidate.id,
-                    'cv_id': cv.id,
-                    'extracted_data': extracted_data,
-                    'candidate': CandidateSerializer(candidate).data
-                }, status=status.HTTP_201_CREATED)
-            
-            except Exception as e:
-                cv.extraction_status = 'failed'
-                cv.extraction_error = str(e)
-                cv.save()
-                
-                # Delete the candidate if processing failed
-                candidate.delete()
-                
-                return Response({'error': str(e)}, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
+                    cv = CV.objects.create(
+                        candidate=candidate,
+                        file_name=uploaded_file.name,
+                        file_type=uploaded_file.name.split('.')[-1].lower(),
+                        uploaded_by=request.user if request.user.is_authenticated else None,
+                        extraction_status='completed',
+                        extracted_data=extracted_data,
+                    )
+                    results.append({
+                        'message': 'CV processed successfully',
+                        'candidate_id': candidate.id,
+                        'cv_id': cv.id,
+                        'extracted_data': extracted_data,
+                        'candidate': CandidateSerializer(candidate).data
+                    })
         
         except Exception as e:
             return Response({'error': str(e)}, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
+        
+        if len(uploaded_files) == 1:
+            if errors:
+                return Response({'error': errors[0]['error']}, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
+            return Response(results[0], status=status.HTTP_201_CREATED)
+        
+        return Response({
+            'message': f'{len(results)} of {len(uploaded_files)} CVs processed successfully',
+            'results': results,
+            'errors': errors,
+        }, status=status.HTTP_201_CREATED if results else status.HTTP_500_INTERNAL_SERVER_ERROR)
+    
+    def _extract_text_from_upload(self, uploaded_file) -> str:
+        """Extract text from an uploaded CV file"""
+        # Handle both in-memory and temporary file uploads
+        if hasattr(uploaded_file, 'temporary_file_path'):
+            # File is saved to temporary location
+            return CVParser().extract_text(uploaded_file.temporary_file_path())
+        
+        # File is in memory, save it to a temporary file
+        with tempfile.NamedTemporaryFile(delete=False, suffix=f'.{uploaded_file.name.split(".")[-1]}') as temp_file:
+            # Write uploaded file content to temporary file
+            for chunk in uploaded_file.chunks():
+                temp_file.write(chunk)
+            temp_file_path = temp_file.name
+        
+        try:
+            # Extract text from temporary file
+            return CVParser().extract_text(temp_file_path)
+        finally:
+            # Clean up temporary file
+            if os.path.exists(temp_file_path):
+                os.unlink(temp_file_path)
+    
+    def _candidate_fields_from_extraction(self, cv_text: str, extracted_data: dict) -> dict:
+        """Map extracted CV data onto Candidate model fields"""
+        professional_links = extracted_data.get('professional_links', {})
+        return {
+            'cv_text': cv_text,
+            'technical_skills': extracted_data.get('technical_skills', []),
+            'soft_skills': extracted_data.get('soft_skills', []),
+            'total_experience_years': extracted_data.get('experience_years', 0),
+            'education_level': str(extracted_data.get('education', [])),
+            'languages': extracted_data.get('languages', []),
+            'certifications': extracted_data.get('certifications', []),
+            
+            # Professional links
+            'professional_links': professional_links,
+            'linkedin_url': professional_links.get('linkedin', [''])[0] if professional_links.get('linkedin') else '',
+            'github_url': professional_links.get('github', [''])[0] if professional_links.get('github') else '',
+            'gitlab_url': professional_links.get('gitlab', [''])[0] if professional_links.get('gitlab') else '',
+            'portfolio_urls': professional_links.get('portfolio', []),
+        }
     
     def _extract_name_from_cv(self, cv_text: str) -> str:
         """Extract candidate name from CV text"""
@@ -269,73 +578,39 @@ class CandidateViewSet(CSRFExemptMixin, viewsets.ModelViewSet):
             return Response({'error': 'No file provided'}, status=status.HTTP_400_BAD_REQUEST)
         
         uploaded_file = request.FILES['file']
-        
-        # Save CV file
-        cv = CV.objects.create(
-            candidate=candidate,
-            file_name=uploaded_file.name,
-            file_type=uploaded_file.name.split('.')[-1].lower(),
-            uploaded_by=request.user if request.user.is_authenticated else None,
-            extraction_status='processing',
-        )
+        cv_fields = {
+            'candidate': candidate,
+            'file_name': uploaded_file.name,
+            'file_type': uploaded_file.name.split('.')[-1].lower(),
+            'uploaded_by': request.user if request.user.is_authenticated else None,
+        }
         
         # Process CV (in production, this would be async via Celery)
         try:
-            # Handle both in-memory and temporary file uploads
-            if hasattr(uploaded_file, 'temporary_file_path'):
-                # File is saved to temporary location
-                cv_text = CVParser().extract_text(uploaded_file.temporary_file_path())
-            else:
-                # File is in memory, save it temporarily
-                import tempfile
-                import os
-                
-                # Create temporary file
-                with tempfile.NamedTemporaryFile(delete=False, suffix=f'.{uploaded_file.name.split(".")[-1]}') as temp_file:
-                    # Write uploaded file content to temporary file
-                    for chunk in uploaded_file.chunks():
-                        temp_file.write(chunk)
-                    temp_file_path = temp_file.name
-                
-                try:
-                    # Extract text from temporary file
-                    cv_text = CVParser().extract_text(temp_file_path)
-                finally:
-                    # Clean up temporary file
-                    if os.path.exists(temp_file_path):
-                        os.unlink(temp_file_path)
+            cv_text = self._extract_text_from_upload(uploaded_file)
             
             # Extract structured data
-            nlp_extractor = NLPExtractor()
+            nlp_extractor = NLPExtractor.get()
             extracted_data = nlp_extractor.extract_cv_data(cv_text)
             
-            # Update candidate with extracted data
-            candidate.cv_text = cv_text
-            candidate.technical_skills = extracted_data.get('technical_skills', [])
-            candidate.soft_skills = extracted_data.get('soft_skills', [])
-            candidate.total_experience_years = extracted_data.get('experience_years', 0)
-            candidate.education_level = str(extracted_data.get('education', []))
-            candidate.languages = extracted_data.get('languages', [])
-            candidate.certifications = extracted_data.get('certifications', [])
-            
-            # Save professional links
-            professional_links = extracted_data.get('professional_links', {})
-            candidate.professional_links = professional_links
-            candidate.linkedin_url = professional_links.get('linkedin', [''])[0] if professional_links.get('linkedin') else ''
-            candidate.github_url = professional_links.get('github', [''])[0] if professional_links.get('github') else ''
-            candidate.gitlab_url = professional_links.get('gitlab', [''])[0] if professional_links.get('gitlab') else ''
-            candidate.portfolio_urls = professional_links.get('portfolio', [])
-            candidate.save()
-            
             # Generate embedding
-            vector_matcher = VectorMatcher()
-            candidate.embedding = vector_matcher.generate_embedding(cv_text)
-            candidate.save()
+            vector_matcher = VectorMatcher.get()
+            embedding = vector_matcher.generate_embedding(cv_text)
             
-            # Update CV record
-            cv.extracted_data = extracted_data
-            cv.extraction_status = 'completed'
-            cv.save()
+            # Persist candidate update and CV record in a single transaction
+            candidate_fields = self._candidate_fields_from_extraction(cv_text, extracted_data)
+            with transaction.atomic():
+                candidate = Candidate.objects.select_for_update().get(pk=candidate.pk)
+                for field, value in candidate_fields.items():
+                    setattr(candidate, field, value)
+                candidate.set_embedding(embedding)
+                candidate.save(update_fields=[*candidate_fields, *Candidate.embedding_fields, 'updated_at'])
+                
+                cv = CV.objects.create(
+                    extraction_status='completed',
+                    extracted_data=extracted_data,
+                    **cv_fields
+                )
             
             return Response({
                 'message': 'CV processed successfully',
@@ -344,9 +619,11 @@ class CandidateViewSet(CSRFExemptMixin, viewsets.ModelViewSet):
             }, status=status.HTTP_201_CREATED)
         
         except Exception as e:
-            cv.extraction_status = 'failed'
-            cv.extraction_error = str(e)
-            cv.save()
+            CV.objects.create(
+                extraction_status='failed',
+                extraction_error=str(e),
+                **cv_fields
+            )
             return Response({'error': str(e)}, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
     
     @action(detail=True, methods=['get'])
@@ -418,7 +695,7 @@ class JobOfferViewSet(CSRFExemptMixin, viewsets.ModelViewSet):
         
         # Process requirements to extract additional data
         try:
-            nlp_extractor = NLPExtractor()
+            nlp_extractor = NLPExtractor.get()
             job_text = f"{job_offer.description} {job_offer.requirements}"
             extracted = nlp_extractor.extract_job_requirements(job_text)
             
@@ -474,7 +751,7 @@ class JobOfferViewSet(CSRFExemptMixin, viewsets.ModelViewSet):
         requirements = job_offer.requirements
         
         # Extract requirements using NLP
-        nlp_extractor = NLPExtractor()
+        nlp_extractor = NLPExtractor.get()
         extracted = nlp_extractor.extract_job_requirements(description + " " + requirements)
         
         # Update job offer
@@ -482,13 +759,15 @@ class JobOfferViewSet(CSRFExemptMixin, viewsets.ModelViewSet):
         job_offer.required_skills = extracted.get('required_skills', [])
         job_offer.required_experience_years = extracted.get('required_experience_years', 0)
         job_offer.required_education = self._extract_primary_education(extracted.get('required_education'))
-        job_offer.save()
         
         # Generate embedding
-        vector_matcher = VectorMatcher()
+        vector_matcher = VectorMatcher.get()
         job_text = f"{description} {requirements}"
-        job_offer.embedding = vector_matcher.generate_embedding(job_text)
-        job_offer.save()
+        job_offer.set_embedding(vector_matcher.generate_embedding(job_text))
+        job_offer.save(update_fields=[
+            'extracted_requirements', 'required_skills', 'required_experience_years',
+            'required_education', *JobOffer.embedding_fields, 'updated_at',
+        ])
         
         return Response({
             'message': 'Job requirements processed',
@@ -504,15 +783,15 @@ class JobOfferViewSet(CSRFExemptMixin, viewsets.ModelViewSet):
             # Ensure job offer has an embedding
             if not job_offer.embedding:
                 # Generate embedding if missing
-                vector_matcher = VectorMatcher()
+                vector_matcher = VectorMatcher.get()
                 job_text = f"{job_offer.description} {job_offer.requirements}"
-                job_offer.embedding = vector_matcher.generate_embedding(job_text)
-                job_offer.save()
+                job_offer.set_embedding(vector_matcher.generate_embedding(job_text))
+                job_offer.save(update_fields=[*JobOffer.embedding_fields, 'updated_at'])
             
             # Get all active candidates
-            candidates = Candidate.objects.filter(status='active')
+            candidates = list(Candidate.objects.filter(status='active'))
             
-            if not candidates.exists():
+            if not candidates:
                 return Response({
                     'count': 0,
                     'matches': [],
@@ -520,19 +799,19 @@ class JobOfferViewSet(CSRFExemptMixin, viewsets.ModelViewSet):
                 }, status=status.HTTP_200_OK)
             
             # Match candidates
-            vector_matcher = VectorMatcher()
+            vector_matcher = VectorMatcher.get()
             matches = []
             errors = []
+            scored = []
+            
+            # Generate missing embeddings in one batch before matching
+            _backfill_candidate_embeddings(candidates, vector_matcher)
             
             for candidate in candidates:
                 try:
                     if not candidate.embedding:
-                        # Generate embedding if missing
-                        if candidate.cv_text:
-                            candidate.embedding = vector_matcher.generate_embedding(candidate.cv_text)
-                            candidate.save()
-                        else:
-                            continue
+                        # No CV text to embed
+                        continue
                     
                     # Calculate similarity
                     similarity = vector_matcher.calculate_similarity(
@@ -564,58 +843,61 @@ class JobOfferViewSet(CSRFExemptMixin, viewsets.ModelViewSet):
                     # Add overall (0-1) to detailed_scores for RAG
                     detailed_scores['overall_score'] = overall_percent / 100.0
                     
-                    # Create or update match
-                    match, created = Match.objects.get_or_create(
-                        candidate=candidate,
-                        job_offer=job_offer,
-                        defaults={
-                            'match_explanation': '',
-                            'overall_score': overall_percent,
-                            'technical_skill_score': detailed_scores.get('technical_skills', 0) * 100,
-                            'experience_score': detailed_scores.get('experience', 0) * 100,
-                            'education_score': detailed_scores.get('education', 0) * 100,
-                            'soft_skill_score': detailed_scores.get('soft_skills', 0) * 100,
-                        }
-                    )
-                    
-                    # Update match scores
-                    match.overall_score = overall_percent
-                    match.technical_skill_score = detailed_scores.get('technical_skills', 0) * 100
-                    match.experience_score = detailed_scores.get('experience', 0) * 100
-                    match.education_score = detailed_scores.get('education', 0) * 100
-                    match.soft_skill_score = detailed_scores.get('soft_skills', 0) * 100
+                    match_fields = {
+                        'overall_score': overall_percent,
+                        'technical_skill_score': detailed_scores.get('technical_skills', 0) * 100,
+                        'experience_score': detailed_scores.get('experience', 0) * 100,
+                        'education_score': detailed_scores.get('education', 0) * 100,
+                        'soft_skill_score': detailed_scores.get('soft_skills', 0) * 100,
+                    }
                     
                     # Generate explanation
                     try:
-                        rag_engine = RAGEngine()
+                        rag_engine = get_rag_engine()
                         explanation = rag_engine.explain_match(candidate_data, job_data, detailed_scores)
-                        match.match_explanation = explanation or 'Match analysis completed.'
+                        match_fields['match_explanation'] = explanation or 'Match analysis completed.'
                     except Exception as e:
-                        match.match_explanation = f'Match analysis: {similarity*100:.1f}% compatibility.'
+                        match_fields['match_explanation'] = f'Match analysis: {similarity*100:.1f}% compatibility.'
                     
                     # Extract strengths and gaps
                     try:
                         detailed_analysis = vector_matcher.generate_matching_explanation(
                             candidate_data, job_data, detailed_scores
                         )
-                        match.strengths = detailed_analysis.get('strengths', [])
-                        match.gaps = detailed_analysis.get('gaps', [])
-                        match.recommendations = detailed_analysis.get('recommendations', [])
+                        match_fields['strengths'] = detailed_analysis.get('strengths', [])
+                        match_fields['gaps'] = detailed_analysis.get('gaps', [])
+                        match_fields['recommendations'] = detailed_analysis.get('recommendations', [])
                     except Exception as e:
-                        match.strengths = []
-                        match.gaps = []
-                        match.recommendations = []
+                        match_fields['strengths'] = []
+                        match_fields['gaps'] = []
+                        match_fields['recommendations'] = []
                     
                     if request.user.is_authenticated:
-                        match.matched_by = request.user
-                    match.save()
+                        match_fields['matched_by'] = request.user
                     
-                    matches.append(MatchSerializer(match).data)
+                    scored.append((candidate, match_fields))
                     
                 except Exception as e:
                     errors.append(f"Error matching candidate {candidate.id}: {str(e)}")
                     continue
             
+            # Write all matches in one short transaction, after the slow scoring and
+            # explanation calls; each write gets its own savepoint so one failure
+            # does not break the others
+            with transaction.atomic():
+                for candidate, match_fields in scored:
+                    try:
+                        with transaction.atomic():
+                            # Create or update match (row is locked with SELECT ... FOR UPDATE)
+                            match, created = Match.objects.update_or_create(
+                                candidate=candidate,
+                                job_offer=job_offer,
+                                defaults=match_fields
+                            )
+                        matches.append(MatchSerializer(match).data)
+                    except Exception as e:
+                        errors.append(f"Error matching candidate {candidate.id}: {str(e)}")
+        
             # Sort by score
             matches.sort(key=lambda x: x['overall_score'], reverse=True)
             
@@ -642,149 +924,213 @@ class JobOfferViewSet(CSRFExemptMixin, viewsets.ModelViewSet):
             if not candidate_ids:
                 return Response({'error': 'No candidate IDs provided'}, status=status.HTTP_400_BAD_REQUEST)
             
-            # Get candidates
-            candidates = Candidate.objects.filter(id__in=candidate_ids, status='active')
-            if not candidates.exists():
+            # Optionally score only the top_k candidates by embedding similarity
+            top_k = request.data.get('top_k')
+            if top_k is not None:
+                try:
+                    top_k = int(top_k)
+                except (TypeError, ValueError):
+                    top_k = 0
+                if top_k <= 0:
+                    return Response({'error': 'top_k must be a positive integer'}, status=status.HTTP_400_BAD_REQUEST)
+            
+            # Get candidates in a single query, loading only the fields used for ranking;
+            # the required-skill overlap comes back as a column where the database can compute it
+            required_skills = job_offer.required_skills or []
+            candidates_qs = Candidate.objects.filter(id__in=candidate_ids, status='active').only(*RANKING_CANDIDATE_FIELDS)
+            skill_overlap = _skill_overlap('technical_skills', required_skills)
+            if skill_overlap is not None:
+                candidates_qs = candidates_qs.annotate(skills_matched=skill_overlap)
+            candidates = list(candidates_qs)
+            if not candidates:
                 return Response({'error': 'No valid active candidates found'}, status=status.HTTP_400_BAD_REQUEST)
             
-            # Ensure job offer has an embedding
-            if not job_offer.embedding:
-                vector_matcher = VectorMatcher()
+            # Ensure job offer has an int8-quantized embedding
+            job_embedding = job_offer.get_embedding_i8()
+            if not len(job_embedding):
+                vector_matcher = VectorMatcher.get()
                 job_text = f"{job_offer.description} {job_offer.requirements}"
-                job_offer.embedding = vector_matcher.generate_embedding(job_text)
-                job_offer.save()
+                job_offer.set_embedding(job_offer.embedding or vector_matcher.generate_embedding(job_text))
+                job_offer.save(update_fields=[*JobOffer.embedding_fields, 'updated_at'])
+                job_embedding = job_offer.get_embedding_i8()
             
             # Initialize services
-            vector_matcher = VectorMatcher()
-            rag_engine = RAGEngine()
+            vector_matcher = VectorMatcher.get()
+            rag_engine = get_rag_engine()
             
             ranked_candidates = []
             errors = []
             
+            # Validate embeddings up front so the scoring loop below never has to
+            # catch anything: backfill from the CV text where possible and report
+            # the remaining candidates once instead of failing them one by one
+            _backfill_candidate_embeddings(candidates, vector_matcher)
+            embedded_candidates = []
+            candidate_embeddings = []
             for candidate in candidates:
-                try:
-                    # Generate embedding if missing
-                    if not candidate.embedding and candidate.cv_text:
-                        candidate.embedding = vector_matcher.generate_embedding(candidate.cv_text)
-                        candidate.save()
-                    elif not candidate.embedding:
-                        continue
-                    
-                    # Calculate similarity
-                    similarity = vector_matcher.calculate_similarity(
-                        job_offer.embedding,
-                        candidate.embedding
+                embedding = candidate.get_embedding_i8()
+                if not len(embedding):
+                    errors.append(f"Error processing candidate {candidate.id}: no embedding (no CV text)")
+                elif len(embedding) != len(job_embedding):
+                    errors.append(
+                        f"Error processing candidate {candidate.id}: embedding dimension {len(embedding)} "
+                        f"does not match the job offer's {len(job_embedding)}"
                     )
+                else:
+                    embedded_candidates.append(candidate)
+                    candidate_embeddings.append(embedding)
+            
+            # Calculate all similarities in one int8 matrix-vector product,
+            # keeping the top_k in request order so score ties still rank by position
+            hits = sorted(vector_matcher.search_similar(job_embedding, candidate_embeddings, top_k))
+            embedded_candidates = [embedded_candidates[i] for i, _ in hits]
+            similarities = [similarity for _, similarity in hits]
+            
+            # Job data is the same for every candidate
+            job_data = {
+                'required_skills': required_skills,
+                'required_experience_years': job_offer.required_experience_years or 0,
+                'required_education': job_offer.required_education or '',
+                'required_soft_skills': request.data.get('required_soft_skills') or self._get_required_soft_skills(job_offer),
+            }
+            
+            # Everything job-side is resolved once for the whole request
+            job_context = vector_matcher.build_job_context(job_data, getattr(settings, 'MATCHING_WEIGHTS', None))
+            if skill_overlap is None:
+                required_skill_set = frozenset(required_skills)
+                for candidate in embedded_candidates:
+                    candidate.skills_matched = len(required_skill_set.intersection(candidate.technical_skills or []))
+            # Soft skills outside the known list get request-local bits, shared by job and candidates
+            soft_skill_bits = {}
+            job_soft_mask = soft_skill_mask(job_data['required_soft_skills'], soft_skill_bits)
+            
+            # Inputs for the batched explanation step
+            explanation_inputs = []
+            
+            for candidate, similarity in zip(embedded_candidates, similarities):
+                # Prepare data for detailed scoring
+                candidate_data = {
+                    'technical_skills': candidate.technical_skills or [],
+                    'experience_years': candidate.total_experience_years or 0,
+                    'education_level': candidate.education_level or '',
+                    'soft_skills': candidate.soft_skills or [],
+                }
+                
+                # Calculate detailed and overall scores against the prepared job context
+                detailed_scores = vector_matcher.score_against_context(candidate_data, job_context)
+                overall_percent = vector_matcher.overall_score_for_context(similarity, detailed_scores, job_context)
+                
+                # Add overall score to detailed_scores for RAG
+                detailed_scores['overall_score'] = overall_percent / 100.0
+                
+                # Generate strengths and gaps analysis
+                analysis = vector_matcher.generate_matching_explanation(
+                    candidate_data, job_data, detailed_scores
+                )
+                strengths = analysis.get('strengths', [])
+                gaps = analysis.get('gaps', [])
+                recommendations = analysis.get('recommendations', [])
+                
+                # Create comprehensive candidate profile
+                candidate_profile = {
+                    'candidate_id': candidate.id,
+                    'full_name': candidate.full_name or 'Unnamed Candidate',
+                    'email': candidate.email or 'No email',
+                    'current_position': candidate.current_position or 'Not specified',
+                    'total_experience_years': candidate.total_experience_years,
+                    'technical_skills': candidate.technical_skills or [],
+                    'soft_skills': candidate.soft_skills or [],
+                    'education_level': candidate.education_level or 'Not specified',
+                    'languages': candidate.languages or [],
+                    'certifications': candidate.certifications or [],
+                    'cv_text': candidate.cv_text or '',
+                    'professional_links': candidate.professional_links or {},
                     
-                    # Prepare data for detailed scoring
-                    candidate_data = {
-                        'technical_skills': candidate.technical_skills or [],
-                        'experience_years': candidate.total_experience_years or 0,
-                        'education_level': candidate.education_level or '',
-                        'soft_skills': candidate.soft_skills or [],
-                    }
-                    
-                    job_data = {
-                        'required_skills': job_offer.required_skills or [],
-                        'required_experience_years': job_offer.required_experience_years or 0,
-                        'required_education': job_offer.required_education or '',
-                        'required_soft_skills': request.data.get('required_soft_skills') or self._get_required_soft_skills(job_offer),
-                    }
-                    
-                    # Calculate detailed scores
-                    detailed_scores = vector_matcher.calculate_detailed_scores(candidate_data, job_data)
-                    
-                    # Get weights from settings
-                    weights = getattr(settings, 'MATCHING_WEIGHTS', None)
-                    overall_percent = vector_matcher.calculate_overall_score(similarity, detailed_scores, weights)
+                    # Scoring details
+                    'overall_score': round(overall_percent, 2),
+                    'similarity_score': round(similarity * 100, 2),
+                    'technical_skill_score': round(detailed_scores.get('technical_skills', 0) * 100, 2),
+                    'experience_score': round(detailed_scores.get('experience', 0) * 100, 2),
+                    'education_score': round(detailed_scores.get('education', 0) * 100, 2),
+                    'soft_skill_score': round(detailed_scores.get('soft_skills', 0) * 100, 2),
                     
-                    # Add overall score to detailed_scores for RAG
-                    detailed_scores['overall_score'] = overall_percent / 100.0
+                    # Analysis and explanations (explanation is filled in by the batch step below)
+                    'detailed_explanation': '',
+                    'strengths': strengths,
+                    'gaps': gaps,
+                    'recommendations': recommendations,
                     
-                    # Generate comprehensive explanation
-                    try:
-                        explanation = rag_engine.explain_match(candidate_data, job_data, detailed_scores)
-                    except Exception as e:
-                        explanation = f'Candidate analysis: {overall_percent:.1f}% compatibility.'
+                    # Match breakdown
+                    'skills_matched': candidate.skills_matched,
+                    'skills_total': len(job_data['required_skills']),
+                    'soft_skills_matched': (soft_skill_mask(candidate_data['soft_skills'], soft_skill_bits) & job_soft_mask).bit_count(),
+                    'soft_skills_total': len(job_data.get('required_soft_skills', [])),
                     
-                    # Generate strengths and gaps analysis
-                    try:
-                        analysis = vector_matcher.generate_matching_explanation(
-                            candidate_data, job_data, detailed_scores
+                    # Experience analysis
+                    'experience_meets_requirement': candidate_data['experience_years'] >= job_data['required_experience_years'],
+                    'experience_gap': max(0, job_data['required_experience_years'] - candidate_data['experience_years']),
+                }
+                
+                ranked_candidates.append(candidate_profile)
+                explanation_inputs.append((candidate_data, detailed_scores))
+            
+            # Reuse cached explanations and generate the rest in one batched call
+            cache_keys = [
+                rag_cache.make_key(
+                    'match_explanation', profile['candidate_id'], job_offer.id,
+                    {name: round(value, 4) for name, value in detailed_scores.items()}
+                )
+                for profile, (_, detailed_scores) in zip(ranked_candidates, explanation_inputs)
+            ]
+            explanations = [rag_cache.get(key) for key in cache_keys]
+            missing = [i for i, explanation in enumerate(explanations) if explanation is None]
+            if missing:
+                try:
+                    generated = rag_engine.explain_matches_batch(
+                        [explanation_inputs[i][0] for i in missing],
+                        job_data,
+                        [explanation_inputs[i][1] for i in missing]
+                    )
+                    for i, explanation in zip(missing, generated):
+                        explanations[i] = explanation
+                        rag_cache.put(
+                            cache_keys[i], explanation,
+                            candidate_id=ranked_candidates[i]['candidate_id'], job_offer_id=job_offer.id
                         )
-                        strengths = analysis.get('strengths', [])
-                        gaps = analysis.get('gaps', [])
-                        recommendations = analysis.get('recommendations', [])
-                    except Exception as e:
-                        strengths = []
-                        gaps = []
-                        recommendations = []
-                    
-                    # Create comprehensive candidate profile
-                    candidate_profile = {
-                        'candidate_id': candidate.id,
-                        'full_name': candidate.full_name or 'Unnamed Candidate',
-                        'email': candidate.email or 'No email',
-                        'current_position': candidate.current_position or 'Not specified',
-                        'total_experience_years': candidate.total_experience_years,
-                        'technical_skills': candidate.technical_skills or [],
-                        'soft_skills': candidate.soft_skills or [],
-                        'education_level': candidate.education_level or 'Not specified',
-                        'languages': candidate.languages or [],
-                        'certifications': candidate.certifications or [],
-                        'cv_text': candidate.cv_text or '',
-                        'professional_links': candidate.professional_links or {},
-                        
-                        # Scoring details
-                        'overall_score': round(overall_percent, 2),
-                        'similarity_score': round(similarity * 100, 2),
-                        'technical_skill_score': round(detailed_scores.get('technical_skills', 0) * 100, 2),
-                        'experience_score': round(detailed_scores.get('experience', 0) * 100, 2),
-                        'education_score': round(detailed_scores.get('education', 0) * 100, 2),
-                        'soft_skill_score': round(detailed_scores.get('soft_skills', 0) * 100, 2),
-                        
-                        # Analysis and explanations
-                        'detailed_explanation': explanation,
-                        'strengths': strengths,
-                        'gaps': gaps,
-                        'recommendations': recommendations,
-                        
-                        # Match breakdown
-                        'skills_matched': len(set(candidate_data['technical_skills']) & set(job_data['required_skills'])),
-                        'skills_total': len(job_data['required_skills']),
-                        'soft_skills_matched': len(set(candidate_data['soft_skills']) & set(job_data.get('required_soft_skills', []))),
-                        'soft_skills_total': len(job_data.get('required_soft_skills', [])),
-                        
-                        # Experience analysis
-                        'experience_meets_requirement': candidate_data['experience_years'] >= job_data['required_experience_years'],
-                        'experience_gap': max(0, job_data['required_experience_years'] - candidate_data['experience_years']),
-                    }
-                    
-                    ranked_candidates.append(candidate_profile)
-                    
                 except Exception as e:
-                    errors.append(f"Error processing candidate {candidate.id}: {str(e)}")
-                    continue
+                    for i in missing:
+                        explanations[i] = f"Candidate analysis: {ranked_candidates[i]['overall_score']:.1f}% compatibility."
+            for profile, explanation in zip(ranked_candidates, explanations):
+                profile['detailed_explanation'] = explanation
             
-            # Sort candidates by overall score (descending)
-            ranked_candidates.sort(key=lambda x: x['overall_score'], reverse=True)
+            # Sort candidates by overall score (descending, ties keep their order)
+            scores = np.fromiter(
+                (c['overall_score'] for c in ranked_candidates), dtype=np.float64, count=len(ranked_candidates)
+            )
+            order = np.argsort(-scores, kind='stable')
+            ranked_candidates = [ranked_candidates[i] for i in order]
+            scores = scores[order]
             
             # Add ranking positions
-            for i, candidate in enumerate(ranked_candidates, 1):
-                candidate['rank'] = i
-                candidate['percentile'] = round((i / len(ranked_candidates)) * 100, 1)
+            ranks = np.arange(1, len(ranked_candidates) + 1)
+            percentiles = np.round(ranks / max(len(ranks), 1) * 100, 1)
+            for candidate, rank, percentile in zip(ranked_candidates, ranks.tolist(), percentiles.tolist()):
+                candidate['rank'] = rank
+                candidate['percentile'] = percentile
             
-            # Generate summary statistics
+            # Generate summary statistics. The scores are already sorted, so the
+            # mean is the only full pass; median and threshold counts are lookups
             if ranked_candidates:
-                scores = [c['overall_score'] for c in ranked_candidates]
+                count = len(scores)
+                ascending = scores[::-1]
                 summary_stats = {
-                    'total_candidates': len(ranked_candidates),
-                    'average_score': round(sum(scores) / len(scores), 2),
+                    'total_candidates': count,
+                    'average_score': round(float(scores.mean()), 2),
                     'highest_score': ranked_candidates[0]['overall_score'],
                     'lowest_score': ranked_candidates[-1]['overall_score'],
-                    'median_score': round(sorted(scores)[len(scores) // 2], 2),
-                    'candidates_above_80': len([c for c in ranked_candidates if c['overall_score'] >= 80]),
-                    'candidates_above_60': len([c for c in ranked_candidates if c['overall_score'] >= 60]),
+                    'median_score': round(float(ascending[count // 2]), 2),
+                    'candidates_above_80': count - int(np.searchsorted(ascending, 80, side='left')),
+                    'candidates_above_60': count - int(np.searchsorted(ascending, 60, side='left')),
                 }
             else:
                 summary_stats = {}
@@ -815,6 +1161,14 @@ class MatchViewSet(viewsets.ModelViewSet):
     serializer_class = MatchSerializer
     permission_classes = [IsAuthenticated]
 
+    def get_queryset(self):
+        # Load candidate and job offer with each match instead of once per row,
+        # skipping the embedding columns none of these endpoints read
+        return Match.objects.select_related('candidate', 'job_offer').defer(
+            'candidate__embedding', 'candidate__embedding_blob', 'candidate__embedding_i8',
+            'job_offer__embedding', 'job_offer__embedding_blob', 'job_offer__embedding_i8',
+        )
+
     @action(detail=True, methods=['get'])
     def explanation(self, request, pk=None):
         """Get detailed explanation of a match"""
@@ -827,61 +1181,55 @@ class MatchViewSet(viewsets.ModelViewSet):
             'recommendations': match.recommendations,
         })
 
-    @action(detail=True, methods=['post'])
-    def generate_summary(self, request, pk=None):
-        """Generate executive summary for a match"""
-        match = self.get_object()
-        candidate_data = {
-            'full_name': match.candidate.full_name,
-            'technical_skills': match.candidate.technical_skills,
-            'experience_years': match.candidate.total_experience_years,
-            'current_position': match.candidate.current_position,
-            'education_level': match.candidate.education_level,
-            'soft_skills': match.candidate.soft_skills,
-        }
-        job_data = {
-            'title': match.job_offer.title,
-            'required_skills': match.job_offer.required_skills,
-            'required_experience_years': match.job_offer.required_experience_years,
-        }
-        rag_engine = RAGEngine()
-        summary = rag_engine.generate_candidate_summary(candidate_data, job_data)
-        GeneratedDocument.objects.create(
-            document_type='candidate_summary',
+    def _generate_document(self, match, document_type, cache_key, task, response_key):
+        """Serve a generated document from cache, or create it via a background task"""
+        content = rag_cache.get(cache_key)
+        document = GeneratedDocument.objects.create(
+            document_type=document_type,
             candidate=match.candidate,
             job_offer=match.job_offer,
             match=match,
-            content=summary,
-            generated_by=request.user
+            content=content or '',
+            status='ready' if content is not None else 'pending',
+            generated_by=self.request.user
         )
-        return Response({'summary': summary}, status=status.HTTP_200_OK)
+        if content is not None:
+            return Response({response_key: content}, status=status.HTTP_200_OK)
+        
+        task_id, content = run_task(task, document.id)
+        if task_id is None:
+            return Response({response_key: content}, status=status.HTTP_200_OK)
+        # Poll document_status until the document is ready
+        return Response({
+            'task_id': task_id,
+            'document_id': document.id,
+            'status': document.status,
+        }, status=status.HTTP_202_ACCEPTED)
+
+    @action(detail=True, methods=['post'])
+    def generate_summary(self, request, pk=None):
+        """Generate executive summary for a match"""
+        match = self.get_object()
+        cache_key = rag_cache.make_key('candidate_summary', match.candidate_id, match.job_offer_id)
+        return self._generate_document(match, 'candidate_summary', cache_key, generate_summary_task, 'summary')
 
     @action(detail=True, methods=['post'])
     def generate_email(self, request, pk=None):
         """Generate contact email for a candidate"""
         match = self.get_object()
-        candidate_data = {
-            'full_name': match.candidate.full_name,
-            'technical_skills': match.candidate.technical_skills,
-        }
-        job_data = {
-            'title': match.job_offer.title,
-        }
-        rag_engine = RAGEngine()
-        email_content = rag_engine.generate_email_content(
-            candidate_data,
-            job_data,
-            match.overall_score / 100
+        cache_key = rag_cache.make_key(
+            'contact_email', match.candidate_id, match.job_offer_id, round(match.overall_score, 1)
         )
-        GeneratedDocument.objects.create(
-            document_type='contact_email',
-            candidate=match.candidate,
-            job_offer=match.job_offer,
-            match=match,
-            content=email_content,
-            generated_by=request.user
-        )
-        return Response({'email_content': email_content}, status=status.HTTP_200_OK)
+        return self._generate_document(match, 'contact_email', cache_key, generate_email_task, 'email_content')
+
+    @action(detail=False, methods=['get'], url_path=r'documents/(?P<document_id>\d+)')
+    def document_status(self, request, document_id=None):
+        """Get a generated document and its generation status"""
+        try:
+            document = GeneratedDocument.objects.get(pk=document_id)
+        except GeneratedDocument.DoesNotExist:
+            return Response({'error': 'Document not found'}, status=status.HTTP_404_NOT_FOUND)
+        return Response(GeneratedDocumentSerializer(document).data, status=status.HTTP_200_OK)
 
 
 class ConversationViewSet(viewsets.ModelViewSet):
@@ -890,6 +1238,11 @@ class ConversationViewSet(viewsets.ModelViewSet):
     serializer_class = ConversationSerializer
     permission_classes = [IsAuthenticated]
     
+    def get_queryset(self):
+        return Conversation.objects.select_related('candidate').defer(
+            'candidate__embedding', 'candidate__embedding_blob', 'candidate__embedding_i8',
+        )
+    
     @action(detail=True, methods=['post'])
     def ask(self, request, pk=None):
         """Ask a question about a candidate in a conversation"""
@@ -904,32 +1257,35 @@ class ConversationViewSet(viewsets.ModelViewSet):
         if not candidate:
             return Response({'error': 'No candidate in conversation'}, status=status.HTTP_400_BAD_REQUEST)
         
-        candidate_data = {
-            'technical_skills': candidate.technical_skills,
-            'experience_years': candidate.total_experience_years,
-            'education_level': candidate.education_level,
-            'soft_skills': candidate.soft_skills,
-            'availability': candidate.availability,
-        }
-        
-        # Answer question using RAG
-        rag_engine = RAGEngine()
-        answer = rag_engine.answer_question(question, candidate_data)
-        
-        # Save messages
-        Message.objects.create(
-            conversation=conversation,
-            role='user',
-            content=question
-        )
-        
-        Message.objects.create(
-            conversation=conversation,
-            role='assistant',
-            content=answer
-        )
+        # Answer from cache, or let a background task answer using RAG
+        cache_key = rag_cache.make_key('answer', candidate.id, None, question.strip().lower())
+        answer = rag_cache.get(cache_key)
+        if answer is not None:
+            # Save the question and its answer in a single insert
+            Message.objects.bulk_create([
+                Message(conversation=conversation, role='user', content=question),
+                Message(conversation=conversation, role='assistant', content=answer),
+            ])
+        else:
+            # Save the question now so it is listed while the answer is pending
+            Message.objects.create(
+                conversation=conversation,
+                role='user',
+                content=question
+            )
+            task_id, answer = run_task(answer_question_task, conversation.id, question)
+            if task_id is not None:
+                # The answer is added to the conversation's messages when ready
+                return Response({'task_id': task_id, 'status': 'pending'}, status=status.HTTP_202_ACCEPTED)
         
         return Response({'answer': answer}, status=status.HTTP_200_OK)
+    
+    @action(detail=True, methods=['get'])
+    def messages(self, request, pk=None):
+        """Get the messages of a conversation, oldest first"""
+        conversation = self.get_object()
+        messages = conversation.messages.order_by('created_at', 'id')
+        return Response(MessageSerializer(messages, many=True).data, status=status.HTTP_200_OK)
 
 
 class CVViewSet(viewsets.ReadOnlyModelViewSet):
@@ -27,7 +27,7 @@ def test_cv_parsing():
             print(f"First 200 chars: {parsed_data['text'][:200]}...")
             
             # Extract structured data
-            nlp_extractor = NLPExtractor()
+            nlp_extractor = NLPExtractor.get(fast_mode=True)
             extracted_data = nlp_extractor.extract_cv_data(parsed_data['text'])
             
             print("\nSUCCESS: Data extracted successfully!")
@@ -37,7 +37,7 @@ def test_cv_parsing():
             print(f"Education: {extracted_data['education']}")
             
             # Generate embedding
-            vector_matcher = VectorMatcher()
+            vector_matcher = VectorMatcher.get()
             embedding = vector_matcher.generate_embedding(parsed_data['text'])
             
             print(f"\nSUCCESS: Embedding generated!")
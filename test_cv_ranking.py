@@ -12,8 +12,23 @@ sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'CV_match.settings')
 django.setup()
 
-from smartrecruitai.services import NLPExtractor, VectorMatcher, RAGEngine
-from smartrecruitai.models import Candidate, JobOffer
+from django.contrib.auth.models import User
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from rest_framework.test import APIClient
+
+from smartrecruitai.services import NLPExtractor, VectorMatcher
+from smartrecruitai.services.rag_engine import get_rag_engine
+from smartrecruitai.services.scoring_kernels import soft_skill_mask
+from smartrecruitai.models import Candidate, JobOffer, Match
+from smartrecruitai.views import RANKING_CANDIDATE_FIELDS
+
+# Maximum number of queries the ranking step may issue, regardless of candidate count
+RANKING_QUERY_BUDGET = 3
+
+# Maximum number of queries the match list endpoint may issue, regardless of match count
+MATCH_LIST_QUERY_BUDGET = 3
 
 def create_sample_data():
     """Create sample candidates and job offer for testing"""
@@ -108,8 +123,8 @@ def create_sample_data():
         )
         if created or not candidate.embedding:
             # Generate embedding
-            vector_matcher = VectorMatcher()
-            candidate.embedding = vector_matcher.generate_embedding(cand_data['cv_text'])
+            vector_matcher = VectorMatcher.get()
+            candidate.set_embedding(vector_matcher.generate_embedding(cand_data['cv_text']))
             candidate.save()
         created_candidates.append(candidate)
         print(f"✓ Created/Updated: {candidate.full_name}")
@@ -121,9 +136,9 @@ def create_sample_data():
     )
     if created or not job_offer.embedding:
         # Generate embedding
-        vector_matcher = VectorMatcher()
+        vector_matcher = VectorMatcher.get()
         job_text = f"{sample_job['description']} {sample_job['requirements']}"
-        job_offer.embedding = vector_matcher.generate_embedding(job_text)
+        job_offer.set_embedding(vector_matcher.generate_embedding(job_text))
         job_offer.save()
     
     print(f"✓ Created/Updated Job Offer: {job_offer.title}")
@@ -135,86 +150,106 @@ def demonstrate_ranking_api():
     print("\n🏆 Demonstrating CV Ranking API")
     print("=" * 40)
     
-    # Get sample data
-    candidates = list(Candidate.objects.all()[:3])
-    if len(candidates) < 3:
-        print("❌ Need at least 3 candidates for demonstration")
-        return
+    # Get sample data and rank, tracking every query issued along the way
+    with CaptureQueriesContext(connection) as queries:
+        candidates = list(Candidate.objects.only(*RANKING_CANDIDATE_FIELDS)[:3])
+        job_offer = JobOffer.objects.first()
+    
+        if len(candidates) < 3:
+            print("❌ Need at least 3 candidates for demonstration")
+            return
+    
+        if not job_offer:
+            print("❌ No job offer found")
+            return
     
-    job_offer = JobOffer.objects.first()
-    if not job_offer:
-        print("❌ No job offer found")
-        return
+        print(f"Job Offer: {job_offer.title}")
+        print(f"Candidates to rank: {[c.full_name for c in candidates]}")
     
-    print(f"Job Offer: {job_offer.title}")
-    print(f"Candidates to rank: {[c.full_name for c in candidates]}")
+        # Initialize services
+        vector_matcher = VectorMatcher.get()
+        rag_engine = get_rag_engine()
     
-    # Initialize services
-    vector_matcher = VectorMatcher()
-    rag_engine = RAGEngine()
+        # Required soft skills for the job
+        required_soft_skills = ['leadership', 'communication', 'teamwork', 'problem-solving']
     
-    # Required soft skills for the job
-    required_soft_skills = ['leadership', 'communication', 'teamwork', 'problem-solving']
+        print(f"\nRequired Soft Skills: {required_soft_skills}")
+        soft_skill_bits = {}
+        job_soft_mask = soft_skill_mask(required_soft_skills, soft_skill_bits)
     
-    print(f"\nRequired Soft Skills: {required_soft_skills}")
+        # Calculate all similarities in one batch
+        job_embedding = job_offer.get_embedding_i8()
+        embeddings = {c.id: c.get_embedding_i8() for c in candidates} if len(job_embedding) else {}
+        embeddings = {cid: emb for cid, emb in embeddings.items() if len(emb)}
+        similarities = dict(zip(
+            embeddings,
+            vector_matcher.calculate_quantized_similarities(job_embedding, list(embeddings.values()))
+        ))
     
-    # Simulate the ranking process
-    ranked_results = []
+        # Simulate the ranking process
+        ranked_results = []
+        explanation_inputs = []
     
-    for candidate in candidates:
-        print(f"\n--- Analyzing: {candidate.full_name} ---")
+        for candidate in candidates:
+            print(f"\n--- Analyzing: {candidate.full_name} ---")
         
-        # Calculate similarity
-        if candidate.embedding and job_offer.embedding:
-            similarity = vector_matcher.calculate_similarity(
-                job_offer.embedding, candidate.embedding
-            )
-        else:
-            similarity = 0.5  # Default similarity
+            similarity = similarities.get(candidate.id, 0.5)  # Default similarity
         
-        # Prepare data
-        candidate_data = {
-            'technical_skills': candidate.technical_skills or [],
-            'experience_years': candidate.total_experience_years or 0,
-            'education_level': candidate.education_level or '',
-            'soft_skills': candidate.soft_skills or [],
-        }
+            # Prepare data
+            candidate_data = {
+                'technical_skills': candidate.technical_skills or [],
+                'experience_years': candidate.total_experience_years or 0,
+                'education_level': candidate.education_level or '',
+                'soft_skills': candidate.soft_skills or [],
+            }
         
-        job_data = {
-            'required_skills': job_offer.required_skills or [],
-            'required_experience_years': job_offer.required_experience_years or 0,
-            'required_education': job_offer.required_education or '',
-            'required_soft_skills': required_soft_skills,
-        }
+            job_data = {
+                'required_skills': job_offer.required_skills or [],
+                'required_experience_years': job_offer.required_experience_years or 0,
+                'required_education': job_offer.required_education or '',
+                'required_soft_skills': required_soft_skills,
+            }
         
-        # Calculate detailed scores
-        detailed_scores = vector_matcher.calculate_detailed_scores(candidate_data, job_data)
+            # Calculate detailed scores
+            detailed_scores = vector_matcher.calculate_detailed_scores(candidate_data, job_data)
         
-        # Get weights and calculate overall score
-        from django.conf import settings
-        weights = getattr(settings, 'MATCHING_WEIGHTS', None)
-        overall_percent = vector_matcher.calculate_overall_score(similarity, detailed_scores, weights)
+            # Get weights and calculate overall score
+            from django.conf import settings
+            weights = getattr(settings, 'MATCHING_WEIGHTS', None)
+            overall_percent = vector_matcher.calculate_overall_score(similarity, detailed_scores, weights)
         
-        # Generate explanation
-        detailed_scores['overall_score'] = overall_percent / 100.0
-        explanation = rag_engine.explain_match(candidate_data, job_data, detailed_scores)
+            detailed_scores['overall_score'] = overall_percent / 100.0
+            explanation_inputs.append((candidate_data, detailed_scores))
         
-        # Create result
-        result = {
-            'candidate': candidate.full_name,
-            'overall_score': round(overall_percent, 2),
-            'technical_score': round(detailed_scores.get('technical_skills', 0) * 100, 2),
-            'soft_skill_score': round(detailed_scores.get('soft_skills', 0) * 100, 2),
-            'experience_score': round(detailed_scores.get('experience', 0) * 100, 2),
-            'education_score': round(detailed_scores.get('education', 0) * 100, 2),
-            'soft_skills_matched': len(set(candidate_data['soft_skills']) & set(required_soft_skills)),
-            'explanation': explanation[:150] + "..." if len(explanation) > 150 else explanation
-        }
+            # Create result
+            result = {
+                'candidate': candidate.full_name,
+                'overall_score': round(overall_percent, 2),
+                'technical_score': round(detailed_scores.get('technical_skills', 0) * 100, 2),
+                'soft_skill_score': round(detailed_scores.get('soft_skills', 0) * 100, 2),
+                'experience_score': round(detailed_scores.get('experience', 0) * 100, 2),
+                'education_score': round(detailed_scores.get('education', 0) * 100, 2),
+                'soft_skills_matched': (soft_skill_mask(candidate_data['soft_skills'], soft_skill_bits) & job_soft_mask).bit_count(),
+            }
         
-        ranked_results.append(result)
-        print(f"Overall Score: {result['overall_score']}%")
-        print(f"Technical: {result['technical_score']}% | Soft Skills: {result['soft_skill_score']}%")
-        print(f"Soft Skills Matched: {result['soft_skills_matched']}/{len(required_soft_skills)}")
+            ranked_results.append(result)
+            print(f"Overall Score: {result['overall_score']}%")
+            print(f"Technical: {result['technical_score']}% | Soft Skills: {result['soft_skill_score']}%")
+            print(f"Soft Skills Matched: {result['soft_skills_matched']}/{len(required_soft_skills)}")
+    
+    # Generate all explanations in one batched call
+    explanations = rag_engine.explain_matches_batch(
+        [candidate_data for candidate_data, _ in explanation_inputs],
+        job_data,
+        [detailed_scores for _, detailed_scores in explanation_inputs]
+    )
+    for result, explanation in zip(ranked_results, explanations):
+        result['explanation'] = explanation[:150] + "..." if len(explanation) > 150 else explanation
+    
+    print(f"\nQueries issued while ranking: {len(queries.captured_queries)}")
+    assert len(queries.captured_queries) <= RANKING_QUERY_BUDGET, (
+        f"Ranking issued {len(queries.captured_queries)} queries (budget: {RANKING_QUERY_BUDGET})"
+    )
     
     # Sort results
     ranked_results.sort(key=lambda x: x['overall_score'], reverse=True)
@@ -227,6 +262,25 @@ def demonstrate_ranking_api():
     
     return ranked_results
 
+def check_match_list_queries():
+    """Check that listing matches does not issue extra queries per match"""
+    print("\n🔍 Checking Match List Queries")
+    print("=" * 40)
+    
+    user, _ = User.objects.get_or_create(username='ranking_test_user')
+    client = APIClient(SERVER_NAME='localhost')
+    client.force_authenticate(user=user)
+    
+    with CaptureQueriesContext(connection) as queries:
+        response = client.get(reverse('match-list'))
+    
+    print(f"Matches listed: {len(response.data)} (total in database: {Match.objects.count()})")
+    print(f"Queries issued: {len(queries.captured_queries)}")
+    assert response.status_code == 200, f"Match list returned {response.status_code}"
+    assert len(queries.captured_queries) <= MATCH_LIST_QUERY_BUDGET, (
+        f"Match list issued {len(queries.captured_queries)} queries (budget: {MATCH_LIST_QUERY_BUDGET})"
+    )
+
 def show_template_usage():
     """Show how to use the new template"""
     print("\n🌐 Template Usage")
@@ -252,6 +306,9 @@ if __name__ == "__main__":
     # Demonstrate ranking
     results = demonstrate_ranking_api()
     
+    # Guard against N+1 queries on the match list
+    check_match_list_queries()
+    
     # Show template usage
     show_template_usage()
     
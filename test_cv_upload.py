@@ -5,6 +5,9 @@ Test script for CV upload functionality
 import requests
 import os
 
+# One session keeps the connection alive across uploads
+SESSION = requests.Session()
+
 def test_cv_upload():
     """Test CV upload with the actual PDF file"""
     
@@ -22,7 +25,7 @@ def test_cv_upload():
         
         try:
             # Make the request
-            response = requests.post(
+            response = SESSION.post(
                 'http://localhost:8000/api/candidates/upload_cv_direct/',
                 files=files,
                 timeout=30
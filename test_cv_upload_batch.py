@@ -0,0 +1,96 @@
+"""
+Test script for batch CV upload
+Uploads several CVs concurrently, with a bounded number in flight, over a single client connection pool
+"""
+
+import asyncio
+import mimetypes
+import os
+import sys
+import time
+
+import httpx
+
+try:
+    import h2  # noqa: F401
+    H2_AVAILABLE = True
+except ImportError:
+    H2_AVAILABLE = False
+
+# Django's dev server only speaks HTTP/1.1; point this at an HTTPS front end that terminates
+# HTTP/2 (e.g. nginx or hypercorn) to multiplex every upload over one connection (needs httpx[http2])
+BASE_URL = os.getenv('CV_UPLOAD_BASE_URL', 'http://localhost:8000')
+DEFAULT_CV_PATHS = ['cv.pdf', 'sample_cv.txt', 'sample_cv_alexander.txt', 'sample_cv_french.txt']
+# Uploads in flight at once; each one keeps a worker busy parsing and embedding the CV
+MAX_CONCURRENT_UPLOADS = 8
+# Fail fast when the server is unreachable, but let a slow upload run while data keeps flowing
+TIMEOUT = httpx.Timeout(60, connect=2)
+
+
+async def upload(client, path, semaphore):
+    """Upload one CV file and return (path, response, seconds)"""
+    content_type = mimetypes.guess_type(path)[0] or 'application/octet-stream'
+    async with semaphore:
+        started = time.perf_counter()
+        with open(path, 'rb') as f:
+            response = await client.post(
+                '/api/candidates/upload_cv_direct/',
+                files={'file': (os.path.basename(path), f, content_type)}
+            )
+        return path, response, time.perf_counter() - started
+
+
+async def upload_all(paths, max_concurrent=MAX_CONCURRENT_UPLOADS):
+    """Upload all CVs, at most max_concurrent at a time; with h2 installed they are multiplexed when the server supports HTTP/2"""
+    semaphore = asyncio.Semaphore(max_concurrent)
+    limits = httpx.Limits(max_connections=max_concurrent)
+    async with httpx.AsyncClient(base_url=BASE_URL, http2=H2_AVAILABLE, timeout=TIMEOUT, limits=limits) as client:
+        # Open the connection first, so on HTTP/2 every upload multiplexes over it instead
+        # of racing to open its own; if the server is down, the uploads report it
+        try:
+            await client.head('/api/health/')
+        except httpx.TransportError:
+            pass
+        return await asyncio.gather(*[upload(client, path, semaphore) for path in paths], return_exceptions=True)
+
+
+def test_cv_upload_batch(paths=None):
+    """Test concurrent upload of several CV files"""
+
+    paths = [path for path in (paths or DEFAULT_CV_PATHS) if os.path.exists(path)]
+    if not paths:
+        print("Error: no CV files found to upload")
+        return
+
+    print(f"Uploading {len(paths)} CVs, up to {MAX_CONCURRENT_UPLOADS} at a time...")
+
+    started = time.perf_counter()
+    results = asyncio.run(upload_all(paths))
+    total = time.perf_counter() - started
+
+    slowest = 0.0
+    http_versions = set()
+    for path, result in zip(paths, results):
+        if isinstance(result, httpx.ConnectError):
+            print(f"❌ {path}: Could not connect to server. Make sure Django server is running.")
+            continue
+        if isinstance(result, Exception):
+            print(f"❌ {path}: {str(result)}")
+            continue
+
+        _, response, elapsed = result
+        slowest = max(slowest, elapsed)
+        http_versions.add(response.http_version)
+        if response.status_code == 201:
+            data = response.json()
+            print(f"✅ {path}: candidate {data['candidate_id']} "
+                  f"({data['candidate']['full_name']}) in {elapsed:.2f}s [{response.http_version}]")
+        else:
+            print(f"❌ {path}: {response.status_code} {response.text[:200]}")
+
+    print(f"\nTotal time: {total:.2f}s (slowest single upload: {slowest:.2f}s)")
+    if http_versions:
+        print(f"Protocol: {', '.join(sorted(http_versions))}")
+
+if __name__ == "__main__":
+    test_cv_upload_batch(sys.argv[1:])
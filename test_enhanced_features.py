@@ -5,6 +5,7 @@ Test script for enhanced soft skills extraction and candidate ranking
 
 import os
 import sys
+
 import django
 
 # Setup Django
@@ -12,15 +13,18 @@ sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'CV_match.settings')
 django.setup()
 
-from smartrecruitai.services import NLPExtractor, VectorMatcher, RAGEngine
+from smartrecruitai.services import NLPExtractor, VectorMatcher
+from smartrecruitai.services.rag_engine import get_rag_engine
+from smartrecruitai.services.scoring_kernels import soft_skill_mask
 from smartrecruitai.models import Candidate, JobOffer
+from django.conf import settings
 
 def test_enhanced_soft_skills():
     """Test the enhanced soft skills extraction"""
     print("🧠 Testing Enhanced Soft Skills Extraction")
     print("=" * 50)
     
-    nlp_extractor = NLPExtractor()
+    nlp_extractor = NLPExtractor.get(fast_mode=True)
     
     # Test CV text with various soft skills
     test_cv_text = """
@@ -50,6 +54,80 @@ def test_enhanced_soft_skills():
     print(f"\n✅ Soft skills extraction enhanced from 12 to {len(soft_skills)}+ skills!")
     return soft_skills
 
+# Enhanced soft skills requirements for the job
+REQUIRED_SOFT_SKILLS = [
+    'leadership', 'communication', 'teamwork', 'problem-solving',
+    'critical thinking', 'time management', 'proactive'
+]
+
+# Explanations are only generated for the RAG_TOP_K best candidates scoring at least RAG_MIN_SCORE
+RAG_MIN_SCORE = float(os.getenv("RAG_MIN_SCORE", 40))
+RAG_TOP_K = 10
+
+def _job_data(job_offer):
+    """Job requirements used for scoring and explanations"""
+    return {
+        'required_skills': job_offer.required_skills or [],
+        'required_experience_years': job_offer.required_experience_years or 0,
+        'required_education': job_offer.required_education or '',
+        'required_soft_skills': REQUIRED_SOFT_SKILLS,
+    }
+
+def _score_candidate(candidate, job_offer, vector_matcher):
+    """
+    Score one candidate against a job offer
+    
+    Returns:
+        Tuple of (candidate profile, candidate data, detailed scores), the
+        profile's explanation still unset; None when the candidate has no embedding
+    """
+    candidate_embedding = candidate.get_embedding_i8()
+    if not len(candidate_embedding):
+        return None
+    
+    # Calculate similarity on the int8 embeddings
+    similarity = vector_matcher.calculate_quantized_similarities(
+        job_offer.get_embedding_i8(), [candidate_embedding]
+    )[0]
+    
+    # Prepare data
+    candidate_data = {
+        'technical_skills': candidate.technical_skills or [],
+        'experience_years': candidate.total_experience_years or 0,
+        'education_level': candidate.education_level or '',
+        'soft_skills': candidate.soft_skills or [],
+    }
+    
+    job_data = _job_data(job_offer)
+    
+    # Calculate detailed scores
+    detailed_scores = vector_matcher.calculate_detailed_scores(candidate_data, job_data)
+    
+    # Get weights and calculate overall score
+    weights = getattr(settings, 'MATCHING_WEIGHTS', None)
+    overall_percent = vector_matcher.calculate_overall_score(similarity, detailed_scores, weights)
+    
+    # Add overall score to detailed_scores for the explanation step
+    detailed_scores['overall_score'] = overall_percent / 100.0
+    
+    # Required soft skills as a bitmask, so the overlap is an AND + popcount
+    soft_skill_bits = {}
+    job_soft_mask = soft_skill_mask(REQUIRED_SOFT_SKILLS, soft_skill_bits)
+    
+    # Create candidate profile
+    profile = {
+        'name': candidate.full_name or 'Unnamed',
+        'overall_score': round(overall_percent, 2),
+        'technical_score': round(detailed_scores.get('technical_skills', 0) * 100, 2),
+        'experience_score': round(detailed_scores.get('experience', 0) * 100, 2),
+        'soft_skill_score': round(detailed_scores.get('soft_skills', 0) * 100, 2),
+        'education_score': round(detailed_scores.get('education', 0) * 100, 2),
+        'soft_skills': candidate.soft_skills or [],
+        'soft_skills_matched': (soft_skill_mask(candidate_data['soft_skills'], soft_skill_bits) & job_soft_mask).bit_count(),
+        'explanation': None,
+    }
+    return profile, candidate_data, detailed_scores
+
 def test_candidate_ranking():
     """Test candidate ranking with detailed scoring"""
     print("\n🏆 Testing Candidate Ranking System")
@@ -72,82 +150,55 @@ def test_candidate_ranking():
     print(f"Required Skills: {job_offer.required_skills or []}")
     print(f"Required Experience: {job_offer.required_experience_years} years")
     
-    # Initialize services
-    vector_matcher = VectorMatcher()
-    rag_engine = RAGEngine()
+    print(f"\nRequired Soft Skills: {REQUIRED_SOFT_SKILLS}")
     
-    # Enhanced soft skills requirements for the job
-    required_soft_skills = [
-        'leadership', 'communication', 'teamwork', 'problem-solving',
-        'critical thinking', 'time management', 'proactive'
-    ]
+    # Generate all missing embeddings in one batch and write them back together
+    vector_matcher = VectorMatcher.get()
+    candidates = list(candidates)
+    missing = [c for c in candidates if not len(c.get_embedding_i8()) and c.cv_text]
+    if missing:
+        embeddings = vector_matcher.generate_embeddings_batch([c.cv_text for c in missing])
+        for candidate, embedding in zip(missing, embeddings):
+            candidate.set_embedding(embedding)
+        Candidate.objects.bulk_update(missing, list(Candidate.embedding_fields))
+    
+    # Candidates are compared against the job's int8 embedding
+    if not len(job_offer.get_embedding_i8()):
+        job_text = f"{job_offer.description} {job_offer.requirements}"
+        job_offer.set_embedding(job_offer.embedding or vector_matcher.generate_embedding(job_text))
+        job_offer.save(update_fields=list(JobOffer.embedding_fields))
     
-    print(f"\nRequired Soft Skills: {required_soft_skills}")
+    # Score in this process with the already-loaded models; scoring a candidate is cheap
+    results = [_score_candidate(candidate, job_offer, vector_matcher) for candidate in candidates]
+    
+    # Explain only the best candidates above the cutoff, in one batched call
+    scored = sorted((result for result in results if result), key=lambda result: result[0]['overall_score'], reverse=True)
+    explained = [result for result in scored if result[0]['overall_score'] >= RAG_MIN_SCORE][:RAG_TOP_K]
+    explanations = get_rag_engine().explain_matches_batch(
+        [candidate_data for _, candidate_data, _ in explained],
+        _job_data(job_offer),
+        [detailed_scores for _, _, detailed_scores in explained]
+    ) if explained else []
+    for (profile, _, _), explanation in zip(explained, explanations):
+        profile['explanation'] = explanation[:200] + "..." if len(explanation) > 200 else explanation
     
     ranked_candidates = []
     
-    for candidate in candidates:
+    for candidate, result in zip(candidates, results):
         print(f"\n--- Analyzing: {candidate.full_name or 'Unnamed Candidate'} ---")
         
-        # Generate embedding if missing
-        if not candidate.embedding and candidate.cv_text:
-            candidate.embedding = vector_matcher.generate_embedding(candidate.cv_text)
-            candidate.save()
-        
-        if not candidate.embedding:
+        if result is None:
             print("❌ No CV text available for comparison")
             continue
         
-        # Calculate similarity
-        similarity = vector_matcher.calculate_similarity(
-            job_offer.embedding, candidate.embedding
-        )
-        
-        # Prepare data
-        candidate_data = {
-            'technical_skills': candidate.technical_skills or [],
-            'experience_years': candidate.total_experience_years or 0,
-            'education_level': candidate.education_level or '',
-            'soft_skills': candidate.soft_skills or [],
-        }
-        
-        job_data = {
-            'required_skills': job_offer.required_skills or [],
-            'required_experience_years': job_offer.required_experience_years or 0,
-            'required_education': job_offer.required_education or '',
-            'required_soft_skills': required_soft_skills,
-        }
-        
-        # Calculate detailed scores
-        detailed_scores = vector_matcher.calculate_detailed_scores(candidate_data, job_data)
-        
-        # Get weights and calculate overall score
-        from django.conf import settings
-        weights = getattr(settings, 'MATCHING_WEIGHTS', None)
-        overall_percent = vector_matcher.calculate_overall_score(similarity, detailed_scores, weights)
-        
-        # Generate explanation
-        detailed_scores['overall_score'] = overall_percent / 100.0
-        explanation = rag_engine.explain_match(candidate_data, job_data, detailed_scores)
-        
-        # Create candidate profile
-        candidate_profile = {
-            'name': candidate.full_name or 'Unnamed',
-            'overall_score': round(overall_percent, 2),
-            'technical_score': round(detailed_scores.get('technical_skills', 0) * 100, 2),
-            'experience_score': round(detailed_scores.get('experience', 0) * 100, 2),
-            'soft_skill_score': round(detailed_scores.get('soft_skills', 0) * 100, 2),
-            'education_score': round(detailed_scores.get('education', 0) * 100, 2),
-            'soft_skills': candidate.soft_skills or [],
-            'soft_skills_matched': len(set(candidate_data['soft_skills']) & set(required_soft_skills)),
-            'explanation': explanation[:200] + "..." if len(explanation) > 200 else explanation
-        }
-        
+        candidate_profile = result[0]
+        if candidate_profile['explanation'] is None:
+            candidate_profile['explanation'] = "(below threshold)"
         ranked_candidates.append(candidate_profile)
         
         print(f"Overall Score: {candidate_profile['overall_score']}%")
         print(f"Technical Skills: {candidate_profile['technical_score']}%")
-        print(f"Soft Skills: {candidate_profile['soft_skill_score']}% ({candidate_profile['soft_skills_matched']}/{len(required_soft_skills)} matched)")
+        print(f"Soft Skills: {candidate_profile['soft_skill_score']}% ({candidate_profile['soft_skills_matched']}/{len(REQUIRED_SOFT_SKILLS)} matched)")
         print(f"Experience: {candidate_profile['experience_score']}%")
         print(f"Education: {candidate_profile['education_score']}%")
     
@@ -174,6 +225,7 @@ def demonstrate_api_usage():
     print("""
 {
     "candidate_ids": [1, 2, 3, 4, 5],
+    "top_k": 3,
     "required_soft_skills": [
         "leadership", "communication", "teamwork", 
         "problem-solving", "critical thinking"
@@ -182,7 +234,7 @@ def demonstrate_api_usage():
     """)
     
     print("\nResponse includes:")
-    print("- Ranked candidates with detailed scores")
+    print("- Ranked candidates with detailed scores (only the top_k most similar, when given)")
     print("- Comprehensive explanations for each candidate")
     print("- Soft skills matching analysis")
     print("- Summary statistics")
@@ -28,6 +28,10 @@ def test_pdf_parsing():
             print(f"Text length: {len(parsed_data['text'])} characters")
             print(f"First 500 chars: {parsed_data['text'][:500]}...")
             
+            # Stream the same file page by page
+            page_lengths = [len(text) for text in cv_parser.parse_file_stream(cv_path)]
+            print(f"Streamed {len(page_lengths)} pages ({sum(page_lengths)} characters)")
+            
         except Exception as e:
             print(f"ERROR: {str(e)}")
             import traceback
@@ -2,9 +2,10 @@
 Test script to upload the actual PDF file and debug any issues
 """
 
-import requests
 import os
 
+import httpx
+
 def test_pdf_upload():
     """Test PDF upload with the actual cv.pdf file"""
     
@@ -18,17 +19,17 @@ def test_pdf_upload():
     print(f"File size: {os.path.getsize(cv_path)} bytes")
     
     try:
-        # Prepare the file upload
-        with open(cv_path, 'rb') as f:
+        # One client keeps the connection alive for the whole session,
+        # with an increased timeout for large files; the file is streamed in chunks
+        with httpx.Client(timeout=60) as client, open(cv_path, 'rb') as f:
             files = {'file': ('cv.pdf', f, 'application/pdf')}
             
             print("Sending request to Django server...")
             
             # Make the request
-            response = requests.post(
+            response = client.post(
                 'http://localhost:8000/api/candidates/upload_cv_direct/',
-                files=files,
-                timeout=60  # Increased timeout for large files
+                files=files
             )
             
             print(f"Response status: {response.status_code}")
@@ -47,7 +48,7 @@ def test_pdf_upload():
                 print("Response content:")
                 print(response.text)
                 
-    except requests.exceptions.ConnectionError:
+    except httpx.ConnectError:
         print("ERROR: Could not connect to server. Make sure Django server is running.")
     except Exception as e:
         print(f"ERROR: {str(e)}")
@@ -19,7 +19,7 @@ def test_professional_links_extraction():
     print("🔗 Testing Professional Links Extraction")
     print("=" * 50)
     
-    nlp_extractor = NLPExtractor()
+    nlp_extractor = NLPExtractor.get(fast_mode=True)
     
     # Test CV text with various link formats
     test_cv_texts = [
@@ -149,7 +149,7 @@ def test_url_validation():
     print("\n🔍 Testing URL Validation")
     print("=" * 50)
     
-    nlp_extractor = NLPExtractor()
+    nlp_extractor = NLPExtractor.get(fast_mode=True)
     
     test_urls = [
         # Valid URLs
@@ -183,7 +183,7 @@ def test_pattern_matching():
     print("\n🎯 Testing Pattern Matching")
     print("=" * 50)
     
-    nlp_extractor = NLPExtractor()
+    nlp_extractor = NLPExtractor.get(fast_mode=True)
     
     pattern_tests = [
         {
@@ -1,60 +1,279 @@
 """
 Test CV upload with the working text file
+Pass several CV paths to upload them in bundles, one multipart request per bundle,
+or --raw to send each CV as a raw request body; --quiet only reports failures
 """
 
 import requests
+import gzip
+import json
+import mimetypes
 import os
+import sys
+import traceback
+import uuid
+from contextlib import ExitStack
+from urllib.parse import quote
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
-def test_text_cv_upload():
-    """Test CV upload with the text file"""
+# One session per run: uploads reuse a kept-alive connection instead of reconnecting.
+# Only connection failures and gateway errors are retried; a read error may mean the
+# server already created the candidate, so that is not retried
+SESSION = requests.Session()
+SESSION.mount('http://', HTTPAdapter(
+    max_retries=Retry(
+        total=3, read=False, backoff_factor=0.2,
+        status_forcelist=[502, 503, 504], allowed_methods=['POST', 'PUT']
+    )
+))
+
+HEALTH_URL = 'http://localhost:8000/api/health/'
+RAW_URL = 'http://localhost:8000/api/candidates/upload_cv_raw/'
+CHUNK_URL = 'http://localhost:8000/api/candidates/upload_cv_chunk/'
+COMPLETE_URL = 'http://localhost:8000/api/candidates/complete_cv_upload/'
+
+CV_PATHS = ['sample_cv_alexander.txt']
+# Progress and candidate details are printed unless --quiet is passed; errors always are
+VERBOSE = True
+# Several CVs travel in one multipart request, up to these limits per request
+MAX_FILES_PER_REQUEST = 20
+MAX_BYTES_PER_REQUEST = 20 * 1024 * 1024
+# Files larger than this go up in parts of this size
+CHUNK_SIZE = 8 * 1024 * 1024
+# Text CVs are gzipped for raw uploads; level 3 compresses several-fold at a
+# fraction of the CPU cost of the default level 9
+GZIP_LEVEL = 3
+# (connect, read) timeouts: an unreachable server fails within seconds, while a
+# request is only abandoned once the server has been silent for the read timeout
+UPLOAD_TIMEOUT = (2, 60)
+CHUNK_TIMEOUT = (2, 30)
+
+
+def bundle_cv_paths(cv_paths, sizes):
+    """Group CV paths into bundles of at most MAX_FILES_PER_REQUEST files and MAX_BYTES_PER_REQUEST bytes"""
+    bundle, bundle_size = [], 0
+    for path in cv_paths:
+        size = sizes[path]
+        if bundle and (len(bundle) == MAX_FILES_PER_REQUEST or bundle_size + size > MAX_BYTES_PER_REQUEST):
+            yield bundle
+            bundle, bundle_size = [], 0
+        bundle.append(path)
+        bundle_size += size
+    if bundle:
+        yield bundle
+
+
+def print_candidate(data):
+    """Print the candidate created for one uploaded CV"""
+    print(f"Candidate ID: {data['candidate_id']}")
+    print(f"Name: {data['candidate']['full_name']}")
+    print(f"Email: {data['candidate']['email']}")
+    print(f"Experience: {data['candidate']['total_experience_years']} years")
+    print(f"Technical Skills: {', '.join(data['candidate']['technical_skills'][:10])}")
+    print(f"Soft Skills: {', '.join(data['candidate']['soft_skills'][:5])}")
+    print(f"Education: {data['candidate']['education_level']}")
+
+
+def upload_in_chunks(path, chunk_size=CHUNK_SIZE):
+    """
+    Upload one CV as parts, then have the server assemble it
+    
+    Args:
+        path: CV file to upload
+        chunk_size: Bytes per part
+        
+    Returns:
+        Response of the completion request (same as upload_cv_direct)
+    """
+    upload_id = uuid.uuid4().hex
+    total = os.path.getsize(path)
+    
+    with open(path, 'rb') as f:
+        for start in range(0, total, chunk_size):
+            part = f.read(chunk_size)
+            end = start + len(part) - 1
+            response = SESSION.put(
+                CHUNK_URL,
+                params={'upload_id': upload_id},
+                data=part,
+                headers={
+                    'Content-Range': f'bytes {start}-{end}/{total}',
+                    'Content-Type': 'application/octet-stream',
+                },
+                timeout=CHUNK_TIMEOUT
+            )
+            response.raise_for_status()
+            if VERBOSE:
+                print(f"Uploaded part {start}-{end}/{total}")
+    
+    return SESSION.post(
+        COMPLETE_URL,
+        json={'upload_id': upload_id, 'file_name': os.path.basename(path)},
+        timeout=UPLOAD_TIMEOUT
+    )
+
+
+def upload_cv_raw(path):
+    """
+    Upload one CV as the raw request body, bypassing multipart encoding
+    
+    Text CVs are sent gzipped ("Content-Encoding: gzip"); other files are
+    streamed from disk as they are.
+    
+    Args:
+        path: CV file to upload
+        
+    Returns:
+        Tuple of (status code, response body text)
+    """
+    headers = {
+        'Content-Type': 'application/octet-stream',
+        'X-Filename': quote(os.path.basename(path)),
+    }
+    with open(path, 'rb') as f:
+        if (mimetypes.guess_type(path)[0] or '').startswith('text/'):
+            body = gzip.compress(f.read(), compresslevel=GZIP_LEVEL)
+            headers['Content-Encoding'] = 'gzip'
+        else:
+            body = f
+        response = SESSION.post(RAW_URL, data=body, headers=headers, timeout=UPLOAD_TIMEOUT)
+    return response.status_code, response.text
+
+
+def print_upload_response(status_code, text, cv_count):
+    """Print the outcome of an upload request carrying cv_count CVs"""
+    if VERBOSE:
+        print(f"Response status: {status_code}")
+    
+    if status_code != 201:
+        print(f"ERROR: {status_code}")
+        print("Response content:")
+        print(text)
+        return
+    
+    # Quiet runs skip decoding unless the body may hold per-file errors
+    if not VERBOSE and cv_count == 1:
+        return
+    
+    data = json.loads(text)
+    if cv_count == 1:
+        print("SUCCESS: CV uploaded successfully!")
+        print_candidate(data)
+        return
+    
+    if VERBOSE:
+        print(f"SUCCESS: {data['message']}")
+        for result in data['results']:
+            print_candidate(result)
+    for error in data['errors']:
+        print(f"ERROR: {error['file_name']}: {error['error']}")
+
+
+def test_text_cv_upload(cv_paths=None, raw=False):
+    """Test CV upload with text files, sending several CVs per request (or one raw body each)"""
     
-    # Check if text CV exists
-    cv_path = "sample_cv_alexander.txt"
-    if not os.path.exists(cv_path):
-        print("ERROR: sample_cv_alexander.txt not found")
+    # Check that the text CVs exist, stating each one once for chunking and bundling below
+    cv_paths = cv_paths or CV_PATHS
+    sizes, missing = {}, []
+    for path in cv_paths:
+        try:
+            sizes[path] = os.path.getsize(path)
+        except OSError:
+            missing.append(path)
+    if missing:
+        print(f"ERROR: {', '.join(missing)} not found")
         return
     
-    print(f"Testing CV upload with {cv_path}...")
-    print(f"File size: {os.path.getsize(cv_path)} bytes")
+    # Open the session's connection (and wake the server) before the first upload;
+    # if the server is down, the uploads below report it
+    try:
+        SESSION.head(HEALTH_URL, timeout=(1, 2))
+    except requests.exceptions.RequestException:
+        pass
+    
+    # Large files go up in parts; the rest travel as raw bodies or in multipart bundles
+    for path in cv_paths:
+        if sizes[path] > CHUNK_SIZE:
+            upload_large_cv(path)
+    other_paths = [path for path in cv_paths if sizes[path] <= CHUNK_SIZE]
+    if raw:
+        for path in other_paths:
+            upload_raw_cv(path)
+    else:
+        for bundle in bundle_cv_paths(other_paths, sizes):
+            upload_bundle(bundle)
+
+
+def upload_large_cv(path):
+    """Upload one large CV in parts"""
+    
+    if VERBOSE:
+        print(f"Testing chunked CV upload with {path}...")
+        print(f"File size: {os.path.getsize(path)} bytes")
     
     try:
-        # Prepare the file upload
-        with open(cv_path, 'rb') as f:
-            files = {'file': ('sample_cv_alexander.txt', f, 'text/plain')}
+        response = upload_in_chunks(path)
+        print_upload_response(response.status_code, response.text, 1)
+    except requests.exceptions.ConnectionError:
+        print("ERROR: Could not connect to server. Make sure Django server is running.")
+    except Exception as e:
+        print(f"ERROR: {str(e)}")
+        traceback.print_exc()
+
+
+def upload_raw_cv(path):
+    """Upload one CV as a raw request body"""
+    
+    if VERBOSE:
+        print(f"Testing raw CV upload with {path}...")
+        print(f"File size: {os.path.getsize(path)} bytes")
+    
+    try:
+        print_upload_response(*upload_cv_raw(path), 1)
+    except requests.exceptions.ConnectionError:
+        print("ERROR: Could not connect to server. Make sure Django server is running.")
+    except Exception as e:
+        print(f"ERROR: {str(e)}")
+        traceback.print_exc()
+
+
+def upload_bundle(cv_paths):
+    """Upload a bundle of CVs in one multipart request under repeated 'file' fields"""
+    
+    if VERBOSE:
+        print(f"Testing CV upload with {', '.join(cv_paths)}...")
+        print(f"File size: {sum(os.path.getsize(path) for path in cv_paths)} bytes")
+    
+    try:
+        with ExitStack() as stack:
+            # Prepare the file upload
+            files = [
+                ('file', (os.path.basename(path), stack.enter_context(open(path, 'rb')), 'text/plain'))
+                for path in cv_paths
+            ]
             
-            print("Sending request to Django server...")
+            if VERBOSE:
+                print("Sending request to Django server...")
             
             # Make the request
-            response = requests.post(
+            response = SESSION.post(
                 'http://localhost:8000/api/candidates/upload_cv_direct/',
                 files=files,
-                timeout=30
+                timeout=UPLOAD_TIMEOUT
             )
             
-            print(f"Response status: {response.status_code}")
-            
-            if response.status_code == 201:
-                data = response.json()
-                print("SUCCESS: CV uploaded successfully!")
-                print(f"Candidate ID: {data['candidate_id']}")
-                print(f"Name: {data['candidate']['full_name']}")
-                print(f"Email: {data['candidate']['email']}")
-                print(f"Experience: {data['candidate']['total_experience_years']} years")
-                print(f"Technical Skills: {', '.join(data['candidate']['technical_skills'][:10])}")
-                print(f"Soft Skills: {', '.join(data['candidate']['soft_skills'][:5])}")
-                print(f"Education: {data['candidate']['education_level']}")
-            else:
-                print(f"ERROR: {response.status_code}")
-                print("Response content:")
-                print(response.text)
+            print_upload_response(response.status_code, response.text, len(cv_paths))
                 
     except requests.exceptions.ConnectionError:
         print("ERROR: Could not connect to server. Make sure Django server is running.")
     except Exception as e:
         print(f"ERROR: {str(e)}")
-        import traceback
         traceback.print_exc()
 
 if __name__ == "__main__":
-    test_text_cv_upload()
-
+    # --raw sends each CV as a raw body to upload_cv_raw instead of multipart bundles;
+    # --quiet only reports failures
+    args = sys.argv[1:]
+    VERBOSE = '--quiet' not in args
+    test_text_cv_upload([arg for arg in args if not arg.startswith('--')], raw='--raw' in args)